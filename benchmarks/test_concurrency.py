@@ -0,0 +1,28 @@
+"""Wall-clock time of repository detail fetches against concurrency level."""
+
+import asyncio
+
+import pytest
+
+from tests.fake_github import FakeGitHub
+from trending_repos.github_client import GitHubClient
+
+
+# Simulated round-trip time of every request
+LATENCY = 0.02
+
+
+@pytest.mark.parametrize("concurrency", [1, 2, 5, 10, 25])
+def test_detail_fetch_concurrency(benchmark, concurrency):
+    fake = FakeGitHub(repos_per_page=25, latency=LATENCY)
+
+    async def run():
+        async with GitHubClient(max_concurrency=concurrency, transport=fake.transport(), depth=25) as client:
+            return await client.fetch_trending_repos()
+
+    benchmark.group = "detail fetch concurrency"
+    benchmark.extra_info["latency_seconds"] = LATENCY
+    repos = benchmark.pedantic(lambda: asyncio.run(run()), rounds=3)
+
+    # Concurrency must not change the trending order
+    assert [repo.full_name for repo in repos] == fake.names("")
@@ -0,0 +1,68 @@
+"""Delivery time for thousands of subscribers against a batch endpoint with latency."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from trending_repos.delivery import DeliveryPipeline, Subscriber
+from trending_repos.email_sender import EmailSender
+from trending_repos.models import Repo
+from trending_repos.renderer import DigestRenderer
+from trending_repos.summarizer import RepoSummarizer
+
+
+# Simulated round-trip time of every batch request
+LATENCY = 0.05
+
+SUBSCRIBERS = 5000
+LISTS = [(language, period) for language in ("", "python", "rust", "go", "typescript") for period in ("daily", "weekly")]
+
+
+class StubEndpointSender(EmailSender):
+    """Posts batches to a stub of the Resend batch endpoint instead of the SDK."""
+
+    def __init__(self):
+        self.renderer = DigestRenderer()
+        self.requests = 0
+
+    async def send_batch(self, emails):
+        self.requests += 1
+        async with httpx.AsyncClient(transport=httpx.MockTransport(self.handle)) as client:
+            response = await client.post("https://api.resend.com/emails/batch", json=emails)
+        response.raise_for_status()
+        return [item["id"] for item in response.json()["data"]]
+
+    async def handle(self, request):
+        await asyncio.sleep(LATENCY)
+        emails = json.loads(request.content)
+        return httpx.Response(200, json={"data": [{"id": f"id-{email['to'][0]}"} for email in emails]})
+
+
+def make_summaries():
+    summarizer = RepoSummarizer()
+    summaries = {}
+    for language, period in LISTS:
+        repos = [Repo(f"owner{i}/{language or 'all'}-{i}", stars=10_000 - i * 100, language="Python") for i in range(25)]
+        summary = summarizer.create_summary(repos, label=f"{language or 'all'} / {period}")
+        summary["date"] = "2025-01-01"
+        summaries[(language, period)] = summary
+    return summaries
+
+
+@pytest.mark.parametrize("concurrency", [1, 4, 16])
+def test_deliver_to_subscribers(benchmark, concurrency):
+    summaries = make_summaries()
+    subscribers = [Subscriber(f"user{i}@example.com", *LISTS[i % len(LISTS)]) for i in range(SUBSCRIBERS)]
+    sender = StubEndpointSender()
+    pipeline = DeliveryPipeline(sender, "bot@example.com", max_concurrency=concurrency)
+
+    benchmark.group = "deliver to subscribers"
+    benchmark.extra_info["subscribers"] = SUBSCRIBERS
+    benchmark.extra_info["latency_seconds"] = LATENCY
+    results = benchmark.pedantic(lambda: asyncio.run(pipeline.deliver(subscribers, summaries)), rounds=3)
+
+    assert all(result.success for result in results)
+    # 500 subscribers per list go out in 5 full batches
+    assert sender.requests == 3 * len(LISTS) * 5
@@ -0,0 +1,89 @@
+"""Memory held by repository records, slotted and interned against a plain dataclass."""
+
+import json
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import pytest
+
+from tests.fake_github import FakeGitHub
+from trending_repos.models import Enrichment, Repo
+
+
+@dataclass
+class UnslottedRepo:
+    """Repo's fields in a plain dataclass with a __dict__ and no string interning."""
+
+    full_name: str
+    name: str = ""
+    description: Optional[str] = None
+    language: Optional[str] = None
+    stars: int = 0
+    forks: int = 0
+    stars_today: int = 0
+    url: str = ""
+    created_at: str = ""
+    updated_at: str = ""
+    pushed_at: str = ""
+    topics: Tuple[str, ...] = ()
+    license: str = ""
+    owner_login: str = ""
+    owner_avatar_url: str = ""
+    enrichment: Optional[Enrichment] = None
+    source: str = "trending"
+
+
+def payloads(count):
+    """REST payloads as JSON lines, so every record gets freshly decoded strings like a real response."""
+    fake = FakeGitHub()
+    return [json.dumps(fake.rest_payload(f"owner{i}/python-{i}")) for i in range(count)]
+
+
+def build(model, lines):
+    records = []
+    for line in lines:
+        data = json.loads(line)
+        records.append(model(
+            full_name=data["full_name"],
+            name=data["name"],
+            description=data["description"],
+            language=data["language"],
+            stars=data["stargazers_count"],
+            forks=data["forks_count"],
+            url=data["html_url"],
+            created_at=data["created_at"],
+            updated_at=data["updated_at"],
+            pushed_at=data["pushed_at"],
+            topics=tuple(data["topics"]),
+            license=(data["license"] or {}).get("name", ""),
+            owner_login=data["owner"]["login"],
+            owner_avatar_url=data["owner"]["avatar_url"],
+        ))
+    return records
+
+
+def retained_bytes(model, lines):
+    """Bytes still allocated once the records are built and the decoded payloads are gone."""
+    tracemalloc.start()
+    records = build(model, lines)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(records) == len(lines)
+    return current
+
+
+@pytest.mark.parametrize("count", [10_000, 100_000])
+@pytest.mark.parametrize("model", [Repo, UnslottedRepo], ids=["slotted", "unslotted"])
+def test_record_memory(benchmark, model, count):
+    lines = payloads(count)
+    retained = retained_bytes(model, lines)
+
+    benchmark.group = f"repo records: {count:,}"
+    benchmark.extra_info["records"] = count
+    benchmark.extra_info["retained_bytes"] = retained
+    benchmark.extra_info["bytes_per_record"] = round(retained / count)
+    benchmark.pedantic(build, args=(model, lines), rounds=3)
+
+    if model is Repo:
+        assert retained < retained_bytes(UnslottedRepo, lines)
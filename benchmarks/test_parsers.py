@@ -0,0 +1,70 @@
+"""Time and peak memory of the trending page parsers over saved pages.
+
+Pages come from fixtures written by --record: set BENCHMARK_FIXTURES to a
+recorded directory to use real github.com pages, otherwise pages of the fake
+GitHub, padded to the size of the real page, are recorded first.
+"""
+
+import asyncio
+import glob
+import json
+import os
+import tracemalloc
+
+import httpx
+import pytest
+
+from tests.fake_github import FakeGitHub
+from trending_repos.parsers import get_parser
+from trending_repos.transports import RecordingTransport
+
+
+# Bytes of navigation markup before the repository list, close to the real page
+PAGE_PADDING = 100_000
+
+
+@pytest.fixture(scope="module")
+def pages(tmp_path_factory):
+    directory = os.environ.get("BENCHMARK_FIXTURES")
+    if not directory:
+        directory = str(tmp_path_factory.mktemp("fixtures"))
+        transport = RecordingTransport(directory, transport=FakeGitHub(padding=PAGE_PADDING).transport())
+
+        async def record():
+            async with httpx.AsyncClient(transport=transport) as client:
+                for language in ("", "python", "rust"):
+                    await client.get(f"https://github.com/trending/{language}", params={"since": "daily"})
+
+        asyncio.run(record())
+
+    saved = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.json"))):
+        with open(path, encoding="utf-8") as f:
+            fixture = json.load(f)
+        if httpx.URL(fixture["url"]).path.startswith("/trending") and "body" in fixture:
+            saved.append(fixture["body"])
+    if not saved:
+        pytest.skip(f"no recorded trending pages in {directory}")
+    return saved
+
+
+def parse_all(parser, pages, limit):
+    return [parser.parse(html, limit) for html in pages]
+
+
+@pytest.mark.parametrize("limit", [10, 25])
+@pytest.mark.parametrize("name", ["soup", "streaming"])
+def test_parse_trending_pages(benchmark, pages, name, limit):
+    parser = get_parser(name)
+
+    tracemalloc.start()
+    parse_all(parser, pages, limit)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    benchmark.group = f"parse trending pages, limit {limit}"
+    benchmark.extra_info["pages"] = len(pages)
+    benchmark.extra_info["peak_memory_bytes"] = peak
+    results = benchmark(parse_all, parser, pages, limit)
+
+    assert all(0 < len(repos) <= limit for repos in results)
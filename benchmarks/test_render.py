@@ -0,0 +1,39 @@
+"""Render time and memory of HTML and text digests by digest size."""
+
+import tracemalloc
+
+import pytest
+
+from tests.fake_github import FakeGitHub
+from trending_repos.github_client import GitHubClient
+from trending_repos.renderer import DigestRenderer
+from trending_repos.summarizer import RepoSummarizer
+
+
+def make_repos(count):
+    fake = FakeGitHub(repos_per_page=count)
+    client = GitHubClient()
+    return [client._parse_repo_data(fake.rest_payload(name)) for name in fake.names("python")]
+
+
+def render(renderer, summary):
+    return renderer.render_html(summary), renderer.render_text(summary)
+
+
+@pytest.mark.parametrize("count", [10, 100, 1000])
+def test_render_digest(benchmark, count):
+    renderer = DigestRenderer()
+    summary = RepoSummarizer().create_summary(make_repos(count), label="python / daily")
+
+    tracemalloc.start()
+    html, text = render(renderer, summary)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    benchmark.group = "render digest"
+    benchmark.extra_info["repos"] = count
+    benchmark.extra_info["peak_memory_bytes"] = peak
+    benchmark.extra_info["output_bytes"] = len(html.encode()) + len(text.encode())
+    benchmark(render, renderer, summary)
+
+    assert html.count("owner") >= count
@@ -0,0 +1,68 @@
+"""End-to-end main() runs replayed from recorded fixtures."""
+
+import asyncio
+
+import pytest
+
+from tests.fake_github import FakeGitHub
+from trending_repos import main as app
+from trending_repos.config import Config
+from trending_repos.metrics import metrics
+from trending_repos.transports import RecordingTransport
+
+
+# Simulated round-trip time of every replayed request
+LATENCY = 0.01
+
+SCENARIOS = {
+    "single list": ("python", "daily"),
+    "sweep 3x3": ("all,python,rust", "daily,weekly,monthly"),
+}
+
+
+def configure(monkeypatch, languages, periods, **settings):
+    """Pin every setting main() reads, so the environment can't change the run."""
+    defaults = {
+        "RECIPIENT_EMAIL": "me@example.com",
+        "SUBSCRIBERS_FILE": "",
+        "TRENDING_LANGUAGES": languages,
+        "TRENDING_PERIODS": periods,
+        "GITHUB_TOKEN": None,
+        "GITHUB_BACKEND": "rest",
+        "TRENDING_DEPTH": 25,
+        "SEARCH_DEPTH": 0,
+        "SHARD_WORKERS": 0,
+        "ENRICHMENT": False,
+        "CACHE_PATH": "",
+        "HISTORY_PATH": "",
+        "SEEN_PATH": "",
+        "OUTPUT_DIR": "",
+    }
+    for name, value in {**defaults, **settings}.items():
+        monkeypatch.setattr(Config, name, value)
+
+
+def record(monkeypatch, directory, fake):
+    """Run main() once against the fake GitHub, saving every response to directory."""
+    with monkeypatch.context() as patch:
+        patch.setattr(app, "create_transport", lambda *args: RecordingTransport(str(directory), transport=fake.transport()))
+        asyncio.run(app.main(dry_run_dir=str(directory.parent / "recorded-out"), record_dir=str(directory)))
+
+
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_replayed_main(benchmark, monkeypatch, tmp_path, scenario):
+    configure(monkeypatch, *SCENARIOS[scenario])
+    fixtures = tmp_path / "fixtures"
+    record(monkeypatch, fixtures, FakeGitHub())
+
+    def run():
+        metrics.reset()
+        asyncio.run(app.main(dry_run_dir=str(tmp_path / "out"), replay_dir=str(fixtures), latency=LATENCY))
+
+    benchmark.group = "replayed main()"
+    benchmark.extra_info["latency_seconds"] = LATENCY
+    benchmark.extra_info["fixtures"] = len(list(fixtures.iterdir()))
+    benchmark.pedantic(run, rounds=3)
+
+    assert metrics.counters.get("replay.missing", 0) == 0
+    assert metrics.counters["http.requests"] == benchmark.extra_info["fixtures"]
@@ -0,0 +1,37 @@
+"""Scoring time, pure Python against NumPy, by candidate count."""
+
+import random
+
+import pytest
+
+from trending_repos import scoring
+from trending_repos.models import Repo
+
+
+def make_repos(count):
+    rng = random.Random(count)
+    return [
+        Repo(
+            f"owner{i}/repo-{i}",
+            stars=rng.randint(10, 200_000),
+            forks=rng.randint(0, 20_000),
+            stars_today=rng.randint(0, 5_000),
+            created_at=f"20{rng.randint(10, 25)}-{rng.randint(1, 12):02d}-01T00:00:00Z",
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("count", [1_000, 20_000])
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_score_repos(benchmark, monkeypatch, backend, count):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(scoring, "NUMPY_AVAILABLE", backend == "numpy")
+    repos = make_repos(count)
+    days_trending = [i % 7 for i in range(count)]
+
+    benchmark.group = f"score {count} repos"
+    scores = benchmark(scoring.score_repos, repos, days_trending, "weekly")
+
+    assert len(scores) == count
@@ -0,0 +1,29 @@
+"""Seen-index lookup time as the number of stored (recipient, repo) pairs grows."""
+
+import pytest
+
+from trending_repos.seen import SeenIndex
+
+
+REPOS_PER_RECIPIENT = 100
+
+# One digest's lookup: its recipients against its repositories
+LOOKUP_RECIPIENTS = 100
+LOOKUP_REPOS = 25
+
+
+@pytest.mark.parametrize("pairs", [10_000, 1_000_000])
+def test_seen_lookup(benchmark, tmp_path, pairs):
+    index = SeenIndex(str(tmp_path / "seen.db"))
+    recipients = [f"user{i}@example.com" for i in range(pairs // REPOS_PER_RECIPIENT)]
+    repo_keys = [f"owner{i}/repo-{i}" for i in range(REPOS_PER_RECIPIENT)]
+    index.mark_sent(recipients, repo_keys, "2025-01-01")
+
+    benchmark.group = "seen lookup"
+    benchmark.extra_info["stored_pairs"] = pairs
+    benchmark.extra_info["looked_up_pairs"] = LOOKUP_RECIPIENTS * LOOKUP_REPOS
+    seen = benchmark(index.seen, recipients[:LOOKUP_RECIPIENTS], repo_keys[:LOOKUP_REPOS], "2025-01-02")
+
+    # Each probe walks the (recipient, repo) primary key, so time should barely grow with pairs
+    assert len(seen) == LOOKUP_RECIPIENTS
+    index.close()
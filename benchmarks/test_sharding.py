@@ -0,0 +1,53 @@
+"""Wall-clock time of a large replayed sweep by number of worker processes."""
+
+import asyncio
+import os
+
+import pytest
+
+from benchmarks.test_replay import configure, record
+from tests.fake_github import FakeGitHub
+from trending_repos import main as app
+from trending_repos.metrics import metrics
+
+
+LANGUAGES = "all,python,rust,go,typescript,java,c++,kotlin"
+PERIODS = "daily,weekly,monthly"
+
+# Bytes of markup on each trending page, so parsing costs what it does on the real page
+PAGE_PADDING = 200_000
+
+
+@pytest.fixture(scope="module")
+def fixtures(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("sweep") / "fixtures"
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        configure(monkeypatch, LANGUAGES, PERIODS)
+        record(monkeypatch, directory, FakeGitHub(padding=PAGE_PADDING))
+    return directory
+
+
+@pytest.mark.parametrize("workers", [1, 2, 4])
+def test_sharded_sweep(benchmark, monkeypatch, tmp_path, fixtures, workers):
+    cpus = os.cpu_count() or 1
+    if workers > cpus:
+        pytest.skip(f"{workers} workers can't scale on {cpus} CPU(s)")
+    configure(monkeypatch, LANGUAGES, PERIODS, SHARD_WORKERS=workers)
+    # Worker processes are spawned and read their settings from the environment
+    for name, value in {
+        "GH_TOKEN": "", "GITHUB_TOKEN": "", "GITHUB_BACKEND": "rest", "TRENDING_PARSER": "streaming",
+        "TRENDING_DEPTH": "25", "SEARCH_DEPTH": "0", "CACHE_PATH": "",
+    }.items():
+        monkeypatch.setenv(name, value)
+
+    def run():
+        metrics.reset()
+        asyncio.run(app.main(dry_run_dir=str(tmp_path / "out"), replay_dir=str(fixtures)))
+
+    benchmark.group = "sharded sweep"
+    benchmark.extra_info["lists"] = len(LANGUAGES.split(",")) * len(PERIODS.split(","))
+    benchmark.extra_info["cpus"] = cpus
+    benchmark.pedantic(run, rounds=3)
+
+    assert metrics.counters.get("replay.missing", 0) == 0
+    assert metrics.counters["http.requests"] == len(list(fixtures.iterdir()))
@@ -0,0 +1,281 @@
+"""HTTP response caching with ETag revalidation."""
+
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from .metrics import metrics
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body and the validator needed to revalidate it."""
+    
+    etag: Optional[str]
+    body: bytes
+    stored_at: float
+
+
+class ResponseCache:
+    """Base class for response caches used by GitHubClient.
+    
+    Subclasses implement storage through _load, _store and _refresh; the
+    base class owns freshness checks and the hit/miss/byte counters.
+    """
+    
+    def __init__(self, ttl: float = 3600):
+        """Initialize the cache.
+        
+        Args:
+            ttl: Seconds an entry is served without revalidation
+        """
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.bytes_saved = 0
+        self.bytes_downloaded = 0
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Look up a cached entry.
+        
+        Args:
+            key: Cache key, usually the request URL
+        
+        Returns:
+            The cached entry (fresh or stale) or None if not cached
+        """
+        return self._load(key)
+    
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Check whether an entry can be served without revalidation.
+        
+        Args:
+            entry: Cached entry
+        
+        Returns:
+            True if the entry is younger than the TTL
+        """
+        return time.time() - entry.stored_at < self.ttl
+    
+    def record_hit(self, entry: CacheEntry, revalidated: bool = False) -> None:
+        """Count a response served from the cache.
+        
+        Args:
+            entry: Entry that was served
+            revalidated: True if the server confirmed it with a 304
+        """
+        self.hits += 1
+        self.bytes_saved += len(entry.body)
+        metrics.incr("cache.hits")
+        metrics.incr("cache.bytes_saved", len(entry.body))
+        if revalidated:
+            self.revalidations += 1
+            metrics.incr("cache.revalidations")
+    
+    def store(self, key: str, etag: Optional[str], body: bytes) -> None:
+        """Store a freshly downloaded response and count the miss.
+        
+        Args:
+            key: Cache key, usually the request URL
+            etag: ETag header of the response, if any
+            body: Raw response body
+        """
+        self.misses += 1
+        self.bytes_downloaded += len(body)
+        metrics.incr("cache.misses")
+        self.put(key, body, etag)
+    
+    def put(self, key: str, body: bytes, etag: Optional[str] = None) -> None:
+        """Store an entry without counting it as an HTTP response.
+        
+        For results derived from responses, such as enrichments, whose
+        callers keep their own counters.
+        
+        Args:
+            key: Cache key, namespaced so it can't collide with a URL
+            body: Value to store
+            etag: ETag to revalidate the entry with, if any
+        """
+        self._store(key, CacheEntry(etag=etag, body=body, stored_at=time.time()))
+    
+    def refresh(self, key: str) -> None:
+        """Mark an entry as fresh again after a 304 Not Modified.
+        
+        Args:
+            key: Cache key of the revalidated entry
+        """
+        self._refresh(key, time.time())
+    
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Counters describing how much the cache has saved."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "bytes_saved": self.bytes_saved,
+            "bytes_downloaded": self.bytes_downloaded,
+        }
+    
+    def close(self) -> None:
+        """Release any resources held by the cache."""
+    
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        raise NotImplementedError
+    
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        raise NotImplementedError
+    
+    def _refresh(self, key: str, stored_at: float) -> None:
+        raise NotImplementedError
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-process response cache with size-bounded LRU eviction.
+    
+    Useful for long-running processes, where entries stay warm between runs
+    without touching the disk.
+    """
+    
+    def __init__(self, ttl: float = 3600, max_bytes: int = 50 * 1024 * 1024):
+        """Initialize the cache.
+        
+        Args:
+            ttl: Seconds an entry is served without revalidation
+            max_bytes: Total body size kept before least recently used entries are evicted
+        """
+        super().__init__(ttl)
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._total_bytes = 0
+    
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+    
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._total_bytes -= len(previous.body)
+        
+        self._entries[key] = entry
+        self._total_bytes += len(entry.body)
+        
+        while self._total_bytes > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._total_bytes -= len(evicted.body)
+    
+    def _refresh(self, key: str, stored_at: float) -> None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.stored_at = stored_at
+            self._entries.move_to_end(key)
+
+
+class SQLiteResponseCache(ResponseCache):
+    """Response cache persisted in a SQLite file with size-bounded LRU eviction."""
+    
+    def __init__(self, path: str, ttl: float = 3600, max_bytes: int = 50 * 1024 * 1024):
+        """Open (or create) the cache database.
+        
+        Args:
+            path: Path of the SQLite database file
+            ttl: Seconds an entry is served without revalidation
+            max_bytes: Total body size kept before least recently used entries are evicted
+        """
+        # sqlite3 is only loaded when a persistent cache is configured
+        import sqlite3
+        
+        super().__init__(ttl)
+        self.max_bytes = max_bytes
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                etag TEXT,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)"
+        )
+        self._conn.commit()
+        
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        self._total_bytes = row[0]
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+    
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        row = self._conn.execute(
+            "SELECT etag, body, stored_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        
+        self._conn.execute(
+            "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+        )
+        self._conn.commit()
+        return CacheEntry(etag=row[0], body=row[1], stored_at=row[2])
+    
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        previous = self._conn.execute(
+            "SELECT size FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if previous:
+            self._total_bytes -= previous[0]
+        
+        self._conn.execute(
+            """
+            INSERT OR REPLACE INTO responses (key, etag, body, size, stored_at, accessed_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (key, entry.etag, entry.body, len(entry.body), entry.stored_at, entry.stored_at),
+        )
+        self._total_bytes += len(entry.body)
+        self._evict()
+        self._conn.commit()
+    
+    def _refresh(self, key: str, stored_at: float) -> None:
+        self._conn.execute(
+            "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?",
+            (stored_at, stored_at, key),
+        )
+        self._conn.commit()
+    
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits in max_bytes."""
+        if self._total_bytes <= self.max_bytes:
+            return
+        
+        excess = self._total_bytes - self.max_bytes
+        evicted = []
+        cursor = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at")
+        for key, size in cursor:
+            evicted.append((key,))
+            excess -= size
+            self._total_bytes -= size
+            if excess <= 0:
+                break
+        cursor.close()
+        
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
@@ -1,7 +1,7 @@
 """Configuration management for the application."""
 
 import os
-from typing import Optional
+from typing import List, Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -16,6 +16,11 @@ class Config:
     RECIPIENT_EMAIL: str = os.getenv("RECIPIENT_EMAIL", "me@vanducng.dev")
     SENDER_EMAIL: str = os.getenv("SENDER_EMAIL", "GitHub Trending <onboarding@resend.dev>")
     
+    # Delivery settings
+    SUBSCRIBERS_FILE: str = os.getenv("SUBSCRIBERS_FILE", "")  # JSON list of subscribers
+    DELIVERY_BATCH_SIZE: int = int(os.getenv("DELIVERY_BATCH_SIZE", "100"))  # emails per batch request
+    DELIVERY_CONCURRENCY: int = int(os.getenv("DELIVERY_CONCURRENCY", "4"))  # batch requests in flight
+    
     # GitHub settings
     GITHUB_TOKEN: Optional[str] = os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN")
     
@@ -23,17 +28,95 @@ class Config:
     TRENDING_PERIOD: str = os.getenv("TRENDING_PERIOD", "daily")  # daily, weekly, monthly
     TRENDING_LANGUAGE: str = os.getenv("TRENDING_LANGUAGE", "")  # empty for all languages
     
+    # Sweep settings: comma-separated lists, e.g. "python,rust" and "daily,weekly"
+    TRENDING_LANGUAGES: str = os.getenv("TRENDING_LANGUAGES", "")
+    TRENDING_PERIODS: str = os.getenv("TRENDING_PERIODS", "")
+    
+    # Fetch settings
+    MAX_CONCURRENCY: int = int(os.getenv("MAX_CONCURRENCY", "5"))  # parallel repo detail requests
+    GITHUB_BACKEND: str = os.getenv("GITHUB_BACKEND", "rest")  # rest, graphql, page
+    TRENDING_PARSER: str = os.getenv("TRENDING_PARSER", "streaming")  # streaming, soup
+    TRENDING_DEPTH: int = int(os.getenv("TRENDING_DEPTH", "10"))  # repos per trending page, up to 25
+    SEARCH_DEPTH: int = int(os.getenv("SEARCH_DEPTH", "0"))  # extra search candidates per list, 0 disables
+    SHARD_WORKERS: int = int(os.getenv("SHARD_WORKERS", "0"))  # processes a sweep is split across, 0 or 1 runs in-process
+    
+    # Ranking settings
+    RANKING: str = os.getenv("RANKING", "trending")  # trending, score
+    DIGEST_SIZE: int = int(os.getenv("DIGEST_SIZE", "0"))  # repos shown per digest, 0 shows all
+    
+    # Enrichment settings: README excerpt, latest release and contributor count per repo
+    ENRICHMENT: bool = os.getenv("ENRICHMENT", "false").lower() in ("1", "true", "yes")
+    ENRICHMENT_WORKERS: int = int(os.getenv("ENRICHMENT_WORKERS", "4"))  # repos enriched at once
+    ENRICHMENT_TIMEOUT: float = float(os.getenv("ENRICHMENT_TIMEOUT", "10"))  # seconds per repo
+    ENRICHMENT_BUDGET: float = float(os.getenv("ENRICHMENT_BUDGET", "60"))  # seconds before enrichment gives up
+    
+    # Cache settings
+    CACHE_PATH: str = os.getenv("CACHE_PATH", "")  # empty disables the response cache
+    CACHE_TTL: int = int(os.getenv("CACHE_TTL", "3600"))  # seconds before revalidation
+    CACHE_MAX_BYTES: int = int(os.getenv("CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+    
+    # Service settings (--daemon)
+    SCHEDULE_FILE: str = os.getenv("SCHEDULE_FILE", "schedule.json")  # JSON list of digest jobs
+    SCHEDULE_JITTER: float = float(os.getenv("SCHEDULE_JITTER", "30"))  # max random start delay, seconds
+    
+    # Metrics settings
+    METRICS_JSON_PATH: str = os.getenv("METRICS_JSON_PATH", "")  # empty disables JSON export
+    METRICS_PROM_PATH: str = os.getenv("METRICS_PROM_PATH", "")  # empty disables Prometheus export
+    
+    # History settings
+    HISTORY_PATH: str = os.getenv("HISTORY_PATH", "")  # empty disables the trending history
+    
+    # Offline settings (--record / --replay / --dry-run)
+    REPLAY_LATENCY: float = float(os.getenv("REPLAY_LATENCY", "0"))  # simulated seconds per replayed request
+    
+    # Output sinks: static files written next to (or instead of reading) the emails
+    OUTPUT_DIR: str = os.getenv("OUTPUT_DIR", "")  # empty disables the sinks
+    OUTPUT_SINKS: str = os.getenv("OUTPUT_SINKS", "archive,feed,json")  # comma-separated: archive, feed, json
+    SITE_URL: str = os.getenv("SITE_URL", "")  # public URL of OUTPUT_DIR, for absolute feed links
+    
+    # Seen index settings
+    SEEN_PATH: str = os.getenv("SEEN_PATH", "")  # empty disables already-sent tracking
+    SEEN_WINDOW_DAYS: int = int(os.getenv("SEEN_WINDOW_DAYS", "7"))  # days a sent repo counts as seen
+    SEEN_MODE: str = os.getenv("SEEN_MODE", "collapse")  # collapse, suppress
+    
     @classmethod
-    def validate_required_settings(cls) -> bool:
+    def trending_languages(cls) -> List[str]:
+        """Languages to fetch, falling back to TRENDING_LANGUAGE.
+        
+        Blank entries are ignored; "all" stands for the all-languages list.
+        
+        Returns:
+            List of language filters (empty string means all languages)
+        """
+        if cls.TRENDING_LANGUAGES:
+            languages = [lang.strip() for lang in cls.TRENDING_LANGUAGES.split(",") if lang.strip()]
+            return ["" if lang.lower() == "all" else lang for lang in languages]
+        return [cls.TRENDING_LANGUAGE]
+    
+    @classmethod
+    def trending_periods(cls) -> List[str]:
+        """Periods to fetch, falling back to TRENDING_PERIOD.
+        
+        Returns:
+            List of trending periods
+        """
+        if cls.TRENDING_PERIODS:
+            return [period.strip() for period in cls.TRENDING_PERIODS.split(",") if period.strip()]
+        return [cls.TRENDING_PERIOD]
+    
+    @classmethod
+    def validate_required_settings(cls, dry_run: bool = False) -> bool:
         """Validate that all required settings are provided.
         
+        Args:
+            dry_run: Whether emails are written to files, so no Resend key is needed
+        
         Returns:
             True if all required settings are available, False otherwise
         """
-        required_settings = [
-            ("RESEND_API_KEY", cls.RESEND_API_KEY),
-            ("RECIPIENT_EMAIL", cls.RECIPIENT_EMAIL),
-        ]
+        required_settings = [("RECIPIENT_EMAIL", cls.RECIPIENT_EMAIL)]
+        if not dry_run:
+            required_settings.insert(0, ("RESEND_API_KEY", cls.RESEND_API_KEY))
         
         missing_settings = []
         for setting_name, setting_value in required_settings:
@@ -0,0 +1,152 @@
+"""Long-running service that sends scheduled digests with warm state."""
+
+import asyncio
+import json
+import random
+import signal
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+from .logger import logger
+
+
+@dataclass
+class DigestJob:
+    """A digest sent at a fixed local time, daily or on one weekday."""
+    
+    name: str
+    recipients: List[str]
+    language: str = ""
+    period: str = "daily"
+    at: str = "07:00"  # HH:MM in the job's timezone
+    timezone: str = "UTC"
+    weekday: Optional[int] = None  # 0 = Monday; None runs every day
+    
+    def next_run(self, now: datetime) -> datetime:
+        """Compute the next time this job is due.
+        
+        Args:
+            now: Current time, timezone-aware
+        
+        Returns:
+            Next run time, timezone-aware, strictly after now
+        """
+        tz = ZoneInfo(self.timezone)
+        hour, minute = (int(part) for part in self.at.split(":"))
+        
+        local_now = now.astimezone(tz)
+        candidate = local_now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if candidate <= local_now:
+            candidate += timedelta(days=1)
+        if self.weekday is not None:
+            candidate += timedelta(days=(self.weekday - candidate.weekday()) % 7)
+        return candidate
+
+
+def load_jobs(path: str, default_recipient: str) -> List[DigestJob]:
+    """Load digest jobs from a JSON schedule file.
+    
+    The file holds a list of objects such as
+    {"name": "python-daily", "language": "python", "period": "daily",
+     "at": "07:00", "timezone": "Asia/Ho_Chi_Minh", "recipients": ["me@example.com"]}.
+    
+    Args:
+        path: Path of the JSON file
+        default_recipient: Recipient used when a job lists none
+    
+    Returns:
+        List of jobs
+    """
+    with open(path, encoding="utf-8") as f:
+        entries = json.load(f)
+    
+    jobs = []
+    for i, entry in enumerate(entries):
+        jobs.append(DigestJob(
+            name=entry.get("name", f"job-{i + 1}"),
+            recipients=entry.get("recipients") or [default_recipient],
+            language=entry.get("language", ""),
+            period=entry.get("period", "daily"),
+            at=entry.get("at", "07:00"),
+            timezone=entry.get("timezone", "UTC"),
+            weekday=entry.get("weekday"),
+        ))
+    return jobs
+
+
+class DigestScheduler:
+    """Runs digest jobs on their schedules inside one event loop.
+    
+    Each job gets its own timer loop. Start times get random jitter so jobs
+    sharing a slot don't hit GitHub at the same instant, a job that is still
+    running when it comes due again is skipped, and stop() lets in-flight
+    runs finish before returning.
+    """
+    
+    def __init__(self, jobs: List[DigestJob], runner: Callable[[DigestJob], Awaitable[None]], jitter: float = 30.0):
+        """Initialize the scheduler.
+        
+        Args:
+            jobs: Jobs to run
+            runner: Coroutine function that runs one job
+            jitter: Maximum random delay in seconds added to each start time
+        """
+        self.jobs = jobs
+        self.runner = runner
+        self.jitter = jitter
+        self._stop = asyncio.Event()
+        self._runs: Dict[str, asyncio.Task] = {}
+    
+    async def run(self) -> None:
+        """Run until stop() is called, then wait for in-flight jobs."""
+        timers = [asyncio.create_task(self._timer(job)) for job in self.jobs]
+        await self._stop.wait()
+        
+        for timer in timers:
+            timer.cancel()
+        await asyncio.gather(*timers, return_exceptions=True)
+        
+        if self._runs:
+            logger.info(f"⏳ Waiting for {len(self._runs)} running job(s) to finish...")
+            await asyncio.gather(*self._runs.values(), return_exceptions=True)
+    
+    def stop(self) -> None:
+        """Ask the scheduler to shut down gracefully."""
+        self._stop.set()
+    
+    async def _timer(self, job: DigestJob) -> None:
+        """Sleep until a job is due, start it, and repeat."""
+        last_due = datetime.now().astimezone()
+        while not self._stop.is_set():
+            now = datetime.now().astimezone()
+            # Never reschedule the slot that just ran, even if the sleep woke up early
+            due = job.next_run(max(now, last_due))
+            last_due = due
+            delay = (due - now).total_seconds() + random.uniform(0, self.jitter)
+            logger.info(f"🗓️ {job.name} next runs at {due.isoformat()}")
+            await asyncio.sleep(delay)
+            
+            if job.name in self._runs:
+                logger.warning(f"⏭️ Skipping {job.name}: previous run is still in progress")
+                continue
+            
+            task = asyncio.create_task(self._run(job))
+            self._runs[job.name] = task
+    
+    async def _run(self, job: DigestJob) -> None:
+        """Run one job, logging rather than propagating its failures."""
+        logger.info(f"▶️ Running {job.name}")
+        try:
+            await self.runner(job)
+        except Exception as e:
+            logger.error(f"❌ Job {job.name} failed: {e}", exc_info=True)
+        finally:
+            self._runs.pop(job.name, None)
+    
+    def install_signal_handlers(self) -> None:
+        """Stop gracefully on SIGTERM and SIGINT."""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self.stop)
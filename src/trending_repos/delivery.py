@@ -0,0 +1,222 @@
+"""Bulk digest delivery to many subscribers."""
+
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from .logger import logger
+from .metrics import metrics
+
+if TYPE_CHECKING:
+    from .email_sender import EmailSender
+    from .seen import SeenIndex
+    from .summarizer import RepoSummarizer
+
+
+# Resend accepts at most 100 emails per batch request
+RESEND_BATCH_LIMIT = 100
+
+
+@dataclass
+class Subscriber:
+    """A digest recipient and the trending list they want."""
+    
+    email: str
+    language: str = ""
+    period: str = "daily"
+    
+    @property
+    def digest_key(self) -> Tuple[str, str]:
+        """The (language, period) combination this subscriber receives."""
+        return (self.language, self.period)
+
+
+@dataclass
+class DeliveryResult:
+    """Outcome of sending a digest to one subscriber."""
+    
+    email: str
+    success: bool
+    message_id: Optional[str] = None
+    error: Optional[str] = None
+    skipped: bool = False
+
+
+def load_subscribers(path: str) -> List[Subscriber]:
+    """Load subscribers from a JSON file.
+    
+    The file holds a list of objects such as
+    {"email": "me@example.com", "language": "python", "period": "weekly"};
+    language and period are optional.
+    
+    Args:
+        path: Path of the JSON file
+    
+    Returns:
+        List of subscribers
+    """
+    with open(path, encoding="utf-8") as f:
+        entries = json.load(f)
+    
+    return [
+        Subscriber(
+            email=entry["email"],
+            language=entry.get("language", ""),
+            period=entry.get("period", "daily"),
+        )
+        for entry in entries
+    ]
+
+
+class DeliveryPipeline:
+    """Sends digests to many subscribers in provider-sized batches.
+    
+    Each distinct (language, period) digest is rendered once, then its
+    recipients are split into batches that are sent concurrently, bounded
+    by max_concurrency. Every subscriber gets a DeliveryResult.
+    
+    With a seen index, recipients of a digest are grouped by which of its
+    repositories they were already sent; each group gets one variant,
+    rendered once, with the repeats collapsed or suppressed.
+    """
+    
+    def __init__(
+        self,
+        email_sender: "EmailSender",
+        sender_email: str,
+        batch_size: int = RESEND_BATCH_LIMIT,
+        max_concurrency: int = 4,
+        seen_index: Optional["SeenIndex"] = None,
+        summarizer: Optional["RepoSummarizer"] = None,
+        seen_mode: str = "collapse"
+    ):
+        """Initialize the pipeline.
+        
+        Args:
+            email_sender: Sender used to render digests and send batches
+            sender_email: Sender email address (with optional display name)
+            batch_size: Emails per batch request, capped at the provider limit
+            max_concurrency: Maximum number of batch requests in flight
+            seen_index: Optional index of repositories already sent to each recipient
+            summarizer: Summarizer that adapts digests to a seen set, required with seen_index
+            seen_mode: "collapse" or "suppress", see RepoSummarizer.apply_seen
+        """
+        self.email_sender = email_sender
+        self.sender_email = sender_email
+        self.batch_size = max(1, min(batch_size, RESEND_BATCH_LIMIT))
+        self.max_concurrency = max(1, max_concurrency)
+        self.seen_index = seen_index
+        self.summarizer = summarizer
+        self.seen_mode = seen_mode
+    
+    async def deliver(
+        self,
+        subscribers: List[Subscriber],
+        summaries: Dict[Tuple[str, str], Dict[str, Any]]
+    ) -> List[DeliveryResult]:
+        """Send each subscriber the digest for their language and period.
+        
+        Args:
+            subscribers: Recipients to deliver to
+            summaries: Summaries keyed by (language, period)
+        
+        Returns:
+            One result per subscriber
+        """
+        results = []
+        batches = []
+        
+        if self.seen_index:
+            dates = [summary["date"] for summary in summaries.values() if summary.get("date")]
+            if dates:
+                self.seen_index.expire(max(dates))
+        
+        recipients_by_digest: Dict[Tuple[str, str], List[Subscriber]] = {}
+        for subscriber in subscribers:
+            recipients_by_digest.setdefault(subscriber.digest_key, []).append(subscriber)
+        
+        for key, recipients in recipients_by_digest.items():
+            summary = summaries.get(key)
+            if not summary or not summary.get("repos"):
+                results.extend(
+                    DeliveryResult(s.email, False, error="No digest for this language and period", skipped=True)
+                    for s in recipients
+                )
+                continue
+            
+            for variant, group in self._variants(summary, recipients):
+                if not variant["repos"]:
+                    results.extend(
+                        DeliveryResult(s.email, False, error="Nothing new since the last digest", skipped=True)
+                        for s in group
+                    )
+                    continue
+                
+                # Render once per distinct digest, then share it across recipients
+                with metrics.span("stage.render"):
+                    message = self.email_sender.build_message(variant)
+                for i in range(0, len(group), self.batch_size):
+                    batches.append((group[i:i + self.batch_size], message, variant))
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def send(recipients: List[Subscriber], message: Dict[str, str], summary: Dict[str, Any]) -> List[DeliveryResult]:
+            emails = [
+                {"from": self.sender_email, "to": [s.email], **message}
+                for s in recipients
+            ]
+            async with semaphore:
+                try:
+                    with metrics.span("email.batch"):
+                        message_ids = await self.email_sender.send_batch(emails)
+                except Exception as e:
+                    logger.error(f"❌ Batch of {len(emails)} emails failed: {e}")
+                    metrics.incr("email.failed", len(emails))
+                    return [DeliveryResult(s.email, False, error=str(e)) for s in recipients]
+            
+            metrics.incr("email.sent", len(emails))
+            if self.seen_index:
+                # Only repositories shown in full count as sent, so collapsed
+                # repeats still expire and come back in full after the window
+                self.seen_index.mark_sent(
+                    [s.email for s in recipients],
+                    [repo.repo.key for repo in summary["repos"]],
+                    summary["date"],
+                )
+            return [
+                DeliveryResult(s.email, True, message_id=message_id)
+                for s, message_id in zip(recipients, message_ids)
+            ]
+        
+        for batch_results in await asyncio.gather(*(send(r, m, v) for r, m, v in batches)):
+            results.extend(batch_results)
+        
+        return results
+    
+    def _variants(self, summary: Dict[str, Any], recipients: List[Subscriber]) -> Iterator[Tuple[Dict[str, Any], List[Subscriber]]]:
+        """Group a digest's recipients by what they have already been sent.
+        
+        Args:
+            summary: Digest shared by the recipients
+            recipients: Subscribers of that digest
+        
+        Yields:
+            (summary variant, recipients receiving it)
+        """
+        if not self.seen_index or not self.summarizer:
+            yield summary, recipients
+            return
+        
+        seen = self.seen_index.seen(
+            [s.email for s in recipients],
+            [repo.repo.key for repo in summary["repos"]],
+            summary["date"],
+        )
+        
+        groups: Dict[FrozenSet[str], List[Subscriber]] = {}
+        for subscriber in recipients:
+            groups.setdefault(frozenset(seen.get(subscriber.email.lower(), ())), []).append(subscriber)
+        
+        for repo_keys, group in groups.items():
+            yield self.summarizer.apply_seen(summary, set(repo_keys), self.seen_mode), group
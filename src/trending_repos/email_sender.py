@@ -1,8 +1,11 @@
 """Email sending functionality using Resend."""
 
+import asyncio
 import os
-from typing import Dict, Any
-import resend
+import re
+from typing import Dict, Any, List, Optional
+
+from .renderer import DigestRenderer
 
 
 class EmailSender:
@@ -14,7 +17,12 @@ class EmailSender:
         Args:
             api_key: Resend API key
         """
+        # Imported here so rendering-only code paths don't pay for the SDK import
+        import resend
+        
         resend.api_key = api_key
+        self._resend = resend
+        self.renderer = DigestRenderer()
     
     async def send_trending_summary(self, summary: Dict[str, Any], recipient_email: str, sender_email: str = "GitHub Trending <onboarding@resend.dev>") -> bool:
         """Send trending repositories summary email.
@@ -29,104 +37,66 @@ class EmailSender:
         """
         try:
             # Generate email content
-            html_content = self._generate_html_email(summary)
-            text_content = self._generate_text_email(summary)
-            
-            # Send email
             params = {
                 "from": sender_email,
                 "to": [recipient_email],
-                "subject": f"📈 GitHub Trending Repos - {summary['date']}",
-                "html": html_content,
-                "text": text_content,
+                **self.build_message(summary),
             }
             
-            email = resend.Emails.send(params)
-            print(f"Email sent successfully: {email}")
+            # A batch of one, so subclasses that override send_batch send single digests too
+            message_ids = await self.send_batch([params])
+            print(f"Email sent successfully: {message_ids[0]}")
             return True
             
         except Exception as e:
             print(f"Failed to send email: {e}")
             return False
     
-    def _generate_html_email(self, summary: Dict[str, Any]) -> str:
-        """Generate HTML email content.
+    def build_message(self, summary: Dict[str, Any]) -> Dict[str, str]:
+        """Render the subject and bodies of a digest email.
         
         Args:
             summary: Repository summary data
             
         Returns:
-            HTML email content
+            Dictionary with "subject", "html" and "text" keys
         """
-        repos_html = ""
-        for repo in summary.get("repos", []):
-            topics_badges = ""
-            if repo["topics"] != "No topics":
-                topics = repo["topics"].split(", ")[:3]  # Limit to 3 topics
-                for topic in topics:
-                    topics_badges += f'<span style="background: #f1f8ff; color: #0969da; padding: 2px 6px; border-radius: 12px; font-size: 12px; margin-right: 4px;">{topic}</span>'
-            
-            repos_html += f"""
-            <div style="border: 1px solid #e1e4e8; border-radius: 8px; padding: 20px; margin-bottom: 20px; background: white;">
-                <div style="display: flex; align-items: center; margin-bottom: 12px;">
-                    <h3 style="margin: 0; color: #24292f;">
-                        <a href="{repo['url']}" style="color: #0969da; text-decoration: none;">
-                            #{repo['rank']} {repo['full_name']}
-                        </a>
-                    </h3>
-                </div>
-                
-                <p style="color: #656d76; margin: 8px 0; line-height: 1.5;">{repo['description']}</p>
-                
-                <div style="margin: 12px 0;">
-                    {topics_badges}
-                </div>
-                
-                <div style="display: flex; gap: 16px; align-items: center; font-size: 14px; color: #656d76;">
-                    <span>⭐ {repo['stars']} stars</span>
-                    <span>🍴 {repo['forks']} forks</span>
-                    {f'<span>💻 {repo["language"]}</span>' if repo["language"] != "Unknown" else ""}
-                    {f'<span>📅 Created {repo["created_date"]}</span>' if repo["created_date"] != "Unknown" else ""}
-                </div>
-            </div>
-            """
+        subject = f"📈 GitHub Trending Repos - {summary['date']}"
+        if summary.get("label"):
+            subject += f" ({summary['label']})"
         
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>GitHub Trending Repos</title>
-        </head>
-        <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif; line-height: 1.6; color: #24292f; max-width: 800px; margin: 0 auto; padding: 20px; background: #f6f8fa;">
-            
-            <div style="text-align: center; margin-bottom: 32px; padding: 24px; background: white; border-radius: 8px; border: 1px solid #e1e4e8;">
-                <h1 style="color: #24292f; margin: 0 0 8px 0;">📈 GitHub Trending Repositories</h1>
-                <p style="color: #656d76; margin: 0; font-size: 16px;">{summary['date']}</p>
-            </div>
-            
-            <div style="background: white; padding: 24px; border-radius: 8px; border: 1px solid #e1e4e8; margin-bottom: 24px;">
-                <h2 style="color: #24292f; margin: 0 0 16px 0;">📊 Summary</h2>
-                <div style="color: #656d76; line-height: 1.6;">
-                    {summary['summary_text'].replace('**', '<strong>').replace('**', '</strong>').replace('\n\n', '<br><br>')}
-                </div>
-            </div>
+        return {
+            "subject": subject,
+            "html": self._generate_html_email(summary),
+            "text": self._generate_text_email(summary),
+        }
+    
+    async def send_batch(self, emails: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """Send up to one provider batch of emails in a single API call.
+        
+        Args:
+            emails: Resend email params ("from", "to", "subject", "html", "text")
             
-            <div>
-                <h2 style="color: #24292f; margin: 0 0 20px 0;">🔥 Top Trending Repositories</h2>
-                {repos_html}
-            </div>
+        Returns:
+            Message ids in the same order as emails
             
-            <div style="text-align: center; margin-top: 32px; padding: 16px; background: white; border-radius: 8px; border: 1px solid #e1e4e8;">
-                <p style="color: #656d76; margin: 0; font-size: 14px;">
-                    Generated by <a href="https://github.com/vanducng/github-trending-repos" style="color: #0969da;">GitHub Trending Repos</a>
-                </p>
-            </div>
+        Raises:
+            Exception: Whatever the Resend SDK raises if the batch is rejected
+        """
+        response = await asyncio.to_thread(self._resend.Batch.send, emails)
+        data = response.get("data") if isinstance(response, dict) else None
+        return [item.get("id") for item in data] if data else [None] * len(emails)
+    
+    def _generate_html_email(self, summary: Dict[str, Any]) -> str:
+        """Generate HTML email content.
+        
+        Args:
+            summary: Repository summary data
             
-        </body>
-        </html>
+        Returns:
+            HTML email content
         """
+        return self.renderer.render_html(summary)
     
     def _generate_text_email(self, summary: Dict[str, Any]) -> str:
         """Generate plain text email content.
@@ -137,38 +107,40 @@ class EmailSender:
         Returns:
             Plain text email content
         """
-        content = f"""GitHub Trending Repositories - {summary['date']}
-
-{summary['summary_text']}
-
-Top Trending Repositories:
-{'=' * 50}
-"""
-        
-        for repo in summary.get("repos", []):
-            content += f"""
-#{repo['rank']} {repo['full_name']}
-{repo['url']}
+        return self.renderer.render_text(summary)
 
-{repo['description']}
 
-⭐ {repo['stars']} stars | 🍴 {repo['forks']} forks"""
-            
-            if repo['language'] != "Unknown":
-                content += f" | 💻 {repo['language']}"
-            
-            if repo['created_date'] != "Unknown":
-                content += f" | 📅 Created {repo['created_date']}"
-            
-            if repo['topics'] != "No topics":
-                content += f"\nTopics: {repo['topics']}"
-            
-            content += "\n" + "-" * 50
+class DryRunEmailSender(EmailSender):
+    """Writes rendered digests to files instead of sending them."""
+    
+    def __init__(self, output_dir: str):
+        """Initialize the dry-run sender.
         
-        content += f"""
-
-Generated by GitHub Trending Repos
-https://github.com/vanducng/github-trending-repos
-"""
+        Args:
+            output_dir: Directory the rendered emails are written to
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir = output_dir
+        self.renderer = DigestRenderer()
+        self._count = 0
+    
+    async def send_batch(self, emails: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """Write each email as an .html and a .txt file.
         
-        return content
\ No newline at end of file
+        Args:
+            emails: Email params as passed to the Resend batch API
+            
+        Returns:
+            Base path of the files written for each email
+        """
+        paths = []
+        for email in emails:
+            self._count += 1
+            recipient = re.sub(r"[^\w.@-]", "_", ",".join(email["to"]))
+            base = os.path.join(self.output_dir, f"{self._count:04d}-{recipient}")
+            for extension, key in (("html", "html"), ("txt", "text")):
+                with open(f"{base}.{extension}", "w", encoding="utf-8") as f:
+                    f.write(email[key])
+            paths.append(base)
+        print(f"Wrote {len(emails)} email(s) to {self.output_dir}")
+        return paths
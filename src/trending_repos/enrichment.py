@@ -0,0 +1,248 @@
+"""Per-repository enrichment: README excerpt, latest release and contributors."""
+
+import asyncio
+import dataclasses
+import json
+import re
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Optional, Tuple
+
+from .metrics import metrics
+from .models import Enrichment, Repo
+
+if TYPE_CHECKING:
+    from .cache import ResponseCache
+    from .github_client import GitHubClient
+
+
+API_URL = "https://api.github.com/repos"
+
+# Length of the README excerpt shown in the digest
+EXCERPT_LENGTH = 280
+
+# Paragraphs that are headings, badges, tables, images or markup rather than prose
+_NOT_PROSE = re.compile(r"^(#|\||<|!|\[!\[|```|---|===|\* \* \*)")
+
+
+def readme_excerpt(html: str, limit: int = EXCERPT_LENGTH) -> str:
+    """Pick the first prose paragraph of a rendered README.
+    
+    Args:
+        html: README rendered to HTML by the GitHub API
+        limit: Maximum length of the excerpt
+    
+    Returns:
+        Plain-text excerpt, empty if the README has no prose paragraph
+    """
+    from markdownify import markdownify
+    
+    markdown = markdownify(html, strip=["a", "img"], heading_style="ATX")
+    for paragraph in re.split(r"\n\s*\n", markdown):
+        text = " ".join(paragraph.split())
+        if not text or _NOT_PROSE.match(text) or len(text) < 40:
+            continue
+        text = text.replace("**", "").replace("`", "")
+        if len(text) > limit:
+            text = text[:limit - 1].rsplit(" ", 1)[0] + "…"
+        return text
+    return ""
+
+
+def _last_page(link_header: str) -> Optional[int]:
+    """Read the page number of rel="last" from a Link header."""
+    match = re.search(r'[?&]page=(\d+)[^>]*>;\s*rel="last"', link_header)
+    return int(match.group(1)) if match else None
+
+
+class Enricher:
+    """Adds README, release and contributor details to repositories.
+    
+    Jobs run on a bounded pool of workers, each limited by a timeout, and
+    the whole stage by a time budget. A job that fails, times out or starts
+    after the budget is spent leaves its repository unenriched rather than
+    holding up the digest. Results are cached by repository and pushed_at,
+    so a repository nobody pushed to is never enriched twice; repositories
+    without pushed_at are enriched again once the cache TTL has passed.
+    """
+    
+    def __init__(
+        self,
+        github_client: "GitHubClient",
+        cache: Optional["ResponseCache"] = None,
+        workers: int = 4,
+        timeout: float = 10.0,
+        budget: float = 60.0
+    ):
+        """Initialize the enricher.
+        
+        Args:
+            github_client: Client used for the API calls
+            cache: Optional cache for enrichment results
+            workers: Maximum number of repositories enriched at once
+            timeout: Seconds allowed for one repository
+            budget: Seconds after the first job beyond which no job starts
+        """
+        self.github_client = github_client
+        self.cache = cache
+        self.timeout = timeout
+        self.budget = budget
+        self._semaphore = asyncio.Semaphore(max(1, workers))
+        self._jobs: Dict[str, asyncio.Task] = {}
+        self._deadline: Optional[float] = None
+        # Counted apart from the cache's own counters, which describe HTTP responses
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Enrichment results served from and added to the cache."""
+        return {"cache_hits": self.cache_hits, "cache_misses": self.cache_misses}
+    
+    async def enrich(self, repo: Repo) -> Repo:
+        """Enrich one repository.
+        
+        Args:
+            repo: Repository record
+        
+        Returns:
+            A copy with enrichment set, or the repository unchanged if
+            enrichment wasn't possible
+        """
+        if self._deadline is None:
+            self._deadline = time.monotonic() + self.budget
+        
+        # A repo that trends in several lists is enriched once
+        key = f"enrichment:{repo.key}@{repo.pushed_at}"
+        if key not in self._jobs:
+            self._jobs[key] = asyncio.create_task(self._run_job(key, repo))
+        enrichment = await asyncio.shield(self._jobs[key])
+        
+        return dataclasses.replace(repo, enrichment=enrichment) if enrichment else repo
+    
+    async def enrich_stream(
+        self,
+        items: AsyncIterator[Tuple[Tuple[str, str], int, Repo]]
+    ) -> AsyncIterator[Tuple[Tuple[str, str], int, Repo]]:
+        """Enrich repositories from GitHubClient.stream_combinations as they arrive.
+        
+        Args:
+            items: (combination, rank, repository) items
+        
+        Yields:
+            The same items with enriched repositories, in completion order
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        tasks = set()
+        
+        async def enrich_item(combination: Tuple[str, str], rank: int, repo: Repo) -> None:
+            await queue.put((combination, rank, await self.enrich(repo)))
+        
+        async def produce() -> None:
+            try:
+                async for combination, rank, repo in items:
+                    task = asyncio.create_task(enrich_item(combination, rank, repo))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                await asyncio.gather(*tasks)
+            finally:
+                await queue.put(None)
+        
+        producer = asyncio.create_task(produce())
+        try:
+            while (item := await queue.get()) is not None:
+                yield item
+            await producer
+        finally:
+            for task in (producer, *tasks, *self._jobs.values()):
+                task.cancel()
+            await asyncio.gather(producer, *tasks, *self._jobs.values(), return_exceptions=True)
+    
+    async def _run_job(self, key: str, repo: Repo) -> Optional[Enrichment]:
+        """Load an enrichment from the cache, or fetch it within the limits."""
+        if self.cache:
+            entry = self.cache.get(key)
+            # Without pushed_at (the page backend) the key never changes, so fall back to the TTL
+            if entry and (repo.pushed_at or self.cache.is_fresh(entry)):
+                self.cache_hits += 1
+                metrics.incr("enrichment.cache_hits")
+                return Enrichment(**json.loads(entry.body))
+            self.cache_misses += 1
+            metrics.incr("enrichment.cache_misses")
+        
+        async with self._semaphore:
+            remaining = self._deadline - time.monotonic()
+            if remaining <= 0:
+                metrics.incr("enrichment.skipped")
+                return None
+            
+            try:
+                with metrics.span("enrichment.job"):
+                    enrichment, complete = await asyncio.wait_for(self._fetch(repo), min(self.timeout, remaining))
+            except asyncio.TimeoutError:
+                print(f"Enrichment timed out for {repo.full_name}")
+                metrics.incr("enrichment.timeouts")
+                return None
+            except Exception as e:
+                print(f"Enrichment failed for {repo.full_name}: {e}")
+                metrics.incr("enrichment.errors")
+                return None
+        
+        # Parts that failed may succeed next time, so only complete results are cached
+        if self.cache and complete:
+            self.cache.put(key, json.dumps(dataclasses.asdict(enrichment)).encode())
+        return enrichment
+    
+    async def _fetch(self, repo: Repo) -> Tuple[Enrichment, bool]:
+        """Fetch README, latest release and contributor count concurrently.
+        
+        A part that fails is left empty instead of failing the whole job.
+        
+        Returns:
+            Tuple of (enrichment, whether every part succeeded)
+        """
+        readme, release, contributors = await asyncio.gather(
+            self._fetch_readme(repo.full_name),
+            self._fetch_release(repo.full_name),
+            self._fetch_contributors(repo.full_name),
+            return_exceptions=True
+        )
+        
+        results = (readme, release, contributors)
+        if all(isinstance(result, Exception) for result in results):
+            raise readme
+        
+        enrichment = Enrichment()
+        if isinstance(readme, str):
+            enrichment.readme_excerpt = readme
+        if isinstance(release, tuple):
+            enrichment.latest_release, enrichment.release_url = release
+        if isinstance(contributors, int):
+            enrichment.contributors = contributors
+        return enrichment, not any(isinstance(result, Exception) for result in results)
+    
+    async def _fetch_readme(self, repo_name: str) -> str:
+        """Fetch the rendered README and extract its excerpt."""
+        response = await self.github_client.api_get(f"{API_URL}/{repo_name}/readme", accept="application/vnd.github.html")
+        if response.status_code == 404:
+            return ""
+        response.raise_for_status()
+        # HTML parsing is CPU-bound, keep it off the event loop
+        return await asyncio.to_thread(readme_excerpt, response.text)
+    
+    async def _fetch_release(self, repo_name: str) -> Tuple[str, str]:
+        """Fetch the latest release's name and URL, empty if there is none."""
+        response = await self.github_client.api_get(f"{API_URL}/{repo_name}/releases/latest")
+        if response.status_code == 404:
+            return "", ""
+        response.raise_for_status()
+        release = response.json()
+        return release.get("tag_name") or release.get("name") or "", release.get("html_url", "")
+    
+    async def _fetch_contributors(self, repo_name: str) -> int:
+        """Count contributors with one request, using the Link header of a one-per-page listing."""
+        response = await self.github_client.api_get(f"{API_URL}/{repo_name}/contributors?per_page=1&anon=true")
+        if response.status_code == 204:
+            return 0
+        response.raise_for_status()
+        last_page = _last_page(response.headers.get("Link", ""))
+        return last_page if last_page is not None else len(response.json())
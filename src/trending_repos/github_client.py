@@ -1,21 +1,96 @@
 """GitHub API client for fetching trending repositories."""
 
 import asyncio
-from typing import List, Dict, Any, Optional
+import dataclasses
+import json
+from contextlib import asynccontextmanager
+from datetime import date, timedelta
+from typing import AsyncIterator, Callable, List, Dict, Any, Iterator, Optional, Set, Tuple
 import httpx
-from bs4 import BeautifulSoup
+
+from .cache import ResponseCache
+from .http2 import HTTP2_AVAILABLE
+from .models import Repo
+from .parsers import StreamingTrendingParser, TrendingPageParser
+from .rate_limit import RateLimitScheduler
+
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+SEARCH_URL = "https://api.github.com/search/repositories"
+SEARCH_PAGE_SIZE = 100
+# The search API only ever returns the first 1000 results of a query
+SEARCH_MAX_RESULTS = 1000
+# How far back "recently created" reaches for each trending period, in days
+SEARCH_WINDOWS = {"daily": 1, "weekly": 7, "monthly": 30}
+
+# The trending page lists at most 25 repositories
+TRENDING_PAGE_SIZE = 25
+
+# Repositories per aliased GraphQL query; keeps each query well under
+# GitHub's node and complexity limits
+GRAPHQL_CHUNK_SIZE = 50
+
+GRAPHQL_REPO_FRAGMENT = """
+fragment RepoFields on Repository {
+  name
+  nameWithOwner
+  description
+  primaryLanguage { name }
+  stargazerCount
+  forkCount
+  url
+  createdAt
+  updatedAt
+  pushedAt
+  repositoryTopics(first: 20) { nodes { topic { name } } }
+  licenseInfo { name }
+  owner { login avatarUrl }
+}
+"""
 
 
 class GitHubClient:
     """Client for fetching GitHub trending repositories."""
     
-    def __init__(self, github_token: Optional[str] = None):
+    def __init__(
+        self,
+        github_token: Optional[str] = None,
+        max_concurrency: int = 5,
+        backend: str = "rest",
+        cache: Optional[ResponseCache] = None,
+        parser: Optional[TrendingPageParser] = None,
+        scheduler: Optional[RateLimitScheduler] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        depth: int = 10,
+        search_depth: int = 0
+    ):
         """Initialize the GitHub client.
         
         Args:
             github_token: Optional GitHub personal access token for higher rate limits
+            max_concurrency: Maximum number of repo detail requests in flight at once
+            backend: Repo detail backend, "rest" (one call per repo), "graphql"
+                (batched aliased queries, requires a token) or "page" (only the
+                data on the trending page, no API calls)
+            cache: Optional response cache for REST calls, revalidated with ETags
+            parser: Trending page parser, defaults to StreamingTrendingParser
+            scheduler: Request scheduler handling rate limits and retries
+            transport: Optional HTTP transport, e.g. a ReplayTransport for offline runs
+            depth: Repositories taken from each trending page, up to TRENDING_PAGE_SIZE
+            search_depth: Extra candidates per list from searching recently created
+                repositories by stars, up to SEARCH_MAX_RESULTS (0 disables search)
         """
         self.github_token = github_token
+        self.max_concurrency = max(1, max_concurrency)
+        self.backend = backend
+        self.cache = cache
+        self.parser = parser or StreamingTrendingParser()
+        self.scheduler = scheduler or RateLimitScheduler()
+        self.transport = transport
+        self.depth = max(1, min(depth, TRENDING_PAGE_SIZE))
+        self.search_depth = max(0, min(search_depth, SEARCH_MAX_RESULTS))
+        self._client: Optional[httpx.AsyncClient] = None
         self.headers = {
             "User-Agent": "trending-repos-bot/1.0",
             "Accept": "application/vnd.github.v3+json"
@@ -23,90 +98,561 @@ class GitHubClient:
         if github_token:
             self.headers["Authorization"] = f"token {github_token}"
     
-    async def fetch_trending_repos(self, period: str = "daily", language: str = "") -> List[Dict[str, Any]]:
+    async def __aenter__(self) -> "GitHubClient":
+        """Open a pooled HTTP client shared by every call until exit."""
+        self._client = self._create_http_client()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the pooled HTTP client."""
+        client, self._client = self._client, None
+        if client:
+            await client.aclose()
+    
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """Create an HTTP client, using HTTP/2 when the h2 package is installed."""
+        return httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=self.max_concurrency * 2),
+            transport=self.transport,
+        )
+    
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the pooled client if open, otherwise a client scoped to one call."""
+        if self._client:
+            yield self._client
+            return
+        
+        async with self._create_http_client() as client:
+            yield client
+    
+    async def api_get(self, url: str, accept: Optional[str] = None) -> httpx.Response:
+        """GET a REST API URL with this client's auth, pacing and retries.
+        
+        Args:
+            url: API URL to fetch
+            accept: Optional Accept header, e.g. for raw or HTML media types
+        
+        Returns:
+            The response, whatever its status
+        """
+        headers = {**self.headers, "Accept": accept} if accept else self.headers
+        async with self._session() as client:
+            return await self.scheduler.request(client, "GET", url, headers=headers)
+    
+    async def fetch_trending_repos(self, period: str = "daily", language: str = "") -> List[Repo]:
         """Fetch trending repositories from GitHub.
         
         Args:
             period: Time period for trending repos (daily, weekly, monthly)
             language: Programming language filter (empty for all languages)
+        
+        Returns:
+            List of repositories with basic info
+        """
+        results = await self.fetch_combinations([(language, period)])
+        return results[(language, period)]
+    
+    async def sweep(self, languages: List[str], periods: List[str]) -> Dict[Tuple[str, str], List[Repo]]:
+        """Fetch trending repositories for every language and period combination.
+        
+        All trending pages are scraped concurrently, and each repository's
+        details are fetched once even if it trends in several lists.
+        
+        Args:
+            languages: Programming language filters (empty string for all languages)
+            periods: Time periods (daily, weekly, monthly)
+        
+        Returns:
+            Repository lists keyed by (language, period), in trending-rank order
+        """
+        return await self.fetch_combinations(
+            [(language, period) for language in languages for period in periods]
+        )
+    
+    async def fetch_combinations(self, combinations: List[Tuple[str, str]]) -> Dict[Tuple[str, str], List[Repo]]:
+        """Fetch trending repositories for specific (language, period) pairs.
+        
+        Args:
+            combinations: (language, period) pairs to fetch
+        
+        Returns:
+            Repository lists keyed by (language, period), in trending-rank order,
+            followed by search results not already on the trending page
+        """
+        ranked: Dict[Tuple[str, str], Dict[int, Repo]] = {combination: {} for combination in combinations}
+        async for combination, rank, repo in self.stream_combinations(combinations):
+            ranked[combination][rank] = repo
+        return {
+            combination: [repos[rank] for rank in sorted(repos)]
+            for combination, repos in ranked.items()
+        }
+    
+    async def stream_trending_repos(self, period: str = "daily", language: str = "") -> AsyncIterator[Tuple[int, Repo]]:
+        """Yield trending repositories as soon as each one's details arrive.
+        
+        Args:
+            period: Time period for trending repos (daily, weekly, monthly)
+            language: Programming language filter (empty for all languages)
+        
+        Yields:
+            (trending rank, repository) pairs in completion order
+        """
+        async for _, rank, repo in self.stream_combinations([(language, period)]):
+            yield rank, repo
+    
+    async def stream_combinations(
+        self,
+        combinations: List[Tuple[str, str]],
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> AsyncIterator[Tuple[Tuple[str, str], int, Repo]]:
+        """Yield repositories for several lists as soon as each one is resolved.
+        
+        Trending pages are scraped concurrently and detail requests start as
+        soon as a page is parsed, so the first repositories arrive while other
+        pages are still loading. A repository that trends in several lists is
+        fetched once and yielded once per list. Search results, if enabled,
+        are ranked after the trending page and skip repositories already on
+        it. Closing the generator early cancels the requests still in flight.
+        
+        Args:
+            combinations: (language, period) pairs to fetch
+            progress: Optional callback called with (resolved, requested)
+                repository counts after every detail request
+        
+        Yields:
+            ((language, period), trending rank, repository) in completion order
+        """
+        async with self._session() as client:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            # Each task is either a trending page or a detail request for some repos
+            pending: Dict[asyncio.Task, Tuple[str, Any]] = {}
+            resolved: Dict[str, Optional[Repo]] = {}
+            # Where each repo appears: (combination, rank, stars gained on that page)
+            occurrences: Dict[str, List[Tuple[Tuple[str, str], int, int]]] = {}
+            # Search results wait for their trending page so they can be deduped against it
+            scraped: Dict[Tuple[str, str], Tuple[Set[str], int]] = {}
+            held_searches: Dict[Tuple[str, str], List[Repo]] = {}
+            requested = resolved_count = 0
             
+            async def fetch_details(names: List[str]) -> List[Optional[Repo]]:
+                # The GraphQL API rejects anonymous requests, so REST is the only option without a token
+                if self.backend == "graphql" and self.github_token:
+                    return await self._fetch_all_repo_details_graphql(client, names)
+                async with semaphore:
+                    return [await self._fetch_repo_details(client, names[0])]
+            
+            for language, period in combinations:
+                task = asyncio.create_task(self._fetch_trending_entries(client, period, language))
+                pending[task] = ("page", (language, period))
+                if self.search_depth:
+                    task = asyncio.create_task(self._search_repos(client, period, language))
+                    pending[task] = ("search", (language, period))
+            
+            try:
+                while pending:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        kind, value = pending.pop(task)
+                        
+                        if kind == "search":
+                            if value in scraped:
+                                for item in self._merge_search(value, scraped[value], task.result()):
+                                    yield item
+                            else:
+                                held_searches[value] = task.result()
+                        
+                        elif kind == "page":
+                            language, period = value
+                            try:
+                                entries = task.result()
+                            except Exception as e:
+                                print(f"Error fetching trending page for {language or 'all'}/{period}: {e}")
+                                entries = []
+                            
+                            scraped[value] = ({entry.key for entry in entries}, len(entries))
+                            if value in held_searches:
+                                for item in self._merge_search(value, scraped[value], held_searches.pop(value)):
+                                    yield item
+                            
+                            new_names = []
+                            for rank, entry in enumerate(entries, 1):
+                                if self.backend == "page":
+                                    yield value, rank, entry
+                                    continue
+                                if entry.key in resolved:
+                                    repo = resolved[entry.key]
+                                    if repo:
+                                        yield value, rank, dataclasses.replace(repo, stars_today=entry.stars_today)
+                                    continue
+                                if entry.key not in occurrences:
+                                    new_names.append(entry.full_name)
+                                occurrences.setdefault(entry.key, []).append((value, rank, entry.stars_today))
+                            
+                            # GraphQL batches a page's repos into one query; REST streams them one by one
+                            groups = [new_names] if self.backend == "graphql" and self.github_token else [[name] for name in new_names]
+                            for names in filter(None, groups):
+                                pending[asyncio.create_task(fetch_details(names))] = ("details", names)
+                            requested += len(new_names)
+                        
+                        else:
+                            try:
+                                repos = task.result()
+                            except Exception as e:
+                                print(f"Error fetching details for {', '.join(value)}: {e}")
+                                repos = [None] * len(value)
+                            
+                            resolved_count += len(value)
+                            if progress:
+                                progress(resolved_count, requested)
+                            
+                            for name, repo in zip(value, repos):
+                                resolved[name.lower()] = repo
+                                # Stars gained is specific to each list's period, so take it from that page
+                                for combination, rank, stars_today in occurrences.pop(name.lower(), []):
+                                    if repo:
+                                        yield combination, rank, dataclasses.replace(repo, stars_today=stars_today)
+            finally:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+    
+    def _merge_search(
+        self,
+        combination: Tuple[str, str],
+        scraped: Tuple[Set[str], int],
+        search_repos: List[Repo]
+    ) -> Iterator[Tuple[Tuple[str, str], int, Repo]]:
+        """Rank search results after a trending page, skipping repos already on it.
+        
+        Args:
+            combination: (language, period) of the list
+            scraped: Keys of the repos on the trending page, and how many there were
+            search_repos: Search results in star order
+        
+        Yields:
+            (combination, rank, repository) for each new search result
+        """
+        keys, rank = scraped
+        for repo in search_repos:
+            if repo.key not in keys:
+                rank += 1
+                yield combination, rank, repo
+    
+    async def _search_repos(self, client: httpx.AsyncClient, period: str, language: str) -> List[Repo]:
+        """Find recently created repositories with the most stars.
+        
+        Result pages are requested concurrently. Search items carry the same
+        fields as GET /repos/{owner}/{repo}, so no detail requests are needed.
+        
+        Args:
+            client: HTTP client instance
+            period: Trending period, selecting how recent "recently created" is
+            language: Programming language filter (empty for all languages)
+        
+        Returns:
+            Up to search_depth repositories in star order, tagged with source
+            "search", empty if search is disabled
+        """
+        if not self.search_depth:
+            return []
+        
+        since = date.today() - timedelta(days=SEARCH_WINDOWS.get(period, 7))
+        query = f"created:>={since.isoformat()}"
+        if language:
+            query += f" language:{language}"
+        
+        per_page = min(self.search_depth, SEARCH_PAGE_SIZE)
+        pages = range(1, -(-self.search_depth // per_page) + 1)
+        
+        async def fetch_page(page: int) -> Any:
+            url = httpx.URL(SEARCH_URL, params={
+                "q": query,
+                "sort": "stars",
+                "order": "desc",
+                "per_page": per_page,
+                "page": page,
+            })
+            return await self._get_json(client, str(url))
+        
+        payloads = await asyncio.gather(*(fetch_page(page) for page in pages), return_exceptions=True)
+        
+        repos = []
+        for page, payload in zip(pages, payloads):
+            if isinstance(payload, Exception):
+                print(f"Error fetching search page {page} for {language or 'all'}/{period}: {payload}")
+                continue
+            repos.extend(
+                dataclasses.replace(self._parse_repo_data(item), source="search")
+                for item in payload.get("items") or []
+            )
+        return repos[:self.search_depth]
+    
+    async def _fetch_trending_entries(self, client: httpx.AsyncClient, period: str, language: str) -> List[Repo]:
+        """Scrape the trending page for ranked repositories.
+        
+        Args:
+            client: HTTP client instance
+            period: Time period for trending repos (daily, weekly, monthly)
+            language: Programming language filter (empty for all languages)
+        
         Returns:
-            List of repository dictionaries with basic info
+            Repositories built from the page, in trending-rank order
         """
         # GitHub doesn't have an official API for trending repos,
         # so we'll scrape the trending page and then get detailed info via API
         trending_url = f"https://github.com/trending/{language}?since={period}"
         
-        async with httpx.AsyncClient() as client:
-            # First, scrape the trending page to get repo names
-            response = await client.get(trending_url)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            repo_links = soup.find_all('h2', class_='h3 lh-condensed')
-            
-            repo_names = []
-            for link in repo_links[:10]:  # Get top 10 trending repos
-                repo_link = link.find('a')
-                if repo_link:
-                    repo_name = repo_link.get('href').strip('/')
-                    repo_names.append(repo_name)
-            
-            # Now fetch detailed information for each repo via GitHub API
-            repos = []
-            for repo_name in repo_names:
+        response = await self.scheduler.request(client, "GET", trending_url)
+        response.raise_for_status()
+        
+        return self.parser.parse(response.text, limit=self.depth)
+    
+    async def _gather_rest_details(self, client: httpx.AsyncClient, repo_names: List[str]) -> List[Optional[Repo]]:
+        """Run REST detail requests concurrently and keep results aligned with the input.
+        
+        Args:
+            client: HTTP client instance
+            repo_names: Repository names in format "owner/repo"
+        
+        Returns:
+            One entry per repo name, None where the fetch failed
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def fetch_one(repo_name: str) -> Optional[Repo]:
+            async with semaphore:
                 try:
-                    repo_info = await self._fetch_repo_details(client, repo_name)
-                    if repo_info:
-                        repos.append(repo_info)
+                    return await self._fetch_repo_details(client, repo_name)
                 except Exception as e:
+                    # Isolate failures so one bad repo doesn't cancel the others
                     print(f"Error fetching details for {repo_name}: {e}")
-                    continue
+                    return None
+        
+        # gather() preserves input order, so trending rank is kept
+        return await asyncio.gather(*(fetch_one(name) for name in repo_names))
+    
+    async def _fetch_all_repo_details_graphql(self, client: httpx.AsyncClient, repo_names: List[str]) -> List[Optional[Repo]]:
+        """Fetch repository details with aliased GraphQL queries.
+        
+        Repositories are queried in chunks of GRAPHQL_CHUNK_SIZE. A chunk that
+        fails as a whole, or a repo that fails for any reason other than not
+        existing, is fetched again through the REST backend.
+        
+        Args:
+            client: HTTP client instance
+            repo_names: Repository names in trending-rank order
+        
+        Returns:
+            One entry per repo name, None where the fetch failed
+        """
+        chunks = [
+            repo_names[i:i + GRAPHQL_CHUNK_SIZE]
+            for i in range(0, len(repo_names), GRAPHQL_CHUNK_SIZE)
+        ]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def fetch_chunk(chunk: List[str]) -> List[Optional[Repo]]:
+            async with semaphore:
+                try:
+                    results, retry_names = await self._fetch_graphql_chunk(client, chunk)
+                except Exception as e:
+                    print(f"GraphQL query failed, falling back to REST: {e}")
+                    results, retry_names = {}, chunk
+            
+            if retry_names:
+                fallback = await self._gather_rest_details(client, retry_names)
+                results.update(
+                    (name.lower(), repo) for name, repo in zip(retry_names, fallback) if repo
+                )
             
-            return repos
+            return [results.get(name.lower()) for name in chunk]
+        
+        chunk_results = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+        return [repo for chunk in chunk_results for repo in chunk]
     
-    async def _fetch_repo_details(self, client: httpx.AsyncClient, repo_name: str) -> Optional[Dict[str, Any]]:
+    async def _fetch_graphql_chunk(self, client: httpx.AsyncClient, repo_names: List[str]) -> Tuple[Dict[str, Repo], List[str]]:
+        """Fetch one chunk of repositories in a single aliased GraphQL query.
+        
+        Args:
+            client: HTTP client instance
+            repo_names: Repository names in format "owner/repo"
+        
+        Returns:
+            Tuple of (repos keyed by lower-cased full name, names to retry via REST)
+        """
+        fields = []
+        variable_defs = []
+        variables = {}
+        for i, repo_name in enumerate(repo_names):
+            owner, _, name = repo_name.partition("/")
+            variable_defs.append(f"$o{i}: String!, $n{i}: String!")
+            fields.append(f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ ...RepoFields }}")
+            variables[f"o{i}"] = owner
+            variables[f"n{i}"] = name
+        
+        query = (
+            f"query({', '.join(variable_defs)}) {{\n  "
+            + "\n  ".join(fields)
+            + "\n}\n"
+            + GRAPHQL_REPO_FRAGMENT
+        )
+        
+        response = await self.scheduler.request(
+            client,
+            "POST",
+            GRAPHQL_URL,
+            json={"query": query, "variables": variables},
+            headers=self.headers,
+        )
+        response.raise_for_status()
+        payload = response.json()
+        
+        data = payload.get("data")
+        if not data:
+            raise ValueError(f"GraphQL response has no data: {payload.get('errors')}")
+        
+        # Errors are reported per alias, e.g. {"path": ["r3"], "type": "NOT_FOUND"}
+        error_types = {}
+        for error in payload.get("errors") or []:
+            path = error.get("path") or []
+            if path:
+                error_types[path[0]] = error.get("type", "")
+        
+        results = {}
+        retry_names = []
+        for i, repo_name in enumerate(repo_names):
+            alias = f"r{i}"
+            node = data.get(alias)
+            if node:
+                results[repo_name.lower()] = self._parse_graphql_repo(node)
+            elif error_types.get(alias) == "NOT_FOUND":
+                print(f"Repository {repo_name} not found")
+            else:
+                retry_names.append(repo_name)
+        
+        return results, retry_names
+    
+    async def _fetch_repo_details(self, client: httpx.AsyncClient, repo_name: str) -> Optional[Repo]:
         """Fetch detailed repository information from GitHub API.
         
         Args:
             client: HTTP client instance
             repo_name: Repository name in format "owner/repo"
-            
+        
         Returns:
-            Repository information dictionary or None if error
+            Repository record or None if error
         """
         api_url = f"https://api.github.com/repos/{repo_name}"
         
         try:
-            response = await client.get(api_url, headers=self.headers)
-            response.raise_for_status()
-            
-            repo_data = response.json()
-            
-            # Extract relevant information
-            return {
-                "name": repo_data.get("name", ""),
-                "full_name": repo_data.get("full_name", ""),
-                "description": repo_data.get("description", ""),
-                "language": repo_data.get("language", ""),
-                "stars": repo_data.get("stargazers_count", 0),
-                "forks": repo_data.get("forks_count", 0),
-                "url": repo_data.get("html_url", ""),
-                "created_at": repo_data.get("created_at", ""),
-                "updated_at": repo_data.get("updated_at", ""),
-                "topics": repo_data.get("topics", []),
-                "license": repo_data.get("license", {}).get("name", "") if repo_data.get("license") else "",
-                "owner": {
-                    "login": repo_data.get("owner", {}).get("login", ""),
-                    "avatar_url": repo_data.get("owner", {}).get("avatar_url", "")
-                }
-            }
+            return self._parse_repo_data(await self._get_json(client, api_url))
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 print(f"Repository {repo_name} not found")
+            elif e.response.status_code in (403, 429):
+                print(f"Rate limited while fetching {repo_name}, giving up after retries: {e}")
             else:
                 print(f"HTTP error for {repo_name}: {e}")
             return None
         except Exception as e:
             print(f"Unexpected error for {repo_name}: {e}")
-            return None
\ No newline at end of file
+            return None
+    
+    async def _get_json(self, client: httpx.AsyncClient, url: str) -> Any:
+        """GET a REST API resource, going through the response cache if configured.
+        
+        Fresh cache entries are returned without a request. Stale entries are
+        revalidated with If-None-Match; a 304 reply doesn't count against the
+        rate limit and serves the cached body.
+        
+        Args:
+            client: HTTP client instance
+            url: API URL to fetch
+        
+        Returns:
+            Decoded JSON body
+        
+        Raises:
+            httpx.HTTPStatusError: If the API responds with an error status
+        """
+        if not self.cache:
+            response = await self.scheduler.request(client, "GET", url, headers=self.headers)
+            response.raise_for_status()
+            return response.json()
+        
+        entry = self.cache.get(url)
+        if entry and self.cache.is_fresh(entry):
+            self.cache.record_hit(entry)
+            return json.loads(entry.body)
+        
+        headers = self.headers
+        if entry and entry.etag:
+            headers = {**self.headers, "If-None-Match": entry.etag}
+        
+        response = await self.scheduler.request(client, "GET", url, headers=headers)
+        if response.status_code == 304 and entry:
+            self.cache.refresh(url)
+            self.cache.record_hit(entry, revalidated=True)
+            return json.loads(entry.body)
+        
+        response.raise_for_status()
+        self.cache.store(url, response.headers.get("ETag"), response.content)
+        return response.json()
+    
+    def _parse_repo_data(self, repo_data: Dict[str, Any]) -> Repo:
+        """Extract the fields we use from a REST repository payload.
+        
+        Args:
+            repo_data: JSON body of GET /repos/{owner}/{repo}
+        
+        Returns:
+            Repository record
+        """
+        owner = repo_data.get("owner") or {}
+        return Repo(
+            name=repo_data.get("name", ""),
+            full_name=repo_data.get("full_name", ""),
+            description=repo_data.get("description", ""),
+            language=repo_data.get("language", ""),
+            stars=repo_data.get("stargazers_count", 0),
+            forks=repo_data.get("forks_count", 0),
+            url=repo_data.get("html_url", ""),
+            created_at=repo_data.get("created_at", ""),
+            updated_at=repo_data.get("updated_at", ""),
+            pushed_at=repo_data.get("pushed_at", ""),
+            topics=tuple(repo_data.get("topics") or ()),
+            license=repo_data.get("license", {}).get("name", "") if repo_data.get("license") else "",
+            owner_login=owner.get("login", ""),
+            owner_avatar_url=owner.get("avatar_url", "")
+        )
+    
+    def _parse_graphql_repo(self, node: Dict[str, Any]) -> Repo:
+        """Map a GraphQL repository node onto a repository record.
+        
+        Args:
+            node: Repository node selected with RepoFields
+        
+        Returns:
+            Repository record, identical in content to _parse_repo_data
+        """
+        topics = node.get("repositoryTopics") or {}
+        license_info = node.get("licenseInfo")
+        owner = node.get("owner") or {}
+        return Repo(
+            name=node.get("name", ""),
+            full_name=node.get("nameWithOwner", ""),
+            description=node.get("description"),
+            language=(node.get("primaryLanguage") or {}).get("name"),
+            stars=node.get("stargazerCount", 0),
+            forks=node.get("forkCount", 0),
+            url=node.get("url", ""),
+            created_at=node.get("createdAt", ""),
+            updated_at=node.get("updatedAt", ""),
+            pushed_at=node.get("pushedAt", ""),
+            topics=tuple(t["topic"]["name"] for t in topics.get("nodes") or []),
+            license=license_info.get("name", "") if license_info else "",
+            owner_login=owner.get("login", ""),
+            owner_avatar_url=owner.get("avatarUrl", "")
+        )
@@ -0,0 +1,271 @@
+"""Historical store of trending runs."""
+
+import os
+import sqlite3
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from .models import Repo
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS repos (
+    id INTEGER PRIMARY KEY,
+    full_name TEXT NOT NULL UNIQUE COLLATE NOCASE
+);
+
+CREATE TABLE IF NOT EXISTS snapshots (
+    run_date TEXT NOT NULL,
+    language TEXT NOT NULL,
+    period TEXT NOT NULL,
+    repo_id INTEGER NOT NULL REFERENCES repos (id),
+    rank INTEGER NOT NULL,
+    stars INTEGER NOT NULL,
+    forks INTEGER NOT NULL,
+    stars_today INTEGER NOT NULL,
+    PRIMARY KEY (run_date, language, period, repo_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_snapshots_repo
+    ON snapshots (repo_id, language, period, run_date);
+"""
+
+
+class TrendingHistory:
+    """Append-only SQLite store of ranked trending lists, one snapshot per day.
+    
+    Snapshots are keyed by (run_date, language, period, repo) so lookups of a
+    day's list are a primary-key range scan, and a second index on
+    (repo, language, period, run_date) serves per-repo history such as
+    streaks. Repository names are stored once and referenced by id.
+    """
+    
+    def __init__(self, path: str):
+        """Open (or create) the history database.
+        
+        Args:
+            path: Path of the SQLite database file
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+    
+    def record_run(self, run_date: str, language: str, period: str, ranked: List[Tuple[int, Repo]]) -> int:
+        """Record the ranked list of one run.
+        
+        Ingestion is append-only: if the list for this date, language and
+        period was already recorded, existing rows are kept untouched. Only
+        repositories scraped from the trending page are recorded; search
+        candidates never trended, so they would fake streaks and new entries.
+        
+        Args:
+            run_date: Run date as YYYY-MM-DD
+            language: Language filter of the list (empty for all languages)
+            period: Trending period of the list
+            ranked: (trending rank, repository) pairs. Ranks are stored as
+                given, so repos missing from the API leave gaps rather than
+                moving the ones below them up
+        
+        Returns:
+            Number of snapshot rows added
+        """
+        ranked = [(rank, repo) for rank, repo in ranked if repo.source == "trending"]
+        with self._conn:
+            repo_ids = self._repo_ids([repo.full_name for _, repo in ranked])
+            rows = [
+                (
+                    run_date,
+                    language,
+                    period,
+                    repo_ids[repo.key],
+                    rank,
+                    repo.stars,
+                    repo.forks,
+                    repo.stars_today,
+                )
+                for rank, repo in ranked
+            ]
+            before = self._conn.total_changes
+            self._conn.executemany(
+                """
+                INSERT OR IGNORE INTO snapshots
+                    (run_date, language, period, repo_id, rank, stars, forks, stars_today)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            return self._conn.total_changes - before
+    
+    def previous_run_date(self, run_date: str, language: str, period: str) -> Optional[str]:
+        """Find the most recent recorded run before a date.
+        
+        Args:
+            run_date: Reference date as YYYY-MM-DD
+            language: Language filter of the list
+            period: Trending period of the list
+        
+        Returns:
+            Date of the previous run, or None if there is none
+        """
+        row = self._conn.execute(
+            """
+            SELECT MAX(run_date) FROM snapshots
+            WHERE run_date < ? AND language = ? AND period = ?
+            """,
+            (run_date, language, period),
+        ).fetchone()
+        return row[0]
+    
+    def trend_deltas(self, run_date: str, language: str, period: str, ranked: List[Tuple[int, Repo]]) -> Dict[str, Dict[str, Any]]:
+        """Compare a ranked list against the previous run.
+        
+        Args:
+            run_date: Date of the list as YYYY-MM-DD
+            language: Language filter of the list
+            period: Trending period of the list
+            ranked: (trending rank, repository) pairs
+        
+        Returns:
+            Per repository (keyed by lower-cased full name), the delta
+            described in trend_delta
+        """
+        previous = self.previous_snapshot(run_date, language, period)
+        return {
+            repo.key: self.trend_delta(run_date, language, period, repo, rank, previous)
+            for rank, repo in ranked
+        }
+    
+    def previous_snapshot(self, run_date: str, language: str, period: str) -> Tuple[Optional[str], Dict[str, Tuple[int, int]]]:
+        """Load the ranked list of the run before a date.
+        
+        Args:
+            run_date: Reference date as YYYY-MM-DD
+            language: Language filter of the list
+            period: Trending period of the list
+        
+        Returns:
+            Tuple of (previous run date or None, (rank, stars) keyed by
+            lower-cased full name)
+        """
+        previous_date = self.previous_run_date(run_date, language, period)
+        if not previous_date:
+            return None, {}
+        
+        return previous_date, {
+            full_name.lower(): (rank, stars)
+            for full_name, rank, stars in self._conn.execute(
+                """
+                SELECT r.full_name, s.rank, s.stars
+                FROM snapshots s JOIN repos r ON r.id = s.repo_id
+                WHERE s.run_date = ? AND s.language = ? AND s.period = ?
+                """,
+                (previous_date, language, period),
+            )
+        }
+    
+    def trend_delta(
+        self,
+        run_date: str,
+        language: str,
+        period: str,
+        repo: Repo,
+        rank: int,
+        previous: Tuple[Optional[str], Dict[str, Tuple[int, int]]]
+    ) -> Dict[str, Any]:
+        """Compare one repository against the previous run.
+        
+        Args:
+            run_date: Date of the list as YYYY-MM-DD
+            language: Language filter of the list
+            period: Trending period of the list
+            repo: Repository record
+            rank: Its rank in the list
+            previous: Result of previous_snapshot for the same list
+        
+        Returns:
+            Whether it is new, its previous rank, rank change (positive is up),
+            stars gained since the previous run, consecutive days on the list
+            and total days seen
+        """
+        previous_date, previous_ranks = previous
+        previous_rank, previous_stars = previous_ranks.get(repo.key, (None, None))
+        repo_id = self._existing_repo_ids([repo.full_name]).get(repo.key)
+        streak, days_trending = self._streak(repo_id, run_date, language, period)
+        return {
+            "is_new": previous_date is not None and previous_rank is None,
+            "previous_rank": previous_rank,
+            "rank_change": previous_rank - rank if previous_rank else 0,
+            "stars_gained": repo.stars - previous_stars if previous_stars is not None else None,
+            "streak": streak,
+            "days_trending": days_trending,
+        }
+    
+    def _streak(self, repo_id: Optional[int], run_date: str, language: str, period: str) -> Tuple[int, int]:
+        """Count consecutive days on the list ending at run_date, and total days.
+        
+        Args:
+            repo_id: Repository id, None if never recorded
+            run_date: Last day of the streak as YYYY-MM-DD
+            language: Language filter of the list
+            period: Trending period of the list
+        
+        Returns:
+            Tuple of (streak length in days, total days on the list)
+        """
+        if repo_id is None:
+            return 1, 1
+        
+        dates = [
+            row[0]
+            for row in self._conn.execute(
+                """
+                SELECT run_date FROM snapshots
+                WHERE repo_id = ? AND language = ? AND period = ? AND run_date <= ?
+                ORDER BY run_date DESC
+                """,
+                (repo_id, language, period, run_date),
+            )
+        ]
+        if not dates or dates[0] != run_date:
+            # The current run isn't recorded yet, so it starts (or extends) the streak
+            dates.insert(0, run_date)
+        
+        streak = 1
+        expected = date.fromisoformat(run_date) - timedelta(days=1)
+        for day in dates[1:]:
+            if date.fromisoformat(day) != expected:
+                break
+            streak += 1
+            expected -= timedelta(days=1)
+        
+        return streak, len(dates)
+    
+    def _repo_ids(self, full_names: List[str]) -> Dict[str, int]:
+        """Get repository ids, inserting names seen for the first time."""
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO repos (full_name) VALUES (?)",
+            [(name,) for name in full_names],
+        )
+        return self._existing_repo_ids(full_names)
+    
+    def _existing_repo_ids(self, full_names: List[str]) -> Dict[str, int]:
+        """Look up ids of already recorded repositories by lower-cased name."""
+        if not full_names:
+            return {}
+        placeholders = ", ".join("?" for _ in full_names)
+        return {
+            full_name.lower(): repo_id
+            for repo_id, full_name in self._conn.execute(
+                f"SELECT id, full_name FROM repos WHERE full_name IN ({placeholders})",
+                full_names,
+            )
+        }
@@ -0,0 +1,7 @@
+"""Detection of the optional HTTP/2 support shared by every HTTP client."""
+
+import importlib.util
+
+
+# httpx only negotiates HTTP/2 when the h2 package is installed (the http2 extra)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
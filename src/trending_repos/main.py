@@ -1,62 +1,484 @@
 """Main application logic."""
 
+import argparse
 import asyncio
 import sys
+import time
+from typing import TYPE_CHECKING, List, Optional
 from .config import Config
-from .github_client import GitHubClient
-from .summarizer import RepoSummarizer
-from .email_sender import EmailSender
 from .logger import logger
+from .metrics import metrics
 
+# Heavy modules (httpx, resend, sqlite3, bs4) are imported inside the functions
+# that use them, so failing validation or printing --help stays fast
+if TYPE_CHECKING:
+    import cProfile
+    import httpx
+    import tracemalloc
+    from .cache import ResponseCache
+    from .delivery import DeliveryResult, Subscriber
+    from .email_sender import EmailSender
+    from .github_client import GitHubClient
+    from .history import TrendingHistory
+    from .rate_limit import RateLimitScheduler
+    from .seen import SeenIndex
+    from .sharding import ShardedSweep
+    from .sinks import Sink
+    from .summarizer import RepoSummarizer
 
-async def main():
-    """Main application entry point."""
+
+def create_github_client(
+    cache: Optional["ResponseCache"] = None,
+    transport: Optional["httpx.AsyncBaseTransport"] = None,
+    scheduler: Optional["RateLimitScheduler"] = None
+) -> "GitHubClient":
+    """Create a GitHub client from the configuration.
+    
+    Args:
+        cache: Optional response cache
+        transport: Optional HTTP transport for recording or replaying
+        scheduler: Optional request scheduler, e.g. one sharing a sweep's budget
+    
+    Returns:
+        Configured GitHub client
+    """
+    from .github_client import GitHubClient
+    from .parsers import get_parser
+    
+    return GitHubClient(
+        Config.GITHUB_TOKEN,
+        max_concurrency=Config.MAX_CONCURRENCY,
+        backend=Config.GITHUB_BACKEND,
+        cache=cache,
+        parser=get_parser(Config.TRENDING_PARSER),
+        scheduler=scheduler,
+        transport=transport,
+        depth=Config.TRENDING_DEPTH,
+        search_depth=Config.SEARCH_DEPTH
+    )
+
+
+def log_progress(resolved: int, requested: int) -> None:
+    """Log repository detail progress every 25 repositories and at the end.
+    
+    Args:
+        resolved: Repositories resolved so far
+        requested: Repositories requested so far
+    """
+    if resolved % 25 == 0 or resolved == requested:
+        logger.info(f"🔎 Resolved {resolved}/{requested} repositories")
+
+
+async def run_digests(
+    github_client: "GitHubClient",
+    summarizer: "RepoSummarizer",
+    email_sender: "EmailSender",
+    subscribers: List["Subscriber"],
+    history: Optional["TrendingHistory"] = None,
+    seen_index: Optional["SeenIndex"] = None,
+    sweep: Optional["ShardedSweep"] = None,
+    sinks: Optional[List["Sink"]] = None
+) -> List["DeliveryResult"]:
+    """Fetch, summarize and deliver the digests a set of subscribers wants.
+    
+    Args:
+        github_client: GitHub client, ideally already opened for connection reuse
+        summarizer: Repository summarizer
+        email_sender: Email sender
+        subscribers: Recipients with their language and period
+        history: Optional trending history to record runs in
+        seen_index: Optional index of repositories already sent to each recipient
+        sweep: Optional process pool to fetch the lists on instead of this process
+        sinks: Optional static-file outputs written from the same summaries
+    
+    Returns:
+        One delivery result per subscriber, empty if nothing was found
+    """
+    from .delivery import DeliveryPipeline
+    
+    # Each distinct list is fetched and summarized once, however many subscribers want it
+    combinations = list(dict.fromkeys(subscriber.digest_key for subscriber in subscribers))
+    is_sweep = len(combinations) > 1
+    
+    logger.info("📈 Fetching trending repositories...")
+    
+    # Repositories are summarized and rendered as they arrive, so an
+    # interrupted run still has a partial digest to send
+    accumulators = {
+        (language, period): summarizer.accumulator(
+            label=f"{language or 'all languages'} / {period}" if is_sweep else "",
+            language=language,
+            period=period,
+            renderer=email_sender.renderer
+        )
+        for language, period in combinations
+    }
+    if sweep and is_sweep:
+        stream = sweep.stream(combinations)
+    else:
+        stream = github_client.stream_combinations(combinations, progress=log_progress)
+    enricher = None
+    if Config.ENRICHMENT:
+        from .enrichment import Enricher
+        
+        enricher = Enricher(
+            github_client,
+            cache=github_client.cache,
+            workers=Config.ENRICHMENT_WORKERS,
+            timeout=Config.ENRICHMENT_TIMEOUT,
+            budget=Config.ENRICHMENT_BUDGET
+        )
+        stream = enricher.enrich_stream(stream)
+    
+    interrupted = False
+    first_repo = True
+    with metrics.span("stage.fetch"):
+        start = time.perf_counter()
+        try:
+            async for combination, rank, repo in stream:
+                if first_repo:
+                    metrics.observe("stage.first_repo", time.perf_counter() - start)
+                    first_repo = False
+                with metrics.span("stage.summarize"):
+                    accumulators[combination].add(rank, repo)
+        except asyncio.CancelledError:
+            # Swallow the cancellation once so the partial digests can still go out
+            asyncio.current_task().uncancel()
+            interrupted = True
+            logger.warning("⚠️ Run interrupted, sending partial digests")
+    
+    if sweep and is_sweep:
+        # The workers did the fetching; their counters were merged into this process's metrics
+        worker_stats = {name: value for name, value in metrics.counters.items() if name.startswith("http.")}
+        logger.info(f"⏱️ Sweep worker HTTP stats: {worker_stats}")
+    else:
+        logger.info(f"⏱️ Rate limit stats: {github_client.scheduler.stats}")
+        if github_client.cache:
+            logger.info(f"🗄️ Cache stats: {github_client.cache.stats}")
+            for name, value in github_client.cache.stats.items():
+                metrics.set_gauge(f"cache.{name}", value)
+    if enricher and enricher.cache:
+        logger.info(f"🧩 Enrichment cache stats: {enricher.stats}")
+    
+    summaries = {}
+    for (language, period), accumulator in accumulators.items():
+        label = accumulator.label
+        
+        if not accumulator:
+            logger.warning(f"❌ No trending repositories found{f' for {label}' if label else ''}")
+            continue
+        
+        logger.info(f"✅ Found {len(accumulator)} trending repositories{f' for {label}' if label else ''}")
+        summaries[(language, period)] = accumulator.summary(partial=interrupted)
+        
+        # A partial list would record wrong ranks, so only complete runs go into history
+        if history and not interrupted:
+            with metrics.span("stage.history"):
+                history.record_run(accumulator.date, language, period, accumulator.ranked)
+    
+    if not summaries:
+        return []
+    
+    # Sinks get the lists before any per-recipient filtering
+    for sink in sinks or []:
+        # A broken output must not stop the other sinks or the emails
+        try:
+            with metrics.span("stage.sinks"):
+                written = sink.write(summaries)
+        except Exception as e:
+            logger.error(f"❌ {type(sink).__name__} failed: {e}", exc_info=True)
+            metrics.incr("sinks.errors")
+            continue
+        logger.info(f"🗂️ {type(sink).__name__} wrote {len(written)} file(s)")
+    
+    # Send emails
+    logger.info(f"📧 Sending {len(summaries)} digest(s) to {len(subscribers)} recipient(s)...")
+    pipeline = DeliveryPipeline(
+        email_sender,
+        Config.SENDER_EMAIL,
+        batch_size=Config.DELIVERY_BATCH_SIZE,
+        max_concurrency=Config.DELIVERY_CONCURRENCY,
+        seen_index=seen_index,
+        summarizer=summarizer,
+        seen_mode=Config.SEEN_MODE
+    )
+    with metrics.span("stage.send"):
+        deliveries = await pipeline.deliver(subscribers, summaries)
+    
+    for result in deliveries:
+        if not result.success and not result.skipped:
+            logger.error(f"❌ Failed to send email to {result.email}: {result.error}")
+    
+    return deliveries
+
+
+def create_transport(
+    record_dir: Optional[str] = None,
+    replay_dir: Optional[str] = None,
+    latency: float = 0.0
+) -> Optional["httpx.AsyncBaseTransport"]:
+    """Create a recording or replaying transport if either is requested.
+    
+    Args:
+        record_dir: Directory to save fixtures of real responses to
+        replay_dir: Directory to serve recorded fixtures from
+        latency: Simulated seconds per replayed request
+    
+    Returns:
+        Transport, or None to use the network normally
+    """
+    if replay_dir:
+        from .transports import ReplayTransport
+        return ReplayTransport(replay_dir, latency=latency)
+    if record_dir:
+        from .transports import RecordingTransport
+        return RecordingTransport(record_dir)
+    return None
+
+
+async def main(
+    dry_run_dir: Optional[str] = None,
+    record_dir: Optional[str] = None,
+    replay_dir: Optional[str] = None,
+    latency: float = 0.0
+):
+    """Main application entry point.
+    
+    Args:
+        dry_run_dir: Write rendered emails to this directory instead of sending them
+        record_dir: Save every GitHub response as a fixture in this directory
+        replay_dir: Serve GitHub responses from fixtures in this directory
+        latency: Simulated seconds per replayed request
+    """
     logger.info("🚀 Starting GitHub Trending Repos...")
     
     # Validate configuration
-    if not Config.validate_required_settings():
+    if not Config.validate_required_settings(dry_run=bool(dry_run_dir)):
         logger.error("Configuration validation failed")
         sys.exit(1)
     
+    from .delivery import Subscriber, load_subscribers
+    from .email_sender import DryRunEmailSender, EmailSender
+    from .scoring import get_ranking
+    from .summarizer import RepoSummarizer
+    
+    # Optional features import their modules (sqlite3, multiprocessing, xml)
+    # only when enabled, so a plain run doesn't pay for them
+    cache = None
+    history = None
+    seen_index = None
     try:
         # Initialize clients
-        github_client = GitHubClient(Config.GITHUB_TOKEN)
-        summarizer = RepoSummarizer()
-        email_sender = EmailSender(Config.RESEND_API_KEY)
+        if Config.CACHE_PATH:
+            from .cache import SQLiteResponseCache
+            cache = SQLiteResponseCache(Config.CACHE_PATH, ttl=Config.CACHE_TTL, max_bytes=Config.CACHE_MAX_BYTES)
+        if Config.HISTORY_PATH:
+            from .history import TrendingHistory
+            history = TrendingHistory(Config.HISTORY_PATH)
+        if Config.SEEN_PATH:
+            from .seen import SeenIndex
+            seen_index = SeenIndex(Config.SEEN_PATH, window_days=Config.SEEN_WINDOW_DAYS)
         
-        logger.info("📈 Fetching trending repositories...")
-        
-        # Fetch trending repositories
-        repos = await github_client.fetch_trending_repos(
-            period=Config.TRENDING_PERIOD,
-            language=Config.TRENDING_LANGUAGE
-        )
+        transport = create_transport(record_dir, replay_dir, latency)
+        sweep = None
+        if Config.SHARD_WORKERS > 1:
+            from .sharding import ShardedSweep
+            sweep = ShardedSweep(Config.SHARD_WORKERS, record_dir, replay_dir, latency)
         
-        if not repos:
-            logger.warning("❌ No trending repositories found")
-            return
+        github_client = create_github_client(cache, transport, sweep.scheduler() if sweep else None)
+        summarizer = RepoSummarizer(history, get_ranking(Config.RANKING), limit=Config.DIGEST_SIZE)
+        if dry_run_dir:
+            email_sender = DryRunEmailSender(dry_run_dir)
+        else:
+            email_sender = EmailSender(Config.RESEND_API_KEY)
+        sinks = []
+        if Config.OUTPUT_DIR:
+            from .sinks import get_sinks
+            sinks = get_sinks(Config.OUTPUT_SINKS, Config.OUTPUT_DIR, email_sender.renderer, Config.SITE_URL)
         
-        logger.info(f"✅ Found {len(repos)} trending repositories")
+        if Config.SUBSCRIBERS_FILE:
+            subscribers = load_subscribers(Config.SUBSCRIBERS_FILE)
+        else:
+            subscribers = [
+                Subscriber(Config.RECIPIENT_EMAIL, language, period)
+                for language in Config.trending_languages()
+                for period in Config.trending_periods()
+            ]
         
-        # Create summary
-        logger.info("📝 Creating summary...")
-        summary = summarizer.create_summary(repos)
+        # Fetch every language/period combination over one pooled connection
+        async with github_client:
+            deliveries = await run_digests(github_client, summarizer, email_sender, subscribers, history, seen_index, sweep, sinks)
         
-        # Send email
-        logger.info(f"📧 Sending email to {Config.RECIPIENT_EMAIL}...")
-        success = await email_sender.send_trending_summary(summary, Config.RECIPIENT_EMAIL, Config.SENDER_EMAIL)
+        # Workers' counts are merged into this process's metrics
+        missing = metrics.counters.get("replay.missing", 0)
+        if replay_dir and missing:
+            logger.error(f"❌ {missing:.0f} request(s) had no recorded fixture in {replay_dir}; record them with --record")
+            sys.exit(1)
         
-        if success:
-            logger.info("✅ Email sent successfully!")
-        else:
-            logger.error("❌ Failed to send email")
+        if any(not result.success and not result.skipped for result in deliveries):
             sys.exit(1)
+        if any(result.success for result in deliveries):
+            logger.info("✅ Email sent successfully!")
     
     except Exception as e:
         logger.error(f"❌ Application error: {e}", exc_info=True)
         sys.exit(1)
+    
+    finally:
+        if cache:
+            cache.close()
+        if history:
+            history.close()
+        if seen_index:
+            seen_index.close()
+
+
+async def serve(schedule_path: str):
+    """Run as a resident service that sends scheduled digests.
+    
+    One GitHub client (and its connection pool), cache and history stay
+    open for the life of the process, so scheduled runs skip startup,
+    DNS and TLS costs and hit warm caches.
+    
+    Args:
+        schedule_path: JSON file describing the digest jobs
+    """
+    logger.info("🚀 Starting GitHub Trending Repos service...")
+    
+    if not Config.validate_required_settings():
+        logger.error("Configuration validation failed")
+        sys.exit(1)
+    
+    from .cache import MemoryResponseCache
+    from .daemon import DigestJob, DigestScheduler, load_jobs
+    from .delivery import Subscriber
+    from .email_sender import EmailSender
+    from .scoring import get_ranking
+    from .summarizer import RepoSummarizer
+    
+    jobs = load_jobs(schedule_path, Config.RECIPIENT_EMAIL)
+    if not jobs:
+        logger.error(f"No jobs found in {schedule_path}")
+        sys.exit(1)
+    
+    if Config.CACHE_PATH:
+        from .cache import SQLiteResponseCache
+        cache = SQLiteResponseCache(Config.CACHE_PATH, ttl=Config.CACHE_TTL, max_bytes=Config.CACHE_MAX_BYTES)
+    else:
+        cache = MemoryResponseCache(ttl=Config.CACHE_TTL, max_bytes=Config.CACHE_MAX_BYTES)
+    history = None
+    if Config.HISTORY_PATH:
+        from .history import TrendingHistory
+        history = TrendingHistory(Config.HISTORY_PATH)
+    seen_index = None
+    if Config.SEEN_PATH:
+        from .seen import SeenIndex
+        seen_index = SeenIndex(Config.SEEN_PATH, window_days=Config.SEEN_WINDOW_DAYS)
+    
+    github_client = create_github_client(cache)
+    summarizer = RepoSummarizer(history, get_ranking(Config.RANKING), limit=Config.DIGEST_SIZE)
+    email_sender = EmailSender(Config.RESEND_API_KEY)
+    sinks = []
+    if Config.OUTPUT_DIR:
+        from .sinks import get_sinks
+        sinks = get_sinks(Config.OUTPUT_SINKS, Config.OUTPUT_DIR, email_sender.renderer, Config.SITE_URL)
+    
+    async def run_job(job: "DigestJob") -> None:
+        subscribers = [Subscriber(email, job.language, job.period) for email in job.recipients]
+        await run_digests(github_client, summarizer, email_sender, subscribers, history, seen_index, sinks=sinks)
+    
+    scheduler = DigestScheduler(jobs, run_job, jitter=Config.SCHEDULE_JITTER)
+    scheduler.install_signal_handlers()
+    
+    try:
+        async with github_client:
+            await scheduler.run()
+    finally:
+        cache.close()
+        if history:
+            history.close()
+        if seen_index:
+            seen_index.close()
+        logger.info("👋 Service stopped")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments.
+    
+    Args:
+        argv: Arguments to parse, defaults to sys.argv
+    
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Send a digest of GitHub trending repositories.")
+    parser.add_argument("--metrics-json", default=Config.METRICS_JSON_PATH, help="Write run metrics as JSON to this file")
+    parser.add_argument("--metrics-prom", default=Config.METRICS_PROM_PATH, help="Write run metrics in Prometheus text format to this file")
+    parser.add_argument("--daemon", action="store_true", help="Run as a resident service sending scheduled digests")
+    parser.add_argument("--schedule", default=Config.SCHEDULE_FILE, help="JSON file with the digest jobs for --daemon")
+    parser.add_argument("--profile", action="store_true", help="Profile the run with cProfile and tracemalloc")
+    parser.add_argument("--profile-output", default="profile.txt", help="Where to write the profile report")
+    parser.add_argument("--dry-run", nargs="?", const="dry-run", metavar="DIR", help="Write rendered emails to DIR (default: dry-run) instead of sending them")
+    replay = parser.add_mutually_exclusive_group()
+    replay.add_argument("--record", metavar="DIR", help="Save every GitHub response as a fixture in DIR")
+    replay.add_argument("--replay", metavar="DIR", help="Serve GitHub responses from fixtures in DIR, offline")
+    parser.add_argument("--latency", type=float, default=Config.REPLAY_LATENCY, help="Simulated seconds per replayed request")
+    return parser.parse_args(argv)
+
+
+def write_profile_report(path: str, profiler: "cProfile.Profile", snapshot: "tracemalloc.Snapshot", peak: int) -> None:
+    """Write a cProfile and tracemalloc report.
+    
+    Args:
+        path: Output file path
+        profiler: Profiler that ran the pipeline
+        snapshot: Memory snapshot taken at the end of the run
+        peak: Peak traced memory in bytes
+    """
+    import io
+    import pstats
+    
+    stream = io.StringIO()
+    stream.write("=== CPU (top 40 by cumulative time) ===\n")
+    pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(40)
+    
+    stream.write(f"\n=== Memory (peak {peak / 1024:.1f} KiB, top 20 allocation sites) ===\n")
+    for stat in snapshot.statistics("lineno")[:20]:
+        stream.write(f"{stat}\n")
+    
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(stream.getvalue())
 
 
 def sync_main():
     """Synchronous wrapper for main function."""
-    asyncio.run(main())
\ No newline at end of file
+    args = parse_args()
+    
+    profiler = None
+    if args.profile:
+        import cProfile
+        import tracemalloc
+        
+        tracemalloc.start()
+        profiler = cProfile.Profile()
+        profiler.enable()
+    
+    try:
+        with metrics.span("run"):
+            if args.daemon:
+                asyncio.run(serve(args.schedule))
+            else:
+                asyncio.run(main(args.dry_run, args.record, args.replay, args.latency))
+    finally:
+        if profiler:
+            profiler.disable()
+            _, peak = tracemalloc.get_traced_memory()
+            write_profile_report(args.profile_output, profiler, tracemalloc.take_snapshot(), peak)
+            tracemalloc.stop()
+            logger.info(f"🔬 Profile written to {args.profile_output}")
+        
+        if args.metrics_json:
+            metrics.write_json(args.metrics_json)
+        if args.metrics_prom:
+            metrics.write_prometheus(args.metrics_prom)
+        logger.info(f"📊 Stage timings: {metrics.to_dict()['timings']}")
@@ -0,0 +1,154 @@
+"""Lightweight timing and counter instrumentation."""
+
+import json
+import re
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+
+class Metrics:
+    """Collects timing spans, counters and gauges for one process."""
+    
+    def __init__(self):
+        """Initialize an empty registry."""
+        self.counters: Dict[str, float] = {}
+        self.gauges: Dict[str, float] = {}
+        self.timings: Dict[str, Dict[str, float]] = {}
+    
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time the enclosed block and add it to the named timing.
+        
+        Works around awaits too, since it measures wall-clock time.
+        
+        Args:
+            name: Timing name, e.g. "stage.fetch"
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+    
+    def observe(self, name: str, seconds: float) -> None:
+        """Record one duration for a timing.
+        
+        Args:
+            name: Timing name
+            seconds: Duration in seconds
+        """
+        timing = self.timings.setdefault(name, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+        timing["count"] += 1
+        timing["total_seconds"] += seconds
+        timing["max_seconds"] = max(timing["max_seconds"], seconds)
+    
+    def incr(self, name: str, value: float = 1) -> None:
+        """Increase a counter.
+        
+        Args:
+            name: Counter name, e.g. "http.requests"
+            value: Amount to add
+        """
+        self.counters[name] = self.counters.get(name, 0) + value
+    
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set a gauge to a value.
+        
+        Args:
+            name: Gauge name
+            value: Current value
+        """
+        self.gauges[name] = value
+    
+    def reset(self) -> None:
+        """Drop every recorded metric."""
+        self.counters.clear()
+        self.gauges.clear()
+        self.timings.clear()
+    
+    def merge(self, snapshot: Dict[str, Any]) -> None:
+        """Add a snapshot from another process, e.g. a sweep worker.
+        
+        Counters and timings are summed, gauges take the snapshot's value.
+        
+        Args:
+            snapshot: Output of to_dict()
+        """
+        for name, value in snapshot["counters"].items():
+            self.incr(name, value)
+        self.gauges.update(snapshot["gauges"])
+        for name, other in snapshot["timings"].items():
+            timing = self.timings.setdefault(name, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+            timing["count"] += other["count"]
+            timing["total_seconds"] += other["total_seconds"]
+            timing["max_seconds"] = max(timing["max_seconds"], other["max_seconds"])
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Snapshot every metric as plain data.
+        
+        Returns:
+            Dictionary with counters, gauges and timings
+        """
+        return {
+            "counters": dict(self.counters),
+            "gauges": dict(self.gauges),
+            "timings": {
+                name: {**timing, "total_seconds": round(timing["total_seconds"], 6), "max_seconds": round(timing["max_seconds"], 6)}
+                for name, timing in self.timings.items()
+            },
+        }
+    
+    def to_prometheus(self, prefix: str = "trending_repos") -> str:
+        """Render every metric in the Prometheus text exposition format.
+        
+        Args:
+            prefix: Prefix added to every metric name
+        
+        Returns:
+            Prometheus text format
+        """
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            metric = _prometheus_name(prefix, name) + "_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+        for name, value in sorted(self.gauges.items()):
+            metric = _prometheus_name(prefix, name)
+            lines += [f"# TYPE {metric} gauge", f"{metric} {value}"]
+        for name, timing in sorted(self.timings.items()):
+            metric = _prometheus_name(prefix, name) + "_seconds"
+            lines += [
+                f"# TYPE {metric} summary",
+                f"{metric}_sum {timing['total_seconds']:.6f}",
+                f"{metric}_count {timing['count']}",
+                f"# TYPE {metric}_max gauge",
+                f"{metric}_max {timing['max_seconds']:.6f}",
+            ]
+        return "\n".join(lines) + "\n"
+    
+    def write_json(self, path: str) -> None:
+        """Write metrics as JSON.
+        
+        Args:
+            path: Output file path
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+    
+    def write_prometheus(self, path: str) -> None:
+        """Write metrics in the Prometheus text format.
+        
+        Args:
+            path: Output file path
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+
+
+def _prometheus_name(prefix: str, name: str) -> str:
+    """Turn a dotted metric name into a valid Prometheus metric name."""
+    return re.sub(r"[^a-zA-Z0-9_]", "_", f"{prefix}_{name}")
+
+
+# Create default metrics registry
+metrics = Metrics()
@@ -0,0 +1,140 @@
+"""Compact repository records shared across the pipeline."""
+
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern short, highly repeated strings such as languages and licenses."""
+    return sys.intern(value) if value else value
+
+
+@dataclass(slots=True)
+class Enrichment:
+    """Extra details fetched for a repository by the enrichment stage."""
+    
+    readme_excerpt: str = ""
+    latest_release: str = ""
+    release_url: str = ""
+    contributors: Optional[int] = None
+
+
+@dataclass(slots=True)
+class Repo:
+    """A repository as fetched from GitHub.
+    
+    Slotted so tens of thousands of records can stay resident for sweeps
+    and history ingestion; repeated strings are interned.
+    """
+    
+    full_name: str
+    name: str = ""
+    description: Optional[str] = None
+    language: Optional[str] = None
+    stars: int = 0
+    forks: int = 0
+    stars_today: int = 0
+    url: str = ""
+    created_at: str = ""
+    updated_at: str = ""
+    pushed_at: str = ""
+    topics: Tuple[str, ...] = ()
+    license: str = ""
+    owner_login: str = ""
+    owner_avatar_url: str = ""
+    enrichment: Optional[Enrichment] = None
+    # "trending" for repos scraped from the trending page, "search" for search candidates
+    source: str = "trending"
+    
+    def __post_init__(self):
+        self.language = _intern(self.language)
+        self.license = _intern(self.license)
+        self.topics = tuple(sys.intern(topic) for topic in self.topics)
+    
+    @property
+    def key(self) -> str:
+        """Case-insensitive identity of the repository."""
+        return self.full_name.lower()
+
+
+@dataclass(slots=True)
+class FormattedRepo:
+    """A ranked repository in a digest, formatted lazily at render time."""
+    
+    repo: Repo
+    rank: int
+    trend: str = ""
+    is_new: bool = False  # first appearance on the list since the previous run
+    
+    @property
+    def name(self) -> str:
+        return self.repo.name or "Unknown"
+    
+    @property
+    def full_name(self) -> str:
+        return self.repo.full_name or "Unknown"
+    
+    @property
+    def url(self) -> str:
+        return self.repo.url
+    
+    @property
+    def description(self) -> str:
+        description = self.repo.description or "No description available"
+        if len(description) > 150:
+            description = description[:147] + "..."
+        return description
+    
+    @property
+    def language(self) -> str:
+        return self.repo.language or "Unknown"
+    
+    @property
+    def stars(self) -> str:
+        return f"{self.repo.stars:,}"
+    
+    @property
+    def forks(self) -> str:
+        return f"{self.repo.forks:,}"
+    
+    @property
+    def created_date(self) -> str:
+        if not self.repo.created_at:
+            return ""
+        try:
+            created_dt = datetime.fromisoformat(self.repo.created_at.replace("Z", "+00:00"))
+            return created_dt.strftime("%B %Y")
+        except ValueError:
+            return "Unknown"
+    
+    @property
+    def topics(self) -> Tuple[str, ...]:
+        return self.repo.topics[:5]
+    
+    @property
+    def license(self) -> str:
+        return self.repo.license or "No license"
+    
+    @property
+    def owner_name(self) -> str:
+        return self.repo.owner_login or "Unknown"
+    
+    @property
+    def owner_avatar(self) -> str:
+        return self.repo.owner_avatar_url
+    
+    @property
+    def readme_excerpt(self) -> str:
+        return self.repo.enrichment.readme_excerpt if self.repo.enrichment else ""
+    
+    @property
+    def latest_release(self) -> str:
+        return self.repo.enrichment.latest_release if self.repo.enrichment else ""
+    
+    @property
+    def contributors(self) -> str:
+        if not self.repo.enrichment or self.repo.enrichment.contributors is None:
+            return ""
+        return f"{self.repo.enrichment.contributors:,}"
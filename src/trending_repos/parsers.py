@@ -0,0 +1,230 @@
+"""Parsers that extract repositories from the GitHub trending page."""
+
+import re
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple
+
+from .models import Repo
+
+
+def _parse_count(text: str) -> int:
+    """Parse a human-formatted count such as "12,345" or "1,024 stars today".
+    
+    Args:
+        text: Text containing a number
+    
+    Returns:
+        The first number in the text, or 0 if there is none
+    """
+    match = re.search(r"\d[\d,]*", text)
+    return int(match.group().replace(",", "")) if match else 0
+
+
+def _make_entry(
+    full_name: str,
+    description: str,
+    language: str,
+    stars: str,
+    forks: str,
+    stars_today: str
+) -> Repo:
+    """Build a repository record from the text scraped for one article.
+    
+    Fields the page doesn't carry are left empty, so entries can be used
+    without an API call.
+    """
+    owner, _, name = full_name.partition("/")
+    return Repo(
+        name=name,
+        full_name=full_name,
+        description=description or None,
+        language=language or None,
+        stars=_parse_count(stars),
+        forks=_parse_count(forks),
+        stars_today=_parse_count(stars_today),
+        url=f"https://github.com/{full_name}",
+        owner_login=owner
+    )
+
+
+def _element_text(element) -> str:
+    """Text of a BeautifulSoup element with whitespace collapsed.
+    
+    Text nodes are joined and runs of whitespace reduced to one space, exactly
+    as the streaming parser does, so both parsers yield the same records.
+    """
+    return " ".join(element.get_text().split()) if element else ""
+
+
+class TrendingPageParser:
+    """Interface for trending page parsers."""
+    
+    def parse(self, html: str, limit: int = 10) -> List[Repo]:
+        """Extract ranked repositories from a trending page.
+        
+        Args:
+            html: Trending page HTML
+            limit: Maximum number of repositories to return
+        
+        Returns:
+            Repository records in trending-rank order
+        """
+        raise NotImplementedError
+
+
+class SoupTrendingParser(TrendingPageParser):
+    """Parser that builds a full BeautifulSoup tree of the page."""
+    
+    def parse(self, html: str, limit: int = 10) -> List[Repo]:
+        from bs4 import BeautifulSoup
+        
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        entries = []
+        for article in soup.find_all('article', class_='Box-row')[:limit]:
+            heading = article.find('h2', class_='h3 lh-condensed')
+            link = heading.find('a') if heading else None
+            if not link:
+                continue
+            
+            description = article.find('p')
+            language = article.find('span', itemprop='programmingLanguage')
+            stars = article.find('a', href=re.compile(r'/stargazers$'))
+            forks = article.find('a', href=re.compile(r'/(forks|network/members)$'))
+            stars_today = article.find('span', class_='float-sm-right')
+            
+            entries.append(_make_entry(
+                full_name=link.get('href').strip('/'),
+                description=_element_text(description),
+                language=_element_text(language),
+                stars=_element_text(stars),
+                forks=_element_text(forks),
+                stars_today=_element_text(stars_today)
+            ))
+        
+        return entries
+
+
+class _StopParsing(Exception):
+    """Raised from a parser callback once enough articles have been read."""
+
+
+class _TrendingEventHandler(HTMLParser):
+    """HTMLParser callbacks that collect fields from each trending article."""
+    
+    def __init__(self, limit: int):
+        super().__init__(convert_charrefs=True)
+        self.limit = limit
+        self.entries: List[Repo] = []
+        self._article: Optional[Dict[str, str]] = None
+        self._in_heading = False
+        # Field currently being captured: (field name, tag, nesting depth)
+        self._capture: Optional[Tuple[str, str, int]] = None
+        self._text: List[str] = []
+    
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        attributes = dict(attrs)
+        classes = (attributes.get("class") or "").split()
+        
+        if tag == "article" and "Box-row" in classes:
+            self._article = {}
+            return
+        if self._article is None:
+            return
+        
+        if self._capture:
+            field, capture_tag, depth = self._capture
+            if tag == capture_tag:
+                self._capture = (field, capture_tag, depth + 1)
+            return
+        
+        href = attributes.get("href") or ""
+        if tag == "h2" and "lh-condensed" in classes:
+            self._in_heading = True
+        elif tag == "a" and self._in_heading and "full_name" not in self._article:
+            self._article["full_name"] = href.strip("/")
+        elif tag == "p" and "description" not in self._article:
+            self._start_capture("description", tag)
+        elif tag == "span" and attributes.get("itemprop") == "programmingLanguage":
+            self._start_capture("language", tag)
+        elif tag == "a" and href.endswith("/stargazers"):
+            self._start_capture("stars", tag)
+        elif tag == "a" and (href.endswith("/forks") or href.endswith("/network/members")):
+            self._start_capture("forks", tag)
+        elif tag == "span" and "float-sm-right" in classes:
+            self._start_capture("stars_today", tag)
+    
+    def handle_endtag(self, tag: str) -> None:
+        if self._article is None:
+            return
+        
+        if self._capture:
+            field, capture_tag, depth = self._capture
+            if tag == capture_tag:
+                if depth > 0:
+                    self._capture = (field, capture_tag, depth - 1)
+                else:
+                    self._article[field] = " ".join("".join(self._text).split())
+                    self._capture = None
+            return
+        
+        if tag == "h2":
+            self._in_heading = False
+        elif tag == "article":
+            article, self._article = self._article, None
+            if article.get("full_name"):
+                self.entries.append(_make_entry(
+                    full_name=article["full_name"],
+                    description=article.get("description", ""),
+                    language=article.get("language", ""),
+                    stars=article.get("stars", ""),
+                    forks=article.get("forks", ""),
+                    stars_today=article.get("stars_today", "")
+                ))
+            if len(self.entries) >= self.limit:
+                raise _StopParsing()
+    
+    def handle_data(self, data: str) -> None:
+        if self._capture:
+            self._text.append(data)
+    
+    def _start_capture(self, field: str, tag: str) -> None:
+        self._capture = (field, tag, 0)
+        self._text = []
+
+
+class StreamingTrendingParser(TrendingPageParser):
+    """Event-based parser that keeps no tree and stops after the last wanted article."""
+    
+    def parse(self, html: str, limit: int = 10) -> List[Repo]:
+        handler = _TrendingEventHandler(limit)
+        try:
+            handler.feed(html)
+            handler.close()
+        except _StopParsing:
+            pass
+        return handler.entries
+
+
+PARSERS = {
+    "streaming": StreamingTrendingParser,
+    "soup": SoupTrendingParser,
+}
+
+
+def get_parser(name: str) -> TrendingPageParser:
+    """Create a trending page parser by name.
+    
+    Args:
+        name: Parser name, "streaming" or "soup"
+    
+    Returns:
+        Parser instance
+    
+    Raises:
+        ValueError: If the name is unknown
+    """
+    try:
+        return PARSERS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown trending parser: {name}") from None
@@ -0,0 +1,216 @@
+"""Rate-limit-aware request scheduling for the GitHub API."""
+
+import asyncio
+import random
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+from .metrics import metrics
+
+
+# Status codes worth retrying with backoff: server hiccups and secondary rate limits
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _rate_limit_resource(url: str) -> Optional[str]:
+    """Guess which GitHub rate-limit bucket a request is charged to.
+    
+    Args:
+        url: Request URL
+    
+    Returns:
+        "core", "search" or "graphql" for API requests, None for github.com pages
+    """
+    parsed = urlparse(url)
+    if parsed.hostname != "api.github.com":
+        return None
+    if parsed.path.startswith("/graphql"):
+        return "graphql"
+    if parsed.path.startswith("/search/"):
+        return "search"
+    return "core"
+
+
+class RateLimitScheduler:
+    """Paces requests against GitHub's rate limits and retries transient failures.
+    
+    The scheduler reads X-RateLimit-Remaining / X-RateLimit-Reset from every
+    response, spreads the remaining budget over the time left in the window
+    once it runs low, honours Retry-After, and retries transport errors and
+    retryable status codes with jittered exponential backoff.
+    """
+    
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        max_wait: float = 300.0,
+        pace_threshold: int = 50
+    ):
+        """Initialize the scheduler.
+        
+        Args:
+            max_retries: Retries per request after the first attempt
+            base_delay: Initial backoff delay in seconds
+            max_delay: Upper bound for a single backoff delay
+            max_wait: Longest wait for a rate-limit reset before giving up
+            pace_threshold: Remaining budget below which requests are spread out
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_wait = max_wait
+        self.pace_threshold = pace_threshold
+        
+        self.throttled_seconds = 0.0
+        self.retries = 0
+        
+        # resource -> (remaining, reset epoch seconds)
+        self._budgets: Dict[str, Tuple[int, float]] = {}
+        self._next_slot: Dict[str, float] = {}
+        self._lock = asyncio.Lock()
+    
+    async def request(self, client: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request, waiting for budget and retrying transient failures.
+        
+        Args:
+            client: HTTP client instance
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to httpx.AsyncClient.request
+        
+        Returns:
+            The final response; error statuses are returned, not raised
+        
+        Raises:
+            httpx.TransportError: If the request still fails after all retries
+        """
+        resource = _rate_limit_resource(url)
+        
+        for attempt in range(self.max_retries + 1):
+            await self._pace(resource)
+            
+            metrics.incr("http.requests")
+            try:
+                with metrics.span(f"http.{resource or 'page'}"):
+                    response = await client.request(method, url, **kwargs)
+            except httpx.TransportError:
+                metrics.incr("http.errors")
+                if attempt == self.max_retries:
+                    raise
+                self._record_retry()
+                await self._sleep(self._backoff(attempt))
+                continue
+            
+            metrics.incr("http.bytes", len(response.content))
+            self._update_budget(resource, response)
+            
+            delay = self._retry_delay(response, attempt)
+            if delay is None or attempt == self.max_retries:
+                return response
+            
+            self._record_retry()
+            await self._sleep(delay)
+        
+        return response
+    
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Counters describing time spent throttled and retries made."""
+        return {
+            "throttled_seconds": round(self.throttled_seconds, 3),
+            "retries": self.retries,
+        }
+    
+    async def _pace(self, resource: Optional[str]) -> None:
+        """Wait until the budget for a resource allows another request."""
+        if resource is None:
+            return
+        
+        async with self._lock:
+            budget = self._budgets.get(resource)
+            if budget is None:
+                return
+            
+            now = time.time()
+            remaining, reset_at = budget
+            if reset_at <= now:
+                del self._budgets[resource]
+                return
+            
+            delay = 0.0
+            if remaining <= 0:
+                delay = reset_at - now
+            elif remaining < self.pace_threshold:
+                # Spread what is left evenly over the rest of the window
+                interval = (reset_at - now) / remaining
+                next_slot = max(now, self._next_slot.get(resource, now))
+                delay = next_slot - now
+                self._next_slot[resource] = next_slot + interval
+            
+            # Count this request now so concurrent callers see the reduced budget
+            self._budgets[resource] = (remaining - 1, reset_at)
+        
+        if delay > self.max_wait:
+            print(f"Rate limit for {resource} resets in {delay:.0f}s, not waiting")
+            return
+        if delay > 0:
+            await self._sleep(delay)
+    
+    def _update_budget(self, resource: Optional[str], response: httpx.Response) -> None:
+        """Record the budget reported by the response headers."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        
+        resource = response.headers.get("X-RateLimit-Resource", resource)
+        if resource:
+            self._budgets[resource] = (int(remaining), float(reset))
+    
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> Optional[float]:
+        """Decide whether a response should be retried and after how long.
+        
+        Args:
+            response: Response to inspect
+            attempt: Zero-based attempt number
+        
+        Returns:
+            Seconds to wait before retrying, or None if the response is final
+        """
+        retry_after = response.headers.get("Retry-After")
+        rate_limited = response.status_code in (403, 429) and (
+            retry_after is not None or response.headers.get("X-RateLimit-Remaining") == "0"
+        )
+        
+        if rate_limited:
+            if retry_after is not None:
+                delay = float(retry_after)
+            else:
+                delay = float(response.headers.get("X-RateLimit-Reset", 0)) - time.time() + 1
+            # Waiting for a long primary-limit reset is not worth holding the run
+            return max(delay, 0.0) if delay <= self.max_wait else None
+        
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            return self._backoff(attempt)
+        
+        return None
+    
+    def _record_retry(self) -> None:
+        """Count a retry locally and in the metrics registry."""
+        self.retries += 1
+        metrics.incr("http.retries")
+    
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay for an attempt."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+    
+    async def _sleep(self, seconds: float) -> None:
+        """Sleep and count the time as throttled."""
+        self.throttled_seconds += seconds
+        metrics.incr("http.throttled_seconds", seconds)
+        await asyncio.sleep(seconds)
@@ -0,0 +1,310 @@
+"""Digest rendering with precompiled templates."""
+
+import re
+from html import escape
+from string import Template
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
+
+if TYPE_CHECKING:
+    from .models import FormattedRepo
+
+
+# Inline styles are required by most email clients; they live here once
+# instead of being repeated in every f-string
+MUTED = "color: #656d76;"
+CARD = "background: white; border-radius: 8px; border: 1px solid #e1e4e8;"
+LINK = "color: #0969da; text-decoration: none;"
+
+HTML_PAGE = Template(f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>GitHub Trending Repos</title>
+</head>
+<body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif; line-height: 1.6; color: #24292f; max-width: 800px; margin: 0 auto; padding: 20px; background: #f6f8fa;">
+    <div style="text-align: center; margin-bottom: 32px; padding: 24px; {CARD}">
+        <h1 style="color: #24292f; margin: 0 0 8px 0;">📈 GitHub Trending Repositories</h1>
+        <p style="{MUTED} margin: 0; font-size: 16px;">$subtitle</p>
+    </div>
+    <div style="padding: 24px; margin-bottom: 24px; {CARD}">
+        <h2 style="color: #24292f; margin: 0 0 16px 0;">📊 Summary</h2>
+        <div style="{MUTED} line-height: 1.6;">$summary</div>
+    </div>
+    <div>
+        <h2 style="color: #24292f; margin: 0 0 20px 0;">🔥 Top Trending Repositories</h2>
+$repos
+    </div>$still_trending
+    <div style="text-align: center; margin-top: 32px; padding: 16px; {CARD}">
+        <p style="{MUTED} margin: 0; font-size: 14px;">
+            Generated by <a href="https://github.com/vanducng/github-trending-repos" style="color: #0969da;">GitHub Trending Repos</a>
+        </p>
+    </div>
+</body>
+</html>
+""")
+
+HTML_REPO = Template(f"""        <div style="padding: 20px; margin-bottom: 20px; {CARD}">
+            <h3 style="margin: 0 0 12px 0; color: #24292f;"><a href="$url" style="{LINK}">#$rank $full_name</a></h3>
+            <p style="{MUTED} margin: 8px 0; line-height: 1.5;">$description</p>
+            <div style="margin: 12px 0;">$topics</div>
+            <div style="font-size: 14px; {MUTED}">$stats</div>$extra
+        </div>
+""")
+
+HTML_STILL_TRENDING = Template(f"""
+    <div style="padding: 24px; margin-top: 20px; {CARD}">
+        <h2 style="color: #24292f; margin: 0 0 12px 0;">🔁 Still Trending</h2>
+        <ul style="{MUTED} margin: 0; padding-left: 20px;">
+$items
+        </ul>
+    </div>""")
+
+HTML_STILL_TRENDING_ITEM = Template(
+    f'            <li><a href="$url" style="{LINK}">$full_name</a> · ⭐ $stars$trend</li>\n'
+)
+
+HTML_TOPIC = Template(
+    '<span style="background: #f1f8ff; color: #0969da; padding: 2px 6px; border-radius: 12px; '
+    'font-size: 12px; margin-right: 4px;">$topic</span>'
+)
+
+HTML_STAT = Template('<span style="margin-right: 16px;">$stat</span>')
+
+HTML_NOTE = Template(f'\n            <p style="{MUTED} margin: 8px 0 0 0; font-size: 14px;">$note</p>')
+
+TEXT_PAGE = Template("""GitHub Trending Repositories - $title
+
+$summary
+
+Top Trending Repositories:
+$rule
+$repos
+$still_trending
+Generated by GitHub Trending Repos
+https://github.com/vanducng/github-trending-repos
+""")
+
+TEXT_REPO = Template("""
+#$rank $full_name
+$url
+
+$description
+
+$stats$extra
+$separator""")
+
+MARKDOWN_INLINE = [
+    (re.compile(r"\*\*(.+?)\*\*"), r"<strong>\1</strong>"),
+    (re.compile(r"(?<!\*)\*(?!\s)(.+?)(?<!\s)\*(?!\*)"), r"<em>\1</em>"),
+    (re.compile(r"`([^`]+)`"), r"<code>\1</code>"),
+    (re.compile(r"\[([^\]]+)\]\((https?://[^)\s]+)\)"), r'<a href="\2" style="color: #0969da;">\1</a>'),
+]
+
+
+def markdown_to_html(text: str) -> str:
+    """Convert the small markdown subset used in summary text to HTML.
+    
+    Supports **bold**, *italic*, `code` and [links](https://...). Paragraphs
+    are separated by blank lines and single newlines become line breaks.
+    Everything else is HTML-escaped.
+    
+    Args:
+        text: Markdown text
+    
+    Returns:
+        HTML fragment
+    """
+    paragraphs = []
+    for paragraph in re.split(r"\n\s*\n", text.strip()):
+        html = escape(paragraph, quote=False)
+        for pattern, replacement in MARKDOWN_INLINE:
+            html = pattern.sub(replacement, html)
+        paragraphs.append(html.replace("\n", "<br>"))
+    return "<br><br>".join(paragraphs)
+
+
+def _has_value(value: Any) -> bool:
+    """Check whether a formatted field has something worth showing."""
+    return bool(value) and value != "Unknown"
+
+
+class DigestRenderer:
+    """Renders summaries into HTML and plain-text digests."""
+    
+    def render_html(self, summary: Dict[str, Any]) -> str:
+        """Render the HTML digest.
+        
+        Args:
+            summary: Summary produced by RepoSummarizer.create_summary
+        
+        Returns:
+            HTML document
+        """
+        subtitle = summary.get("date", "")
+        if summary.get("label"):
+            subtitle += f" · {summary['label']}"
+        
+        return HTML_PAGE.substitute(
+            subtitle=escape(subtitle),
+            summary=markdown_to_html(summary.get("summary_text", "")),
+            repos=self.render_repos_html(summary),
+            still_trending=self.render_still_trending_html(summary.get("still_trending", [])),
+        )
+    
+    def render_text(self, summary: Dict[str, Any]) -> str:
+        """Render the plain-text digest.
+        
+        Args:
+            summary: Summary produced by RepoSummarizer.create_summary
+        
+        Returns:
+            Plain-text document
+        """
+        title = summary.get("date", "")
+        if summary.get("label"):
+            title += f" ({summary['label']})"
+        
+        return TEXT_PAGE.substitute(
+            title=title,
+            summary=summary.get("summary_text", ""),
+            rule="=" * 50,
+            repos="".join(self._fragments(summary, "text_fragments", self.render_repo_text)),
+            still_trending=self.render_still_trending_text(summary.get("still_trending", [])),
+        )
+    
+    def render_repos_html(self, summary: Dict[str, Any]) -> str:
+        """Render the repository cards of a digest, reusing pre-rendered ones.
+        
+        Args:
+            summary: Summary produced by RepoSummarizer.create_summary
+        
+        Returns:
+            HTML fragment
+        """
+        return "".join(self._fragments(summary, "html_fragments", self.render_repo_html))
+    
+    def _fragments(self, summary: Dict[str, Any], key: str, render: Callable[["FormattedRepo"], str]) -> List[str]:
+        """Use the fragments a SummaryAccumulator rendered on arrival, or render them now."""
+        if key in summary:
+            return summary[key]
+        return [render(repo) for repo in summary.get("repos", [])]
+    
+    def render_repo_html(self, repo: "FormattedRepo") -> str:
+        """Render one repository card.
+        
+        Args:
+            repo: Formatted repository from the summary
+        
+        Returns:
+            HTML fragment
+        """
+        topics = "".join([
+            HTML_TOPIC.substitute(topic=escape(topic))
+            for topic in repo.topics[:3]  # Limit to 3 topics
+        ])
+        
+        stats = [f"⭐ {repo.stars} stars", f"🍴 {repo.forks} forks"]
+        if _has_value(repo.language):
+            stats.append(f"💻 {escape(repo.language)}")
+        created_date = repo.created_date
+        if _has_value(created_date):
+            stats.append(f"📅 Created {created_date}")
+        if repo.latest_release:
+            stats.append(f"🏷️ {escape(repo.latest_release)}")
+        if repo.contributors:
+            stats.append(f"👥 {repo.contributors} contributors")
+        
+        extra = ""
+        if repo.readme_excerpt:
+            extra += HTML_NOTE.substitute(note=escape(repo.readme_excerpt))
+        if repo.trend:
+            extra += HTML_NOTE.substitute(note=escape(repo.trend))
+        
+        return HTML_REPO.substitute(
+            url=escape(repo.url),
+            rank=repo.rank,
+            full_name=escape(repo.full_name),
+            description=escape(repo.description),
+            topics=topics,
+            stats="".join([HTML_STAT.substitute(stat=stat) for stat in stats]),
+            extra=extra,
+        )
+    
+    def render_repo_text(self, repo: "FormattedRepo") -> str:
+        """Render one repository entry of the plain-text digest.
+        
+        Args:
+            repo: Formatted repository from the summary
+        
+        Returns:
+            Plain-text fragment
+        """
+        stats = [f"⭐ {repo.stars} stars", f"🍴 {repo.forks} forks"]
+        if _has_value(repo.language):
+            stats.append(f"💻 {repo.language}")
+        created_date = repo.created_date
+        if _has_value(created_date):
+            stats.append(f"📅 Created {created_date}")
+        if repo.latest_release:
+            stats.append(f"🏷️ {repo.latest_release}")
+        if repo.contributors:
+            stats.append(f"👥 {repo.contributors} contributors")
+        
+        extra: List[str] = []
+        if repo.readme_excerpt:
+            extra.append(f"\nREADME: {repo.readme_excerpt}")
+        if repo.topics:
+            extra.append(f"\nTopics: {', '.join(repo.topics)}")
+        if repo.trend:
+            extra.append(f"\nTrend: {repo.trend}")
+        
+        return TEXT_REPO.substitute(
+            rank=repo.rank,
+            full_name=repo.full_name,
+            url=repo.url,
+            description=repo.description,
+            stats=" | ".join(stats),
+            extra="".join(extra),
+            separator="-" * 50,
+        )
+    
+    def render_still_trending_html(self, repos: List["FormattedRepo"]) -> str:
+        """Render the compact section for repositories the recipient already got.
+        
+        Args:
+            repos: Repeated repositories, empty for no section
+        
+        Returns:
+            HTML fragment
+        """
+        if not repos:
+            return ""
+        return HTML_STILL_TRENDING.substitute(items="".join([
+            HTML_STILL_TRENDING_ITEM.substitute(
+                url=escape(repo.url),
+                full_name=escape(repo.full_name),
+                stars=repo.stars,
+                trend=f" · {escape(repo.trend)}" if repo.trend else "",
+            )
+            for repo in repos
+        ]).rstrip("\n"))
+    
+    def render_still_trending_text(self, repos: List["FormattedRepo"]) -> str:
+        """Render the plain-text still-trending section.
+        
+        Args:
+            repos: Repeated repositories, empty for no section
+        
+        Returns:
+            Plain-text fragment
+        """
+        if not repos:
+            return ""
+        lines = ["", "Still Trending:"]
+        for repo in repos:
+            line = f"- {repo.full_name} ({repo.stars} stars) {repo.url}"
+            if repo.trend:
+                line += f" · {repo.trend}"
+            lines.append(line)
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,184 @@
+"""Repository scoring and ranking strategies."""
+
+import importlib.util
+import math
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence
+
+from .models import Repo
+
+
+# Scores are computed with NumPy when it is installed, in pure Python otherwise
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+# Days covered by each trending period, used to turn "stars today" into stars per day
+PERIOD_DAYS = {"daily": 1, "weekly": 7, "monthly": 30}
+
+# Age assumed for repositories without a creation date
+DEFAULT_AGE_DAYS = 365.0
+
+# Weight of each normalized feature in the final score
+WEIGHTS = {
+    "velocity": 0.4,     # stars gained per day in the trending period
+    "growth": 0.3,       # total stars per day of age
+    "forks": 0.1,        # forks per star, a sign of people building on it
+    "persistence": 0.2,  # days seen on the trending list
+}
+
+
+def score_repos(
+    repos: Sequence[Repo],
+    days_trending: Optional[Sequence[int]] = None,
+    period: str = "daily",
+    now: Optional[datetime] = None,
+    weights: Dict[str, float] = WEIGHTS
+) -> List[float]:
+    """Score repositories by star velocity, growth, fork ratio and persistence.
+    
+    Each feature is log-scaled where it is heavy-tailed, normalized to 0..1
+    across the candidate set and weighted. Features are extracted into
+    columns once and the math runs over whole columns.
+    
+    Args:
+        repos: Candidate repositories
+        days_trending: Days each repository has been on the list, from history
+        period: Trending period the stars_today counts cover
+        now: Reference time for repository ages, defaults to the current time
+        weights: Weight of each feature
+    
+    Returns:
+        One score per repository, higher is better
+    """
+    if not repos:
+        return []
+    
+    now = now or datetime.now(timezone.utc)
+    columns = {
+        "stars": [repo.stars for repo in repos],
+        "forks": [repo.forks for repo in repos],
+        "stars_today": [repo.stars_today for repo in repos],
+        "created_at": [repo.created_at for repo in repos],
+        "days_trending": list(days_trending) if days_trending is not None else [1] * len(repos),
+    }
+    period_days = PERIOD_DAYS.get(period, 1)
+    
+    if NUMPY_AVAILABLE:
+        return _score_numpy(columns, period_days, now, weights)
+    return _score_python(columns, period_days, now, weights)
+
+
+def _score_numpy(columns: Dict[str, list], period_days: int, now: datetime, weights: Dict[str, float]) -> List[float]:
+    """Vectorized scoring over feature columns."""
+    import numpy as np
+    
+    stars = np.asarray(columns["stars"], dtype=np.float64)
+    forks = np.asarray(columns["forks"], dtype=np.float64)
+    stars_today = np.asarray(columns["stars_today"], dtype=np.float64)
+    days_trending = np.asarray(columns["days_trending"], dtype=np.float64)
+    
+    # ISO timestamps parse in bulk; empty strings become NaT
+    created = np.array([value.rstrip("Z") for value in columns["created_at"]], dtype="datetime64[s]")
+    reference = np.datetime64(now.astimezone(timezone.utc).replace(tzinfo=None), "s")
+    age_days = (reference - created) / np.timedelta64(1, "D")
+    age_days = np.maximum(np.where(np.isnan(age_days), DEFAULT_AGE_DAYS, age_days), 1.0)
+    
+    features = {
+        "velocity": np.log1p(stars_today / period_days),
+        "growth": np.log1p(stars / age_days),
+        "forks": np.clip(forks / np.maximum(stars, 1.0), 0.0, 1.0),
+        "persistence": np.log1p(days_trending),
+    }
+    
+    score = np.zeros(len(stars))
+    for name, values in features.items():
+        peak = values.max()
+        if peak > 0:
+            score += weights.get(name, 0.0) * values / peak
+    return score.tolist()
+
+
+def _score_python(columns: Dict[str, list], period_days: int, now: datetime, weights: Dict[str, float]) -> List[float]:
+    """Pure-Python scoring with the same math as _score_numpy."""
+    ages = []
+    for value in columns["created_at"]:
+        try:
+            created = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            age = (now - created).total_seconds() / 86400
+        except (ValueError, TypeError):
+            age = DEFAULT_AGE_DAYS
+        ages.append(max(age, 1.0))
+    
+    features = {
+        "velocity": [math.log1p(s / period_days) for s in columns["stars_today"]],
+        "growth": [math.log1p(s / age) for s, age in zip(columns["stars"], ages)],
+        "forks": [min(max(f / max(s, 1), 0.0), 1.0) for f, s in zip(columns["forks"], columns["stars"])],
+        "persistence": [math.log1p(d) for d in columns["days_trending"]],
+    }
+    
+    score = [0.0] * len(ages)
+    for name, values in features.items():
+        peak = max(values)
+        if peak > 0:
+            weight = weights.get(name, 0.0) / peak
+            score = [total + weight * value for total, value in zip(score, values)]
+    return score
+
+
+class RankingStrategy:
+    """Orders the repositories of a digest."""
+    
+    def order(self, repos: Sequence[Repo], days_trending: Sequence[int], period: str = "daily") -> List[int]:
+        """Decide the digest order.
+        
+        Args:
+            repos: Repositories in trending-rank order
+            days_trending: Days each repository has been on the list
+            period: Trending period of the list
+        
+        Returns:
+            Indices into repos, best first
+        """
+        raise NotImplementedError
+
+
+class TrendingOrder(RankingStrategy):
+    """Keeps GitHub's trending order."""
+    
+    def order(self, repos: Sequence[Repo], days_trending: Sequence[int], period: str = "daily") -> List[int]:
+        return list(range(len(repos)))
+
+
+class ScoreRanking(RankingStrategy):
+    """Orders repositories by score_repos, ties keeping trending order."""
+    
+    def __init__(self, weights: Dict[str, float] = WEIGHTS):
+        self.weights = weights
+    
+    def order(self, repos: Sequence[Repo], days_trending: Sequence[int], period: str = "daily") -> List[int]:
+        scores = score_repos(repos, days_trending, period, weights=self.weights)
+        # sorted() is stable, so equal scores keep their trending rank
+        return sorted(range(len(repos)), key=lambda i: -scores[i])
+
+
+RANKINGS = {
+    "trending": TrendingOrder,
+    "score": ScoreRanking,
+}
+
+
+def get_ranking(name: str) -> RankingStrategy:
+    """Create a ranking strategy by name.
+    
+    Args:
+        name: Strategy name, "trending" or "score"
+    
+    Returns:
+        Ranking strategy instance
+    
+    Raises:
+        ValueError: If the name is unknown
+    """
+    try:
+        return RANKINGS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown ranking strategy: {name}") from None
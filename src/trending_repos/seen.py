@@ -0,0 +1,125 @@
+"""Per-recipient index of repositories already sent."""
+
+import os
+import sqlite3
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Set
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen (
+    recipient TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    sent_date TEXT NOT NULL,
+    PRIMARY KEY (recipient, repo)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_seen_sent_date ON seen (sent_date);
+"""
+
+# Keeps IN (...) lists well under SQLite's bound-parameter limit
+QUERY_CHUNK_SIZE = 500
+
+
+class SeenIndex:
+    """SQLite set of (recipient, repository) pairs with the date each was sent.
+    
+    The table is clustered on its (recipient, repo) primary key, so a
+    membership test is a single index probe whatever the number of pairs.
+    Entries older than the window are treated as unseen and pruned by
+    expire(), so a repository comes back in full once the window has passed.
+    """
+    
+    def __init__(self, path: str, window_days: int = 7):
+        """Open (or create) the index.
+        
+        Args:
+            path: Path of the SQLite database file
+            window_days: Days a sent repository counts as seen
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self.window_days = window_days
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+    
+    def seen(self, recipients: Iterable[str], repo_keys: Iterable[str], today: str) -> Dict[str, Set[str]]:
+        """Find which repositories each recipient was sent within the window.
+        
+        Args:
+            recipients: Recipient email addresses
+            repo_keys: Lower-cased repository full names
+            today: Current date as YYYY-MM-DD
+        
+        Returns:
+            Seen repository keys per lower-cased recipient (recipients with
+            nothing seen are omitted)
+        """
+        recipients = sorted({recipient.lower() for recipient in recipients})
+        repo_keys = sorted(set(repo_keys))
+        if not recipients or not repo_keys:
+            return {}
+        
+        result: Dict[str, Set[str]] = {}
+        repo_placeholders = ", ".join("?" for _ in repo_keys)
+        for chunk in _chunks(recipients):
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = self._conn.execute(
+                f"""
+                SELECT recipient, repo FROM seen
+                WHERE recipient IN ({placeholders}) AND repo IN ({repo_placeholders}) AND sent_date > ?
+                """,
+                [*chunk, *repo_keys, self._cutoff(today)],
+            )
+            for recipient, repo in rows:
+                result.setdefault(recipient, set()).add(repo)
+        return result
+    
+    def mark_sent(self, recipients: Iterable[str], repo_keys: Iterable[str], today: str) -> None:
+        """Record that repositories were sent to recipients today.
+        
+        Args:
+            recipients: Recipient email addresses
+            repo_keys: Lower-cased repository full names
+            today: Current date as YYYY-MM-DD
+        """
+        repo_keys = list(repo_keys)
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO seen (recipient, repo, sent_date) VALUES (?, ?, ?)
+                ON CONFLICT (recipient, repo) DO UPDATE SET sent_date = excluded.sent_date
+                """,
+                [(recipient.lower(), repo, today) for recipient in recipients for repo in repo_keys],
+            )
+    
+    def expire(self, today: str) -> int:
+        """Delete entries that have left the window.
+        
+        Args:
+            today: Current date as YYYY-MM-DD
+        
+        Returns:
+            Number of entries deleted
+        """
+        with self._conn:
+            cursor = self._conn.execute("DELETE FROM seen WHERE sent_date <= ?", (self._cutoff(today),))
+        return cursor.rowcount
+    
+    def _cutoff(self, today: str) -> str:
+        """Latest sent_date that no longer counts as seen."""
+        return (date.fromisoformat(today) - timedelta(days=self.window_days)).isoformat()
+
+
+def _chunks(values: List[str]) -> Iterable[List[str]]:
+    """Split values into lists of at most QUERY_CHUNK_SIZE."""
+    for i in range(0, len(values), QUERY_CHUNK_SIZE):
+        yield values[i:i + QUERY_CHUNK_SIZE]
@@ -0,0 +1,262 @@
+"""Multi-process sweeps: the (language, period) matrix sharded across a process pool."""
+
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional, Tuple
+
+from .logger import logger
+from .metrics import metrics
+from .models import Repo
+from .rate_limit import RateLimitScheduler
+
+if TYPE_CHECKING:
+    import httpx
+
+
+# Rate-limit buckets shared between processes, in slot order
+RESOURCES = ("core", "search", "graphql")
+
+ShardItem = Tuple[Tuple[str, str], int, Repo]
+
+
+class SharedBudget:
+    """GitHub rate-limit budgets in shared memory, one slot per resource.
+    
+    Every process draws from and reports to the same (remaining, reset)
+    pairs, so N workers together stay within the one budget a token has.
+    """
+    
+    def __init__(self, workers: int, context=None):
+        """Allocate the shared slots.
+        
+        Args:
+            workers: Number of processes drawing from the budget
+            context: multiprocessing context the worker processes are started with
+        """
+        context = context or multiprocessing.get_context()
+        self.workers = max(1, workers)
+        # remaining, reset epoch seconds per resource; a reset of 0 means unknown
+        self._values = context.Array("d", 2 * len(RESOURCES))
+    
+    def take(self, resource: str) -> Optional[Tuple[int, float]]:
+        """Claim one request from a resource's budget.
+        
+        Args:
+            resource: Rate-limit resource
+        
+        Returns:
+            (remaining, reset) before the claim, or None if the budget is unknown
+        """
+        if resource not in RESOURCES:
+            return None
+        
+        i = 2 * RESOURCES.index(resource)
+        with self._values.get_lock():
+            remaining, reset_at = self._values[i], self._values[i + 1]
+            if reset_at <= time.time():
+                return None
+            self._values[i] = remaining - 1
+        return int(remaining), reset_at
+    
+    def update(self, resource: str, remaining: int, reset_at: float) -> None:
+        """Report the budget seen in a response.
+        
+        Responses from different processes arrive out of order, so within a
+        window the lowest remaining count wins and a later window replaces it.
+        
+        Args:
+            resource: Rate-limit resource
+            remaining: Requests left in the window
+            reset_at: Epoch seconds when the window resets
+        """
+        if resource not in RESOURCES:
+            return
+        
+        i = 2 * RESOURCES.index(resource)
+        with self._values.get_lock():
+            if reset_at > self._values[i + 1]:
+                self._values[i], self._values[i + 1] = remaining, reset_at
+            elif reset_at == self._values[i + 1]:
+                self._values[i] = min(self._values[i], remaining)
+
+
+class SharedRateLimitScheduler(RateLimitScheduler):
+    """RateLimitScheduler whose budgets are shared with other processes.
+    
+    Each request claims from the shared budget, and once it runs low the
+    pacing interval is stretched by the number of workers, so the pool as
+    a whole spreads the remaining requests over the window.
+    """
+    
+    def __init__(self, budget: SharedBudget, **kwargs):
+        """Initialize the scheduler.
+        
+        Args:
+            budget: Budget shared by every process of the sweep
+            **kwargs: Passed through to RateLimitScheduler
+        """
+        super().__init__(**kwargs)
+        self.budget = budget
+    
+    async def _pace(self, resource: Optional[str]) -> None:
+        """Load this process's share of the shared budget, then pace as usual."""
+        shared = self.budget.take(resource) if resource else None
+        if shared:
+            remaining, reset_at = shared
+            share = -(-remaining // self.budget.workers) if remaining > 0 else remaining
+            self._budgets[resource] = (share, reset_at)
+        await super()._pace(resource)
+    
+    def _update_budget(self, resource: Optional[str], response: "httpx.Response") -> None:
+        """Record the budget locally and publish it to the other processes."""
+        super()._update_budget(resource, response)
+        resource = response.headers.get("X-RateLimit-Resource", resource)
+        if resource in self._budgets and "X-RateLimit-Remaining" in response.headers:
+            self.budget.update(resource, *self._budgets[resource])
+
+
+def shard_combinations(combinations: List[Tuple[str, str]], shards: int) -> List[List[Tuple[str, str]]]:
+    """Split combinations into near-equal shards.
+    
+    Combinations are grouped by language first, so the periods of one
+    language (which share most repositories) usually land in one shard and
+    their details are fetched once.
+    
+    Args:
+        combinations: (language, period) pairs
+        shards: Maximum number of shards
+    
+    Returns:
+        Non-empty lists of combinations
+    """
+    ordered = sorted(combinations, key=lambda combination: combination[0])
+    shards = max(1, min(shards, len(ordered)))
+    size, extra = divmod(len(ordered), shards)
+    
+    result, start = [], 0
+    for i in range(shards):
+        end = start + size + (1 if i < extra else 0)
+        result.append(ordered[start:end])
+        start = end
+    return [shard for shard in result if shard]
+
+
+# Set in each worker process by _init_worker
+_budget: Optional[SharedBudget] = None
+
+
+def _init_worker(budget: SharedBudget) -> None:
+    """Keep the shared budget for the shards this process runs."""
+    global _budget
+    _budget = budget
+
+
+def _run_shard(
+    combinations: List[Tuple[str, str]],
+    record_dir: Optional[str],
+    replay_dir: Optional[str],
+    latency: float
+) -> Tuple[List[ShardItem], Dict]:
+    """Fetch one shard in a worker process, on its own event loop.
+    
+    Returns:
+        Tuple of (items in completion order, the shard's metrics snapshot)
+    """
+    metrics.reset()
+    items = asyncio.run(_fetch_shard(combinations, record_dir, replay_dir, latency))
+    return items, metrics.to_dict()
+
+
+async def _fetch_shard(
+    combinations: List[Tuple[str, str]],
+    record_dir: Optional[str],
+    replay_dir: Optional[str],
+    latency: float
+) -> List[ShardItem]:
+    """Fetch a shard with a GitHubClient configured like the parent's.
+    
+    Workers run without the response cache: every worker opening the
+    parent's SQLite file would contend on its write lock, and each would
+    report cache counters nobody reads.
+    """
+    from .main import create_github_client, create_transport
+    
+    github_client = create_github_client(
+        None,
+        create_transport(record_dir, replay_dir, latency),
+        scheduler=SharedRateLimitScheduler(_budget)
+    )
+    async with github_client:
+        return [item async for item in github_client.stream_combinations(combinations)]
+
+
+class ShardedSweep:
+    """Runs a sweep across worker processes and merges the results.
+    
+    Scraping and HTML parsing are pure Python and bound to one core on a
+    single event loop. Each worker process runs its own event loop and
+    GitHubClient over a shard of the matrix, while the rate-limit budget is
+    shared through SharedBudget. Workers are started with "spawn", so they
+    never inherit the parent's running event loop or open connections.
+    """
+    
+    def __init__(
+        self,
+        workers: int,
+        record_dir: Optional[str] = None,
+        replay_dir: Optional[str] = None,
+        latency: float = 0.0
+    ):
+        """Initialize the sweep.
+        
+        Args:
+            workers: Number of worker processes
+            record_dir: Directory workers save response fixtures to
+            replay_dir: Directory workers replay response fixtures from
+            latency: Simulated seconds per replayed request
+        """
+        self.workers = max(1, workers)
+        self.record_dir = record_dir
+        self.replay_dir = replay_dir
+        self.latency = latency
+        self._context = multiprocessing.get_context("spawn")
+        self.budget = SharedBudget(self.workers, self._context)
+    
+    def scheduler(self) -> SharedRateLimitScheduler:
+        """Create a scheduler for the parent process drawing from the shared budget."""
+        return SharedRateLimitScheduler(self.budget)
+    
+    async def stream(self, combinations: List[Tuple[str, str]]) -> AsyncIterator[ShardItem]:
+        """Fetch combinations across the pool, yielding each shard as it completes.
+        
+        Args:
+            combinations: (language, period) pairs to fetch
+        
+        Yields:
+            ((language, period), trending rank, repository), shard by shard
+        """
+        shards = shard_combinations(combinations, self.workers)
+        loop = asyncio.get_running_loop()
+        executor = ProcessPoolExecutor(
+            len(shards),
+            mp_context=self._context,
+            initializer=_init_worker,
+            initargs=(self.budget,)
+        )
+        
+        try:
+            futures = [
+                loop.run_in_executor(executor, _run_shard, shard, self.record_dir, self.replay_dir, self.latency)
+                for shard in shards
+            ]
+            for done, future in enumerate(asyncio.as_completed(futures), 1):
+                items, snapshot = await future
+                metrics.merge(snapshot)
+                logger.info(f"🧱 Shard {done}/{len(shards)} done with {len(items)} repositories")
+                for item in items:
+                    yield item
+        finally:
+            # Shards still running are abandoned, the ones not started are dropped
+            executor.shutdown(wait=False, cancel_futures=True)
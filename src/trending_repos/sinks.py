@@ -0,0 +1,281 @@
+"""Output sinks writing digests to static files: HTML archive, Atom feed and JSON."""
+
+import dataclasses
+import json
+import os
+import re
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from html import escape
+from string import Template
+from typing import Any, Dict, List, Optional, Tuple
+
+from .renderer import CARD, LINK, MUTED, DigestRenderer, markdown_to_html
+
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+
+# Entries kept in the Atom feed, newest first
+FEED_MAX_ENTRIES = 50
+
+# Marks where new entries are inserted into the archive index
+INDEX_MARKER = "<!-- entries -->"
+
+INDEX_PAGE = Template(f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>GitHub Trending Repos Archive</title>
+    <link rel="alternate" type="application/atom+xml" title="GitHub Trending Repos" href="$feed_url">
+</head>
+<body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif; line-height: 1.6; color: #24292f; max-width: 800px; margin: 0 auto; padding: 20px; background: #f6f8fa;">
+    <div style="padding: 24px; {CARD}">
+        <h1 style="color: #24292f; margin: 0 0 16px 0;">📚 GitHub Trending Archive</h1>
+        <ul style="{MUTED} margin: 0; padding-left: 20px;">
+            {INDEX_MARKER}
+        </ul>
+    </div>
+</body>
+</html>
+""")
+
+INDEX_ITEM = Template(f'            <li><a href="$url" style="{LINK}">$date · $label</a> · $total_repos repositories</li>\n')
+
+Summaries = Dict[Tuple[str, str], Dict[str, Any]]
+
+
+def list_slug(language: str, period: str) -> str:
+    """File-name-safe name of a trending list, e.g. "cpp-daily" or "all-weekly"."""
+    language = language.lower().replace("+", "p").replace("#", "sharp")
+    language = re.sub(r"[^a-z0-9]+", "-", language).strip("-") or "all"
+    return f"{language}-{period}"
+
+
+def list_label(summary: Dict[str, Any], language: str, period: str) -> str:
+    """Human-readable name of a trending list."""
+    return summary.get("label") or f"{language or 'all languages'} / {period}"
+
+
+def _write_atomic(path: str, content: str) -> None:
+    """Write a file through a temporary file, so readers never see half of it."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+
+class Sink:
+    """Writes the summaries of a run somewhere other than email.
+    
+    Sinks are fed the summaries RepoSummarizer builds once per list, before
+    any per-recipient filtering, and only write what the run changed.
+    """
+    
+    def __init__(self, output_dir: str, renderer: Optional[DigestRenderer] = None, site_url: str = ""):
+        """Initialize the sink.
+        
+        Args:
+            output_dir: Directory the files are written under
+            renderer: Renderer whose pre-rendered cards are reused
+            site_url: Public URL of output_dir, for absolute links in the feed
+        """
+        self.output_dir = output_dir
+        self.renderer = renderer or DigestRenderer()
+        self.site_url = site_url.rstrip("/")
+    
+    def write(self, summaries: Summaries) -> List[str]:
+        """Write one run's summaries.
+        
+        Args:
+            summaries: Summary per (language, period)
+        
+        Returns:
+            Paths of the files written
+        """
+        raise NotImplementedError
+    
+    def _path(self, *parts: str) -> str:
+        return os.path.join(self.output_dir, *parts)
+    
+    def _url(self, relative: str) -> str:
+        return f"{self.site_url}/{relative}" if self.site_url else relative
+
+
+class ArchiveSink(Sink):
+    """Static HTML page per list and day, plus an index of every page.
+    
+    Only the day's pages are rendered; the index gets the new entries
+    inserted at the top instead of being rebuilt from the archive.
+    """
+    
+    def write(self, summaries: Summaries) -> List[str]:
+        written = []
+        items = []
+        for (language, period), summary in summaries.items():
+            relative = f"archive/{summary['date']}/{list_slug(language, period)}.html"
+            _write_atomic(self._path(relative), self.renderer.render_html(summary))
+            written.append(self._path(relative))
+            items.append((relative, INDEX_ITEM.substitute(
+                url=escape(relative),
+                date=summary["date"],
+                label=escape(list_label(summary, language, period)),
+                total_repos=summary["total_repos"],
+            )))
+        
+        index_path = self._path("index.html")
+        if os.path.exists(index_path):
+            with open(index_path, encoding="utf-8") as f:
+                index = f.read()
+        else:
+            index = INDEX_PAGE.substitute(feed_url=self._url("feed.xml"))
+        
+        # A list re-run on the same day keeps its existing entry
+        new_items = "".join(item for relative, item in items if f'href="{escape(relative)}"' not in index)
+        if new_items:
+            index = index.replace(INDEX_MARKER, f"{INDEX_MARKER}\n{new_items.rstrip()}", 1)
+            _write_atomic(index_path, index)
+            written.append(index_path)
+        return written
+
+
+class FeedSink(Sink):
+    """Atom feed with one entry per list and day, updated in place.
+    
+    New entries are added to the existing feed document, replacing an
+    entry with the same id, and the oldest ones past FEED_MAX_ENTRIES are
+    dropped.
+    """
+    
+    def write(self, summaries: Summaries) -> List[str]:
+        ET.register_namespace("", ATOM_NS)
+        path = self._path("feed.xml")
+        if os.path.exists(path):
+            feed = ET.parse(path).getroot()
+        else:
+            feed = ET.Element(f"{{{ATOM_NS}}}feed")
+            ET.SubElement(feed, f"{{{ATOM_NS}}}title").text = "GitHub Trending Repos"
+            ET.SubElement(feed, f"{{{ATOM_NS}}}id").text = "tag:trending-repos,2024:feed"
+            ET.SubElement(feed, f"{{{ATOM_NS}}}link", href=self._url("index.html"))
+            ET.SubElement(feed, f"{{{ATOM_NS}}}updated")
+        
+        # Atom requires an author, and feed readers expect a self link; feeds
+        # written without them get them on their next update
+        if feed.find(f"{{{ATOM_NS}}}author") is None:
+            author = ET.SubElement(feed, f"{{{ATOM_NS}}}author")
+            ET.SubElement(author, f"{{{ATOM_NS}}}name").text = "GitHub Trending Repos"
+        if not any(link.get("rel") == "self" for link in feed.findall(f"{{{ATOM_NS}}}link")):
+            ET.SubElement(feed, f"{{{ATOM_NS}}}link", rel="self", href=self._url("feed.xml"))
+        
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        feed.find(f"{{{ATOM_NS}}}updated").text = now
+        
+        entries = [self._entry(language, period, summary, now) for (language, period), summary in summaries.items()]
+        new_ids = {entry.find(f"{{{ATOM_NS}}}id").text for entry in entries}
+        existing = feed.findall(f"{{{ATOM_NS}}}entry")
+        for entry in existing:
+            feed.remove(entry)
+        
+        kept = [entry for entry in existing if entry.find(f"{{{ATOM_NS}}}id").text not in new_ids]
+        for entry in (entries + kept)[:FEED_MAX_ENTRIES]:
+            feed.append(entry)
+        
+        ET.indent(feed)
+        _write_atomic(path, ET.tostring(feed, encoding="unicode", xml_declaration=True) + "\n")
+        return [path]
+    
+    def _entry(self, language: str, period: str, summary: Dict[str, Any], updated: str) -> ET.Element:
+        """Build the feed entry for one list."""
+        slug = list_slug(language, period)
+        entry = ET.Element(f"{{{ATOM_NS}}}entry")
+        ET.SubElement(entry, f"{{{ATOM_NS}}}title").text = f"{summary['date']} · {list_label(summary, language, period)}"
+        ET.SubElement(entry, f"{{{ATOM_NS}}}id").text = f"tag:trending-repos,{summary['date']}:{slug}"
+        ET.SubElement(entry, f"{{{ATOM_NS}}}link", href=self._url(f"archive/{summary['date']}/{slug}.html"))
+        ET.SubElement(entry, f"{{{ATOM_NS}}}updated").text = updated
+        content = markdown_to_html(summary.get("summary_text", "")) + self.renderer.render_repos_html(summary)
+        ET.SubElement(entry, f"{{{ATOM_NS}}}content", type="html").text = content
+        return entry
+
+
+class JsonSink(Sink):
+    """JSON file per day with every list of that day, and a latest.json copy.
+    
+    A later run on the same day replaces only the lists it fetched.
+    """
+    
+    def write(self, summaries: Summaries) -> List[str]:
+        by_date: Dict[str, Summaries] = {}
+        for combination, summary in summaries.items():
+            by_date.setdefault(summary["date"], {})[combination] = summary
+        
+        written = []
+        for run_date, day_summaries in sorted(by_date.items()):
+            path = self._path("json", f"{run_date}.json")
+            lists = {}
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as f:
+                    lists = {(item["language"], item["period"]): item for item in json.load(f)["lists"]}
+            for (language, period), summary in day_summaries.items():
+                lists[(language, period)] = self._list(language, period, summary)
+            
+            content = json.dumps({"date": run_date, "lists": list(lists.values())}, ensure_ascii=False, indent=2)
+            _write_atomic(path, content)
+            _write_atomic(self._path("json", "latest.json"), content)
+            written += [path, self._path("json", "latest.json")]
+        return written
+    
+    def _list(self, language: str, period: str, summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Plain-data form of one list's summary."""
+        return {
+            "language": language,
+            "period": period,
+            "label": list_label(summary, language, period),
+            "total_repos": summary["total_repos"],
+            "total_stars": summary.get("total_stars", 0),
+            "top_languages": summary.get("top_languages", []),
+            "new_entries": summary.get("new_entries", 0),
+            "partial": summary.get("partial", False),
+            "repos": [
+                {"rank": repo.rank, "trend": repo.trend, **dataclasses.asdict(repo.repo)}
+                for repo in summary["repos"]
+            ],
+        }
+
+
+SINKS = {
+    "archive": ArchiveSink,
+    "feed": FeedSink,
+    "json": JsonSink,
+}
+
+
+def get_sinks(
+    names: str,
+    output_dir: str,
+    renderer: Optional[DigestRenderer] = None,
+    site_url: str = ""
+) -> List[Sink]:
+    """Create sinks by name.
+    
+    Args:
+        names: Comma-separated sink names, e.g. "archive,feed,json"
+        output_dir: Directory the files are written under
+        renderer: Renderer whose pre-rendered cards are reused
+        site_url: Public URL of output_dir
+    
+    Returns:
+        Sink instances
+    
+    Raises:
+        ValueError: If a name is unknown
+    """
+    sinks = []
+    for name in (name.strip() for name in names.split(",")):
+        if not name:
+            continue
+        try:
+            sinks.append(SINKS[name](output_dir, renderer, site_url))
+        except KeyError:
+            raise ValueError(f"Unknown output sink: {name}") from None
+    return sinks
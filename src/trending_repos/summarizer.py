@@ -1,107 +1,315 @@
 """Repository summarization functionality."""
 
-from typing import List, Dict, Any
+import dataclasses
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime
 
+from .models import FormattedRepo, Repo
+from .scoring import RankingStrategy, TrendingOrder
+
+if TYPE_CHECKING:
+    from .history import TrendingHistory
+    from .renderer import DigestRenderer
+
 
 class RepoSummarizer:
     """Summarizes trending repositories for email digest."""
     
-    def create_summary(self, repos: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def __init__(
+        self,
+        history: Optional["TrendingHistory"] = None,
+        ranking: Optional[RankingStrategy] = None,
+        limit: int = 0
+    ):
+        """Initialize the summarizer.
+        
+        Args:
+            history: Optional trending history used to add trend deltas
+            ranking: Order of repositories in the digest, defaults to trending order
+            limit: Maximum repositories shown in a digest (0 shows all)
+        """
+        self.history = history
+        self.ranking = ranking or TrendingOrder()
+        self.limit = limit
+    
+    def create_summary(
+        self,
+        repos: List[Repo],
+        label: str = "",
+        language: str = "",
+        period: str = "daily"
+    ) -> Dict[str, Any]:
         """Create a summary of trending repositories.
         
         Args:
-            repos: List of repository dictionaries
-            
+            repos: List of repositories in trending-rank order
+            label: Optional name of the trending list, e.g. "python / weekly"
+            language: Language filter of the list, used for history lookups
+            period: Trending period of the list, used for history lookups
+        
         Returns:
             Dictionary containing summary information
         """
-        if not repos:
-            return {
-                "total_repos": 0,
-                "summary_text": "No trending repositories found today.",
-                "repos": []
-            }
+        accumulator = self.accumulator(label=label, language=language, period=period)
+        for rank, repo in enumerate(repos, 1):
+            accumulator.add(rank, repo)
+        return accumulator.summary()
+    
+    def accumulator(
+        self,
+        label: str = "",
+        language: str = "",
+        period: str = "daily",
+        renderer: Optional["DigestRenderer"] = None
+    ) -> "SummaryAccumulator":
+        """Start an incremental summary for repositories that arrive one at a time.
+        
+        Args:
+            label: Optional name of the trending list, e.g. "python / weekly"
+            language: Language filter of the list, used for history lookups
+            period: Trending period of the list, used for history lookups
+            renderer: Optional renderer used to render each repository on arrival
+        
+        Returns:
+            Empty accumulator
+        """
+        return SummaryAccumulator(self, label, language, period, renderer)
+    
+    def apply_seen(self, summary: Dict[str, Any], seen: Set[str], mode: str = "collapse") -> Dict[str, Any]:
+        """Adapt a summary for a recipient who already got some of its repositories.
+        
+        Args:
+            summary: Summary from create_summary or SummaryAccumulator.summary
+            seen: Lower-cased full names the recipient was already sent
+            mode: "collapse" moves repeats into a short still-trending section,
+                "suppress" drops them
+        
+        Returns:
+            A new summary; the input is returned unchanged if nothing was seen
+        """
+        repos = summary.get("repos", [])
+        keep = [repo.repo.key not in seen for repo in repos]
+        if all(keep):
+            return summary
         
-        # Calculate summary statistics
-        total_stars = sum(repo.get("stars", 0) for repo in repos)
-        languages = {}
+        variant = {**summary, "repos": [repo for repo, kept in zip(repos, keep) if kept]}
+        for key in ("html_fragments", "text_fragments"):
+            if key in summary:
+                variant[key] = [fragment for fragment, kept in zip(summary[key], keep) if kept]
         
-        for repo in repos:
-            lang = repo.get("language", "Unknown")
-            if lang:
-                languages[lang] = languages.get(lang, 0) + 1
+        repeats = [repo for repo, kept in zip(repos, keep) if not kept]
+        if mode == "collapse":
+            variant["still_trending"] = repeats
+            variant["summary_text"] += f"\n\n🔁 **{len(repeats)} still trending** from earlier digests"
+        else:
+            # Suppressed repos aren't in the email at all, so the header must not count them
+            variant.update(self._describe(
+                variant["repos"], summary.get("found_repos", len(repos)), summary.get("partial", False), hidden=len(repeats)
+            ))
+        return variant
+    
+    def _describe(self, repos: List[FormattedRepo], found: int, partial: bool = False, hidden: int = 0) -> Dict[str, Any]:
+        """Compute the header totals and text for the repositories a digest shows.
+        
+        Args:
+            repos: Repositories shown, in digest order
+            found: Repositories on the list before the digest size limit
+            partial: Whether the run stopped before every repository arrived
+            hidden: Repositories left out because the recipient already got them
         
+        Returns:
+            Summary fields: total_repos, total_stars, top_languages,
+            new_entries, search_repos and summary_text
+        """
+        languages: Dict[str, int] = {}
+        for formatted in repos:
+            if formatted.repo.language:
+                languages[formatted.repo.language] = languages.get(formatted.repo.language, 0) + 1
         # Sort languages by frequency
         top_languages = sorted(languages.items(), key=lambda x: x[1], reverse=True)[:5]
+        total_stars = sum(formatted.repo.stars for formatted in repos)
+        new_entries = sum(formatted.is_new for formatted in repos)
+        search_repos = sum(formatted.repo.source == "search" for formatted in repos)
         
         # Create summary text
-        summary_parts = [
-            f"📈 **{len(repos)} trending repositories** discovered today",
-            f"⭐ **{total_stars:,} total stars** across all repositories"
-        ]
+        summary_parts = [f"📈 **{len(repos) - search_repos} trending repositories** discovered today"]
+        if search_repos:
+            summary_parts.append(f"🔍 **{search_repos} more** found by searching recently created repositories")
+        if found > len(repos) + hidden:
+            summary_parts.append(f"✂️ **Top {len(repos) + hidden} of {found}** repositories shown")
+        if hidden:
+            summary_parts.append(f"🙈 **{hidden} already sent** in earlier digests left out")
+        summary_parts.append(f"⭐ **{total_stars:,} total stars** across all repositories")
         
         if top_languages:
             lang_text = ", ".join([f"{lang} ({count})" for lang, count in top_languages])
             summary_parts.append(f"💻 **Top languages**: {lang_text}")
         
-        summary_text = "\n\n".join(summary_parts)
+        if new_entries:
+            summary_parts.append(f"🆕 **{new_entries} new entries** since the last run")
+        
+        if partial:
+            summary_parts.append("⚠️ **Partial digest**: the run was interrupted before every repository was fetched")
         
         return {
-            "date": datetime.now().strftime("%Y-%m-%d"),
             "total_repos": len(repos),
             "total_stars": total_stars,
             "top_languages": top_languages,
-            "summary_text": summary_text,
-            "repos": self._format_repos_for_email(repos)
+            "new_entries": new_entries,
+            "search_repos": search_repos,
+            "summary_text": "\n\n".join(summary_parts),
         }
     
-    def _format_repos_for_email(self, repos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Format repository data for email display.
+    def _format_trend(self, delta: Optional[Dict[str, Any]]) -> str:
+        """Describe how a repository moved since the previous run.
+        
+        Args:
+            delta: Trend delta from TrendingHistory.trend_deltas, if any
+        
+        Returns:
+            Short trend text, empty when there is nothing to report
+        """
+        if not delta:
+            return ""
+        
+        parts = []
+        if delta["is_new"]:
+            parts.append("🆕 New")
+        elif delta["rank_change"] > 0:
+            parts.append(f"▲ {delta['rank_change']}")
+        elif delta["rank_change"] < 0:
+            parts.append(f"▼ {-delta['rank_change']}")
+        
+        if delta["streak"] > 1:
+            parts.append(f"🔥 {delta['streak']} days in a row")
+        
+        if delta["stars_gained"]:
+            parts.append(f"+{delta['stars_gained']:,} stars since last run")
+        
+        return " · ".join(parts)
+
+
+class SummaryAccumulator:
+    """Builds a summary as repositories arrive, in any order.
+    
+    Trend deltas are looked up on every add(), and with a renderer each
+    repository card is rendered right away, so a digest (complete or
+    partial) can be produced at any point. Totals describe the repositories
+    the digest shows, after ranking and the size limit.
+    """
+    
+    def __init__(
+        self,
+        summarizer: RepoSummarizer,
+        label: str = "",
+        language: str = "",
+        period: str = "daily",
+        renderer: Optional["DigestRenderer"] = None
+    ):
+        """Initialize an empty accumulator.
+        
+        Args:
+            summarizer: Summarizer providing history and trend formatting
+            label: Optional name of the trending list
+            language: Language filter of the list
+            period: Trending period of the list
+            renderer: Optional renderer for per-repository fragments
+        """
+        self.summarizer = summarizer
+        self.label = label
+        self.language = language
+        self.period = period
+        self.renderer = renderer
+        self.date = datetime.now().strftime("%Y-%m-%d")
+        self._repos: Dict[int, Repo] = {}
+        self._formatted: Dict[int, FormattedRepo] = {}
+        self._fragments: Dict[int, Tuple[str, str]] = {}
+        self._days_trending: Dict[int, int] = {}
+        self._previous = None
+        if summarizer.history:
+            self._previous = summarizer.history.previous_snapshot(self.date, language, period)
+    
+    def __len__(self) -> int:
+        return len(self._repos)
+    
+    def add(self, rank: int, repo: Repo) -> None:
+        """Add one repository.
         
         Args:
-            repos: List of repository dictionaries
-            
+            rank: Trending rank of the repository in this list
+            repo: Repository record
+        """
+        self._repos[rank] = repo
+        
+        delta = None
+        if repo.source == "search":
+            # Search candidates never trended, so they have no history to compare against
+            self._days_trending[rank] = 0
+            trend = "🔍 Found by search"
+        else:
+            history = self.summarizer.history
+            if history:
+                delta = history.trend_delta(self.date, self.language, self.period, repo, rank, self._previous)
+                self._days_trending[rank] = delta["days_trending"]
+            trend = self.summarizer._format_trend(delta)
+        
+        formatted = FormattedRepo(repo, rank=rank, trend=trend, is_new=bool(delta and delta["is_new"]))
+        self._formatted[rank] = formatted
+        if self.renderer:
+            self._fragments[rank] = (
+                self.renderer.render_repo_html(formatted),
+                self.renderer.render_repo_text(formatted),
+            )
+    
+    @property
+    def ranked(self) -> List[Tuple[int, Repo]]:
+        """(trending rank, repository) pairs added so far, in rank order."""
+        return sorted(self._repos.items())
+    
+    def summary(self, partial: bool = False) -> Dict[str, Any]:
+        """Build the summary of everything added so far.
+        
+        Args:
+            partial: Whether the run stopped before every repository arrived
+        
         Returns:
-            List of formatted repository dictionaries
+            Dictionary containing summary information
         """
-        formatted_repos = []
-        
-        for i, repo in enumerate(repos, 1):
-            # Format creation date
-            created_date = ""
-            if repo.get("created_at"):
-                try:
-                    created_dt = datetime.fromisoformat(repo["created_at"].replace("Z", "+00:00"))
-                    created_date = created_dt.strftime("%B %Y")
-                except:
-                    created_date = "Unknown"
-            
-            # Format description
-            description = repo.get("description") or "No description available"
-            if len(description) > 150:
-                description = description[:147] + "..."
-            
-            # Format topics
-            topics = repo.get("topics", [])
-            topics_text = ", ".join(topics[:5]) if topics else "No topics"
-            
-            formatted_repo = {
-                "rank": i,
-                "name": repo.get("name", "Unknown"),
-                "full_name": repo.get("full_name", "Unknown"),
-                "description": description,
-                "language": repo.get("language", "Unknown"),
-                "stars": f"{repo.get('stars', 0):,}",
-                "forks": f"{repo.get('forks', 0):,}",
-                "url": repo.get("url", ""),
-                "created_date": created_date,
-                "topics": topics_text,
-                "license": repo.get("license", "No license"),
-                "owner_name": repo.get("owner", {}).get("login", "Unknown"),
-                "owner_avatar": repo.get("owner", {}).get("avatar_url", "")
+        if not self._repos:
+            return {
+                "label": self.label,
+                "total_repos": 0,
+                "summary_text": "No trending repositories found today.",
+                "repos": []
             }
-            
-            formatted_repos.append(formatted_repo)
         
-        return formatted_repos
\ No newline at end of file
+        ranks = sorted(self._repos)
+        repos = [self._repos[rank] for rank in ranks]
+        order = self.summarizer.ranking.order(
+            repos, [self._days_trending.get(rank, 1) for rank in ranks], self.period
+        )
+        if self.summarizer.limit:
+            order = order[:self.summarizer.limit]
+        
+        # Cards rendered on arrival are only reusable if the order didn't change
+        in_order = order == list(range(len(order)))
+        if in_order:
+            formatted = [self._formatted[ranks[i]] for i in order]
+        else:
+            formatted = [
+                dataclasses.replace(self._formatted[ranks[i]], rank=position)
+                for position, i in enumerate(order, 1)
+            ]
+        
+        summary = {
+            "date": self.date,
+            "label": self.label,
+            "found_repos": len(self._repos),
+            "partial": partial,
+            **self.summarizer._describe(formatted, len(self._repos), partial),
+            "repos": formatted
+        }
+        if self.renderer and in_order:
+            summary["html_fragments"] = [self._fragments[ranks[i]][0] for i in order]
+            summary["text_fragments"] = [self._fragments[ranks[i]][1] for i in order]
+        return summary
@@ -0,0 +1,128 @@
+"""Record and replay HTTP transports for offline runs and benchmarks."""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import re
+from typing import Any, Dict, Optional
+
+import httpx
+
+from .http2 import HTTP2_AVAILABLE
+from .metrics import metrics
+
+
+# Headers that describe the wire encoding; fixtures store the decoded body
+_WIRE_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+# Search queries ask for repos created since a date relative to today
+_SEARCH_DATE = re.compile(r"(created:>=)\d{4}-\d{2}-\d{2}")
+
+
+def fixture_key(request: httpx.Request) -> str:
+    """Identify a request by method, URL and body, ignoring headers.
+    
+    Auth tokens and cache validators never end up in fixture names, and
+    GraphQL queries for different repositories get different keys. The
+    date in search queries is left out, so fixtures recorded one day still
+    replay on the next.
+    
+    Args:
+        request: Outgoing request
+    
+    Returns:
+        Hex digest used as the fixture file name
+    """
+    url = request.url
+    query = url.params.get("q")
+    if query and _SEARCH_DATE.search(query):
+        url = url.copy_set_param("q", _SEARCH_DATE.sub(r"\1*", query))
+    
+    digest = hashlib.sha256()
+    digest.update(request.method.encode())
+    digest.update(str(url).encode())
+    digest.update(request.content)
+    return digest.hexdigest()[:32]
+
+
+class MissingFixtureError(LookupError):
+    """Raised by ReplayTransport for a request that was never recorded."""
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Sends requests over the network and saves every response to disk."""
+    
+    def __init__(self, directory: str, transport: Optional[httpx.AsyncBaseTransport] = None):
+        """Initialize the transport.
+        
+        Args:
+            directory: Directory the fixtures are written to
+            transport: Transport that performs the real requests
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.transport = transport or httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE)
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.transport.handle_async_request(request)
+        # Reading through a Response decodes gzip/br so fixtures hold plain bodies
+        body = await httpx.Response(response.status_code, headers=response.headers, stream=response.stream).aread()
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in _WIRE_HEADERS}
+        
+        fixture: Dict[str, Any] = {
+            "method": request.method,
+            "url": str(request.url),
+            "status": response.status_code,
+            "headers": headers,
+        }
+        try:
+            fixture["body"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            fixture["body_base64"] = base64.b64encode(body).decode("ascii")
+        
+        path = os.path.join(self.directory, f"{fixture_key(request)}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(fixture, f, indent=2)
+        
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+    
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Serves responses from recorded fixtures, never touching the network."""
+    
+    def __init__(self, directory: str, latency: float = 0.0):
+        """Initialize the transport.
+        
+        Args:
+            directory: Directory holding fixtures written by RecordingTransport
+            latency: Simulated round-trip time in seconds added to every request
+        """
+        self.directory = directory
+        self.latency = latency
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        
+        path = os.path.join(self.directory, f"{fixture_key(request)}.json")
+        try:
+            with open(path, encoding="utf-8") as f:
+                fixture = json.load(f)
+        except FileNotFoundError:
+            # A made-up response would quietly change what the run fetched, so
+            # misses are counted for main() to fail the run on
+            metrics.incr("replay.missing")
+            raise MissingFixtureError(
+                f"No recorded fixture for {request.method} {request.url} in {self.directory}"
+            ) from None
+        
+        if "body_base64" in fixture:
+            body = base64.b64decode(fixture["body_base64"])
+        else:
+            body = fixture["body"].encode("utf-8")
+        return httpx.Response(fixture["status"], headers=fixture["headers"], content=body, request=request)
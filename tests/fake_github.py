@@ -0,0 +1,271 @@
+"""In-process fake of github.com and api.github.com for tests and benchmarks."""
+
+import asyncio
+import json
+from html import escape
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import parse_qs
+
+import httpx
+
+
+PERIOD_STAR_FACTORS = {"daily": 1, "weekly": 5, "monthly": 20}
+
+ARTICLE = """
+<article class="Box-row">
+  <div class="float-right d-flex">
+    <a href="/login?return_to=%2F{full_name}" class="btn-sm btn" aria-label="You must be signed in to star a repository">
+      <svg aria-hidden="true" height="16" viewBox="0 0 16 16" version="1.1" width="16" class="octicon octicon-star"><path d="M8 .25a.75.75 0 0 1 .673.418l1.882 3.815 4.21.612"></path></svg>
+      Star
+    </a>
+  </div>
+  <h2 class="h3 lh-condensed">
+    <a href="/{full_name}" data-view-component="true" class="Link">
+      <svg aria-hidden="true" height="16" viewBox="0 0 16 16" version="1.1" width="16" class="octicon octicon-repo mr-1 color-fg-muted"><path d="M2 2.5A2.5 2.5 0 0 1 4.5 0h8.75"></path></svg>
+      <span data-view-component="true" class="text-normal">{owner} /</span>
+      {name}
+    </a>
+  </h2>
+  {description}
+  <div class="f6 color-fg-muted mt-2">
+    {language}
+    <a href="/{full_name}/stargazers" data-view-component="true" class="Link Link--muted d-inline-block mr-3">
+      <svg aria-label="star" role="img" height="16" viewBox="0 0 16 16" version="1.1" width="16" class="octicon octicon-star"><path d="M8 .25a.75.75 0 0 1 .673.418l1.882 3.815"></path></svg>
+      {stars:,}
+    </a>
+    <a href="/{full_name}/forks" data-view-component="true" class="Link Link--muted d-inline-block mr-3">
+      <svg aria-label="fork" role="img" height="16" viewBox="0 0 16 16" version="1.1" width="16" class="octicon octicon-repo-forked"><path d="M5 5.372v.878c0 .414.336.75.75.75h4.5"></path></svg>
+      {forks:,}
+    </a>
+    <span data-view-component="true" class="d-inline-block mr-3">
+      Built by
+      <a class="d-inline-block" data-hovercard-type="user" href="/{owner}"><img class="avatar mb-1 avatar-user" src="https://avatars.githubusercontent.com/u/1?s=40&amp;v=4" width="20" height="20" alt="@{owner}" /></a>
+    </span>
+    <span data-view-component="true" class="d-inline-block float-sm-right">
+      <svg aria-hidden="true" height="16" viewBox="0 0 16 16" version="1.1" width="16" class="octicon octicon-star"><path d="M8 .25a.75.75 0 0 1 .673.418"></path></svg>
+      {stars_today:,} stars today
+    </span>
+  </div>
+</article>
+"""
+
+PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>Trending repositories on GitHub today</title></head>
+<body>
+<div class="application-main">{padding}
+<div class="Box">
+{articles}
+</div>
+</div>
+</body>
+</html>
+"""
+
+
+def trending_page(articles: List[Dict[str, Any]], padding: int = 0) -> str:
+    """Render a trending page in the markup github.com uses.
+
+    Args:
+        articles: Fields of each article (full_name, description, language,
+            stars, forks, stars_today)
+        padding: Bytes of unrelated markup before the list, like the real page's
+            navigation and scripts
+
+    Returns:
+        Page HTML
+    """
+    rendered = []
+    for article in articles:
+        owner, _, name = article["full_name"].partition("/")
+        description = article.get("description")
+        language = article.get("language")
+        rendered.append(ARTICLE.format(
+            full_name=article["full_name"],
+            owner=owner,
+            name=name,
+            description=f'<p class="col-9 color-fg-muted my-1 pr-4">\n    {escape(description)}\n  </p>' if description else "",
+            language=(
+                f'<span class="d-inline-block ml-0 mr-3"><span class="repo-language-color"></span>'
+                f'<span itemprop="programmingLanguage">{escape(language)}</span></span>'
+            ) if language else "",
+            stars=article.get("stars", 0),
+            forks=article.get("forks", 0),
+            stars_today=article.get("stars_today", 0),
+        ))
+    filler = '\n<div class="d-none"><a href="/features">Features</a><span>navigation</span></div>'
+    return PAGE.format(padding=filler * (padding // len(filler)), articles="".join(rendered))
+
+
+class FakeGitHub:
+    """Serves trending pages and the REST, GraphQL and search APIs from generated data.
+
+    Every (language, period) list has repos_per_page repositories. The same
+    repositories trend in every period of a language, with period-specific
+    stars today, so cross-list deduplication can be observed.
+    """
+
+    def __init__(
+        self,
+        repos_per_page: int = 25,
+        latency: float = 0.0,
+        missing: Optional[Set[str]] = None,
+        graphql_errors: Optional[Set[str]] = None,
+        padding: int = 0,
+        rate_limit: Optional[int] = None
+    ):
+        """Initialize the fake.
+
+        Args:
+            repos_per_page: Repositories on each trending page
+            latency: Seconds added to every response
+            missing: Full names listed on trending pages but absent from the API
+            graphql_errors: Full names GraphQL reports with a non-NOT_FOUND error
+            padding: Bytes of unrelated markup on each trending page
+            rate_limit: Core API budget reported in X-RateLimit headers; like
+                GitHub, 304 Not Modified replies don't use it up
+        """
+        self.repos_per_page = repos_per_page
+        self.latency = latency
+        self.missing = missing or set()
+        self.graphql_errors = graphql_errors or set()
+        self.padding = padding
+        self.remaining = rate_limit
+        self.requests: List[httpx.Request] = []
+
+    def transport(self) -> httpx.MockTransport:
+        """Transport serving this fake, for GitHubClient(transport=...)."""
+        return httpx.MockTransport(self.handle)
+
+    def names(self, language: str) -> List[str]:
+        """Full names on a language's trending pages, in rank order."""
+        slug = language or "all"
+        return [f"owner{i}/{slug}-{i}" for i in range(self.repos_per_page)]
+
+    def rest_payload(self, full_name: str) -> Dict[str, Any]:
+        """GET /repos/{owner}/{repo} body for a repository."""
+        owner, _, name = full_name.partition("/")
+        i = int(name.rsplit("-", 1)[1])
+        return {
+            "name": name,
+            "full_name": full_name,
+            "description": None if i % 7 == 3 else f"Description of {name} & friends",
+            "language": None if i % 5 == 4 else "Python",
+            "stargazers_count": 10_000 - i * 100,
+            "forks_count": 500 - i * 10,
+            "html_url": f"https://github.com/{full_name}",
+            "created_at": f"2024-{i % 12 + 1:02d}-01T00:00:00Z",
+            "updated_at": "2025-01-02T00:00:00Z",
+            "pushed_at": "2025-01-03T00:00:00Z",
+            "topics": [f"topic{j}" for j in range(i % 4)],
+            "license": None if i % 3 == 0 else {"name": "MIT License"},
+            "owner": {"login": owner, "avatar_url": f"https://avatars.githubusercontent.com/{owner}"},
+        }
+
+    def graphql_node(self, full_name: str) -> Dict[str, Any]:
+        """GraphQL RepoFields node with the same content as rest_payload."""
+        rest = self.rest_payload(full_name)
+        return {
+            "name": rest["name"],
+            "nameWithOwner": rest["full_name"],
+            "description": rest["description"],
+            "primaryLanguage": {"name": rest["language"]} if rest["language"] else None,
+            "stargazerCount": rest["stargazers_count"],
+            "forkCount": rest["forks_count"],
+            "url": rest["html_url"],
+            "createdAt": rest["created_at"],
+            "updatedAt": rest["updated_at"],
+            "pushedAt": rest["pushed_at"],
+            "repositoryTopics": {"nodes": [{"topic": {"name": topic}} for topic in rest["topics"]]},
+            "licenseInfo": rest["license"],
+            "owner": {"login": rest["owner"]["login"], "avatarUrl": rest["owner"]["avatar_url"]},
+        }
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        path = request.url.path
+        if request.url.host == "github.com" and path.startswith("/trending"):
+            return self._trending(path.removeprefix("/trending").strip("/"), request.url.params.get("since", "daily"))
+        if path == "/graphql":
+            return self._graphql(json.loads(request.content))
+        if path == "/search/repositories":
+            return self._search(parse_qs(request.url.query.decode())["q"][0])
+        if path.startswith("/repos/"):
+            owner, name, *resource = path.removeprefix("/repos/").split("/")
+            full_name = f"{owner}/{name}"
+            if full_name in self.missing:
+                return httpx.Response(404, json={"message": "Not Found"})
+            if resource:
+                return self._repo_resource(full_name, "/".join(resource))
+            return self._rest(request, full_name)
+        return httpx.Response(404, json={"message": "Not Found"})
+
+    def _repo_resource(self, full_name: str, resource: str) -> httpx.Response:
+        """README, latest release and contributors, as the enrichment stage requests them."""
+        i = int(full_name.rsplit("-", 1)[1])
+        if resource == "readme":
+            return httpx.Response(200, text=(
+                f'<article class="markdown-body"><h1>{full_name}</h1>'
+                f"<p>{full_name} is a generated repository used to test and benchmark the digest.</p></article>"
+            ))
+        if resource == "releases/latest":
+            return httpx.Response(200, json={"tag_name": f"v{i}.0.0", "html_url": f"https://github.com/{full_name}/releases/tag/v{i}.0.0"})
+        if resource == "contributors":
+            link = f'<https://api.github.com/repos/{full_name}/contributors?per_page=1&anon=true&page={i + 1}>; rel="last"'
+            return httpx.Response(200, headers={"Link": link}, json=[{"login": full_name.partition("/")[0]}])
+        return httpx.Response(404, json={"message": "Not Found"})
+
+    def _rest(self, request: httpx.Request, full_name: str) -> httpx.Response:
+        """Repository payload with an ETag, answering a matching If-None-Match with 304."""
+        etag = f'"{full_name}"'
+        headers = {"ETag": etag}
+        not_modified = request.headers.get("If-None-Match") == etag
+        if self.remaining is not None:
+            if not not_modified:
+                self.remaining -= 1
+            headers.update({"X-RateLimit-Remaining": str(self.remaining), "X-RateLimit-Reset": "4102444800"})
+        if not_modified:
+            return httpx.Response(304, headers=headers)
+        return httpx.Response(200, headers=headers, json=self.rest_payload(full_name))
+
+    def _trending(self, language: str, period: str) -> httpx.Response:
+        factor = PERIOD_STAR_FACTORS.get(period, 1)
+        articles = []
+        for full_name in self.names(language):
+            i = int(full_name.rsplit("-", 1)[1])
+            articles.append({
+                "full_name": full_name,
+                "description": f"Description of {full_name.partition('/')[2]} & friends",
+                "language": "Python",
+                "stars": 10_000 - i * 100,
+                "forks": 500 - i * 10,
+                "stars_today": (100 - i) * factor,
+            })
+        return httpx.Response(200, text=trending_page(articles, self.padding))
+
+    def _graphql(self, body: Dict[str, Any]) -> httpx.Response:
+        variables = body["variables"]
+        data, errors = {}, []
+        for i in range(len(variables) // 2):
+            alias = f"r{i}"
+            full_name = f"{variables[f'o{i}']}/{variables[f'n{i}']}"
+            if full_name in self.missing:
+                data[alias] = None
+                errors.append({"path": [alias], "type": "NOT_FOUND", "message": f"Could not resolve {full_name}"})
+            elif full_name in self.graphql_errors:
+                data[alias] = None
+                errors.append({"path": [alias], "type": "FORBIDDEN", "message": f"Resource limits exceeded for {full_name}"})
+            else:
+                data[alias] = self.graphql_node(full_name)
+        return httpx.Response(200, json={"data": data, "errors": errors} if errors else {"data": data})
+
+    def _search(self, query: str) -> httpx.Response:
+        language = ""
+        for qualifier in query.split():
+            if qualifier.startswith("language:"):
+                language = qualifier.removeprefix("language:")
+        items = [self.rest_payload(f"searcher{i}/{language or 'all'}-{i}") for i in range(10)]
+        return httpx.Response(200, json={"total_count": len(items), "items": items})
@@ -0,0 +1,139 @@
+"""Response caches revalidate with ETags, expire by TTL and evict least recently used entries."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from tests.fake_github import FakeGitHub
+from trending_repos import cache as cache_module
+from trending_repos.cache import MemoryResponseCache, SQLiteResponseCache
+from trending_repos.github_client import GitHubClient
+from trending_repos.metrics import metrics
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake wall clock for the cache module; advance it by adding to clock[0]."""
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_cache(request, tmp_path):
+    caches = []
+
+    def make(**kwargs):
+        if request.param == "memory":
+            cache = MemoryResponseCache(**kwargs)
+        else:
+            cache = SQLiteResponseCache(str(tmp_path / "cache.db"), **kwargs)
+        caches.append(cache)
+        return cache
+
+    yield make
+    for cache in caches:
+        cache.close()
+
+
+def fetch(fake, cache):
+    async def run():
+        async with GitHubClient(transport=fake.transport(), cache=cache, depth=2) as client:
+            repos = await client.fetch_trending_repos()
+            return repos, client.scheduler
+
+    return asyncio.run(run())
+
+
+def detail_requests(fake):
+    return [request for request in fake.requests if request.url.path.startswith("/repos/")]
+
+
+def test_stale_entries_are_revalidated_without_using_rate_limit(make_cache, clock):
+    fake = FakeGitHub(repos_per_page=2, rate_limit=5000)
+    cache = make_cache(ttl=60)
+
+    first, _ = fetch(fake, cache)
+    clock[0] += 61
+    fake.requests.clear()
+    again, scheduler = fetch(fake, cache)
+
+    assert again == first
+    revalidations = detail_requests(fake)
+    assert [request.headers["If-None-Match"] for request in revalidations] == ['"owner0/all-0"', '"owner1/all-1"']
+    assert fake.remaining == 4998
+    assert scheduler._budgets["core"][0] == 4998
+    assert cache.stats["revalidations"] == 2
+    assert cache.stats["misses"] == 2
+    assert cache.stats["bytes_saved"] == cache.stats["bytes_downloaded"]
+
+
+def test_fresh_entries_are_served_without_a_request(make_cache, clock):
+    fake = FakeGitHub(repos_per_page=2)
+    cache = make_cache(ttl=60)
+
+    fetch(fake, cache)
+    clock[0] += 59
+    fake.requests.clear()
+    fetch(fake, cache)
+
+    assert detail_requests(fake) == []
+    assert cache.stats["hits"] == 2
+    assert cache.stats["revalidations"] == 0
+
+
+def test_refreshed_entries_are_fresh_for_another_ttl(make_cache, clock):
+    fake = FakeGitHub(repos_per_page=2)
+    cache = make_cache(ttl=60)
+
+    fetch(fake, cache)
+    clock[0] += 61
+    fetch(fake, cache)
+    clock[0] += 59
+    fake.requests.clear()
+    fetch(fake, cache)
+
+    assert detail_requests(fake) == []
+
+
+def test_least_recently_used_entries_are_evicted_over_max_bytes(make_cache, clock):
+    cache = make_cache(max_bytes=10)
+
+    cache.put("a", b"aaaa")
+    clock[0] += 1
+    cache.put("b", b"bbbb")
+    clock[0] += 1
+    assert cache.get("a").body == b"aaaa"
+    clock[0] += 1
+    cache.put("c", b"cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a").body == b"aaaa"
+    assert cache.get("c").body == b"cccc"
+
+
+def test_replacing_an_entry_does_not_count_its_old_size(make_cache, clock):
+    cache = make_cache(max_bytes=10)
+
+    cache.put("a", b"aaaa")
+    clock[0] += 1
+    cache.put("b", b"bbbb")
+    clock[0] += 1
+    cache.put("b", b"BBBB")
+
+    assert cache.get("a").body == b"aaaa"
+    assert cache.get("b").body == b"BBBB"
+
+
+def test_put_stays_out_of_http_counters(make_cache):
+    cache = make_cache()
+    before = dict(metrics.counters)
+
+    cache.put("enrichment:owner/repo@2025-01-03", b'{"contributors": 2}')
+
+    assert cache.get("enrichment:owner/repo@2025-01-03").body == b'{"contributors": 2}'
+    assert cache.stats == {"hits": 0, "misses": 0, "revalidations": 0, "bytes_saved": 0, "bytes_downloaded": 0}
+    assert {name: value for name, value in metrics.counters.items() if name.startswith("cache.")} == {
+        name: value for name, value in before.items() if name.startswith("cache.")
+    }
@@ -0,0 +1,28 @@
+"""Parsing of the sweep settings."""
+
+from trending_repos.config import Config
+
+
+def test_trending_languages_ignores_blank_entries(monkeypatch):
+    monkeypatch.setattr(Config, "TRENDING_LANGUAGES", "python, ,rust,")
+
+    assert Config.trending_languages() == ["python", "rust"]
+
+
+def test_trending_languages_all_means_every_language(monkeypatch):
+    monkeypatch.setattr(Config, "TRENDING_LANGUAGES", "all,python")
+
+    assert Config.trending_languages() == ["", "python"]
+
+
+def test_trending_languages_falls_back_to_single_language(monkeypatch):
+    monkeypatch.setattr(Config, "TRENDING_LANGUAGES", "")
+    monkeypatch.setattr(Config, "TRENDING_LANGUAGE", "go")
+
+    assert Config.trending_languages() == ["go"]
+
+
+def test_trending_periods_ignores_blank_entries(monkeypatch):
+    monkeypatch.setattr(Config, "TRENDING_PERIODS", "daily,,weekly,")
+
+    assert Config.trending_periods() == ["daily", "weekly"]
@@ -0,0 +1,138 @@
+"""Digest jobs come due at local wall-clock times and the scheduler runs them safely."""
+
+import asyncio
+import os
+import signal
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from trending_repos import daemon
+from trending_repos.daemon import DigestJob, DigestScheduler
+
+
+REAL_SLEEP = asyncio.sleep
+
+UTC = timezone.utc
+
+
+class FakeClock:
+    """Stands in for the daemon's wall clock; sleeping advances it instantly."""
+
+    def __init__(self, now, on_sleep=None):
+        self.now = now
+        self.on_sleep = on_sleep
+        self.wakeups = []
+
+    async def sleep(self, delay):
+        self.now += timedelta(seconds=delay)
+        self.wakeups.append(self.now)
+        if self.on_sleep:
+            self.on_sleep(len(self.wakeups))
+        await REAL_SLEEP(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock(datetime(2025, 1, 6, 12, 0, tzinfo=UTC))
+
+    class FakeDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock.now
+
+    monkeypatch.setattr(daemon, "datetime", FakeDatetime)
+    monkeypatch.setattr(daemon.asyncio, "sleep", clock.sleep)
+    return clock
+
+
+def test_next_run_uses_job_timezone():
+    job = DigestJob("vn", [], at="07:00", timezone="Asia/Ho_Chi_Minh")
+
+    # 23:30 UTC is already 06:30 the next morning in Ho Chi Minh City
+    due = job.next_run(datetime(2025, 1, 6, 23, 30, tzinfo=UTC))
+
+    assert due.astimezone(UTC) == datetime(2025, 1, 7, 0, 0, tzinfo=UTC)
+
+
+def test_next_run_keeps_local_time_across_dst_change():
+    job = DigestJob("berlin", [], at="07:00", timezone="Europe/Berlin")
+
+    due = job.next_run(datetime(2025, 3, 29, 12, 0, tzinfo=UTC))
+
+    assert due.astimezone(UTC) == datetime(2025, 3, 30, 5, 0, tzinfo=UTC)
+
+
+def test_next_run_moves_to_tomorrow_once_time_has_passed():
+    job = DigestJob("daily", [], at="07:00")
+
+    assert job.next_run(datetime(2025, 1, 7, 6, 59, tzinfo=UTC)) == datetime(2025, 1, 7, 7, 0, tzinfo=UTC)
+    assert job.next_run(datetime(2025, 1, 7, 7, 0, tzinfo=UTC)) == datetime(2025, 1, 8, 7, 0, tzinfo=UTC)
+    assert job.next_run(datetime(2025, 1, 7, 8, 0, tzinfo=UTC)) == datetime(2025, 1, 8, 7, 0, tzinfo=UTC)
+
+
+def test_next_run_waits_for_weekday():
+    # 2025-01-07 is a Tuesday
+    monday = DigestJob("weekly", [], at="07:00", weekday=0)
+    tuesday = DigestJob("weekly", [], at="07:00", weekday=1)
+
+    assert monday.next_run(datetime(2025, 1, 7, 6, 0, tzinfo=UTC)) == datetime(2025, 1, 13, 7, 0, tzinfo=UTC)
+    assert tuesday.next_run(datetime(2025, 1, 7, 6, 0, tzinfo=UTC)) == datetime(2025, 1, 7, 7, 0, tzinfo=UTC)
+    assert tuesday.next_run(datetime(2025, 1, 7, 8, 0, tzinfo=UTC)) == datetime(2025, 1, 14, 7, 0, tzinfo=UTC)
+
+
+def test_job_still_running_when_due_again_is_skipped(clock):
+    release = asyncio.Event()
+    started = []
+
+    async def runner(job):
+        started.append(job.name)
+        await release.wait()
+
+    scheduler = DigestScheduler([DigestJob("daily", [], at="07:00")], runner, jitter=0)
+
+    def on_sleep(count):
+        # Wake up three times while the first run is stuck, then let it finish
+        if count == 4:
+            release.set()
+            scheduler.stop()
+
+    clock.on_sleep = on_sleep
+    asyncio.run(scheduler.run())
+
+    assert started == ["daily"]
+    assert clock.wakeups[:3] == [datetime(2025, 1, day, 7, 0, tzinfo=UTC) for day in (7, 8, 9)]
+
+
+def test_start_times_are_jittered_within_bounds(clock):
+    async def runner(job):
+        pass
+
+    scheduler = DigestScheduler([DigestJob("daily", [], at="07:00")], runner, jitter=30)
+    clock.on_sleep = lambda count: count == 50 and scheduler.stop()
+    asyncio.run(scheduler.run())
+
+    offsets = [(wake - wake.replace(hour=7, minute=0, second=0, microsecond=0)).total_seconds() for wake in clock.wakeups]
+    assert all(0 <= offset <= 30 for offset in offsets)
+    assert len(set(offsets)) > 1
+    # Jitter never makes a job skip or repeat a day
+    assert [wake.date() for wake in clock.wakeups] == [clock.wakeups[0].date() + timedelta(days=i) for i in range(50)]
+
+
+def test_sigterm_lets_running_job_finish(clock):
+    finished = []
+
+    async def runner(job):
+        await REAL_SLEEP(0.05)
+        finished.append(job.name)
+
+    scheduler = DigestScheduler([DigestJob("daily", [], at="07:00")], runner, jitter=0)
+    clock.on_sleep = lambda count: count == 2 and os.kill(os.getpid(), signal.SIGTERM)
+
+    async def run():
+        scheduler.install_signal_handlers()
+        await scheduler.run()
+
+    asyncio.run(run())
+
+    assert finished == ["daily"]
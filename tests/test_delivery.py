@@ -0,0 +1,163 @@
+"""Digests are rendered once per distinct list and sent in bounded, concurrent batches."""
+
+import asyncio
+
+from trending_repos.delivery import DeliveryPipeline, Subscriber
+from trending_repos.email_sender import EmailSender
+from trending_repos.models import Repo
+from trending_repos.renderer import DigestRenderer
+from trending_repos.seen import SeenIndex
+from trending_repos.summarizer import RepoSummarizer
+
+
+class RecordingSender(EmailSender):
+    """Renders like EmailSender but records batches instead of calling Resend."""
+
+    def __init__(self, latency=0.0, failing=()):
+        self.renderer = DigestRenderer()
+        self.latency = latency
+        self.failing = set(failing)
+        self.rendered = []
+        self.batches = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def build_message(self, summary):
+        self.rendered.append(summary)
+        return super().build_message(summary)
+
+    async def send_batch(self, emails):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        recipients = [email["to"][0] for email in emails]
+        self.batches.append(recipients)
+        if self.failing.intersection(recipients):
+            raise RuntimeError("batch rejected")
+        return [f"id-{recipient}" for recipient in recipients]
+
+
+def summaries(*keys, date="2025-01-01"):
+    summarizer = RepoSummarizer()
+    result = {}
+    for language, period in keys:
+        repos = [Repo(f"owner/{language or 'all'}-{i}", stars=100, language="Python") for i in range(3)]
+        summary = summarizer.create_summary(repos, label=f"{language or 'all'} / {period}")
+        summary["date"] = date
+        result[(language, period)] = summary
+    return result
+
+
+def subscribers(count, language="python", period="daily", prefix="user"):
+    return [Subscriber(f"{prefix}{i}@example.com", language, period) for i in range(count)]
+
+
+def deliver(pipeline, recipients, digests):
+    return asyncio.run(pipeline.deliver(recipients, digests))
+
+
+def seen_pipeline(sender, tmp_path, mode):
+    """Pipeline where alice got python-0 yesterday, bob got every repo and carol nothing."""
+    index = SeenIndex(str(tmp_path / "seen.db"))
+    index.mark_sent(["alice@example.com"], ["owner/python-0"], "2025-01-01")
+    index.mark_sent(["bob@example.com"], ["owner/python-0", "owner/python-1", "owner/python-2"], "2025-01-01")
+    return DeliveryPipeline(sender, "bot@example.com", seen_index=index, summarizer=RepoSummarizer(), seen_mode=mode), index
+
+
+SEEN_RECIPIENTS = [Subscriber(f"{name}@example.com", "python", "daily") for name in ("alice", "bob", "carol")]
+
+
+def test_each_distinct_digest_is_rendered_once():
+    sender = RecordingSender()
+    recipients = subscribers(150) + subscribers(30, "rust", "weekly", prefix="rust") + subscribers(20, prefix="more")
+
+    results = deliver(DeliveryPipeline(sender, "bot@example.com"), recipients, summaries(("python", "daily"), ("rust", "weekly")))
+
+    assert [summary["label"] for summary in sender.rendered] == ["python / daily", "rust / weekly"]
+    assert sorted(len(batch) for batch in sender.batches) == [30, 70, 100]
+    assert all(result.success for result in results)
+
+
+def test_batches_are_capped_at_provider_limit():
+    sender = RecordingSender()
+
+    deliver(DeliveryPipeline(sender, "bot@example.com", batch_size=500), subscribers(250), summaries(("python", "daily")))
+
+    assert sorted(len(batch) for batch in sender.batches) == [50, 100, 100]
+
+
+def test_batches_in_flight_are_bounded():
+    sender = RecordingSender(latency=0.01)
+
+    deliver(DeliveryPipeline(sender, "bot@example.com", batch_size=10, max_concurrency=3), subscribers(200), summaries(("python", "daily")))
+
+    assert len(sender.batches) == 20
+    assert sender.max_in_flight == 3
+
+
+def test_every_subscriber_gets_own_result():
+    sender = RecordingSender(failing={"user150@example.com"})
+    recipients = subscribers(200) + [Subscriber("go@example.com", "go", "daily")]
+
+    results = deliver(DeliveryPipeline(sender, "bot@example.com"), recipients, summaries(("python", "daily")))
+
+    by_email = {result.email: result for result in results}
+    assert len(results) == len(by_email) == 201
+    assert by_email["user0@example.com"].success
+    assert by_email["user0@example.com"].message_id == "id-user0@example.com"
+    assert by_email["user99@example.com"].message_id == "id-user99@example.com"
+    assert not any(by_email[f"user{i}@example.com"].success for i in range(100, 200))
+    assert by_email["user100@example.com"].error == "batch rejected"
+    assert by_email["go@example.com"].skipped
+    assert not by_email["go@example.com"].success
+
+
+def test_collapse_moves_repeats_to_still_trending(tmp_path):
+    sender = RecordingSender()
+    pipeline, index = seen_pipeline(sender, tmp_path, "collapse")
+
+    results = deliver(pipeline, SEEN_RECIPIENTS, summaries(("python", "daily"), date="2025-01-02"))
+
+    full, alice = sorted(sender.rendered, key=lambda summary: len(summary["repos"]), reverse=True)
+    assert [repo.full_name for repo in full["repos"]] == ["owner/python-0", "owner/python-1", "owner/python-2"]
+    assert [repo.full_name for repo in alice["repos"]] == ["owner/python-1", "owner/python-2"]
+    assert [repo.full_name for repo in alice["still_trending"]] == ["owner/python-0"]
+    assert "🔁 **1 still trending**" in alice["summary_text"]
+    assert sorted(sender.batches) == [["alice@example.com"], ["carol@example.com"]]
+    by_email = {result.email: result for result in results}
+    assert by_email["bob@example.com"].skipped
+    assert by_email["bob@example.com"].error == "Nothing new since the last digest"
+    index.close()
+
+
+def test_suppress_leaves_repeats_out_of_digest_and_header(tmp_path):
+    sender = RecordingSender()
+    pipeline, index = seen_pipeline(sender, tmp_path, "suppress")
+
+    deliver(pipeline, SEEN_RECIPIENTS, summaries(("python", "daily"), date="2025-01-02"))
+
+    alice = min(sender.rendered, key=lambda summary: len(summary["repos"]))
+    assert [repo.full_name for repo in alice["repos"]] == ["owner/python-1", "owner/python-2"]
+    assert "still_trending" not in alice
+    assert alice["total_repos"] == 2
+    assert "🙈 **1 already sent**" in alice["summary_text"]
+    index.close()
+
+
+def test_only_repos_actually_sent_are_marked(tmp_path):
+    sender = RecordingSender(failing={"carol@example.com"})
+    pipeline, index = seen_pipeline(sender, tmp_path, "collapse")
+    keys = ["owner/python-0", "owner/python-1", "owner/python-2"]
+
+    deliver(pipeline, SEEN_RECIPIENTS, summaries(("python", "daily"), date="2025-01-02"))
+
+    # A week on, only what was marked on 2025-01-02 is still within the window:
+    # alice's new repos, not her collapsed repeat, nothing for skipped bob or
+    # for carol, whose batch failed
+    assert index.seen([s.email for s in SEEN_RECIPIENTS], keys, "2025-01-08") == {
+        "alice@example.com": {"owner/python-1", "owner/python-2"},
+    }
+    index.close()
@@ -0,0 +1,18 @@
+"""Single digests go through send_batch, so dry runs write them like batches."""
+
+import asyncio
+
+from trending_repos.email_sender import DryRunEmailSender
+from trending_repos.models import Repo
+from trending_repos.summarizer import RepoSummarizer
+
+
+def test_dry_run_sends_single_digest_to_files(tmp_path):
+    sender = DryRunEmailSender(str(tmp_path))
+    summary = RepoSummarizer().create_summary([Repo("owner/repo", name="repo", stars=100)])
+
+    sent = asyncio.run(sender.send_trending_summary(summary, "me@example.com"))
+
+    assert sent
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["0001-me@example.com.html", "0001-me@example.com.txt"]
+    assert "owner/repo" in (tmp_path / "0001-me@example.com.txt").read_text()
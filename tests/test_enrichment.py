@@ -0,0 +1,53 @@
+"""Cached enrichments are counted apart from cached HTTP responses."""
+
+import asyncio
+from types import SimpleNamespace
+
+from tests.fake_github import FakeGitHub
+from trending_repos import cache as cache_module
+from trending_repos.cache import MemoryResponseCache
+from trending_repos.enrichment import Enricher
+from trending_repos.github_client import GitHubClient
+
+
+def enrich_all(fake, cache, backend="rest"):
+    async def run():
+        async with GitHubClient(transport=fake.transport(), backend=backend, cache=cache, depth=2) as client:
+            repos = await client.fetch_trending_repos()
+            enricher = Enricher(client, cache=cache)
+            return [await enricher.enrich(repo) for repo in repos], enricher
+    return asyncio.run(run())
+
+
+def test_enrichment_cache_hits_leave_http_counters_alone():
+    fake, cache = FakeGitHub(), MemoryResponseCache()
+
+    repos, first = enrich_all(fake, cache)
+    http_stats = dict(cache.stats)
+    again, second = enrich_all(fake, cache)
+
+    assert repos[1].enrichment.latest_release == "v1.0.0"
+    assert repos[1].enrichment.contributors == 2
+    assert [repo.enrichment for repo in again] == [repo.enrichment for repo in repos]
+    assert first.stats == {"cache_hits": 0, "cache_misses": 2}
+    assert second.stats == {"cache_hits": 2, "cache_misses": 0}
+    # Only the repo detail requests touch the HTTP counters: two misses, then two hits
+    assert http_stats["misses"] == 2
+    assert cache.stats["misses"] == 2
+    assert cache.stats["hits"] == 2
+
+
+def test_enrichments_without_pushed_at_expire_with_cache_ttl(monkeypatch):
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=lambda: now[0]))
+    fake, cache = FakeGitHub(), MemoryResponseCache(ttl=60)
+
+    repos, _ = enrich_all(fake, cache, backend="page")
+    now[0] += 59
+    _, within_ttl = enrich_all(fake, cache, backend="page")
+    now[0] += 2
+    _, expired = enrich_all(fake, cache, backend="page")
+
+    assert [repo.pushed_at for repo in repos] == ["", ""]
+    assert within_ttl.stats == {"cache_hits": 2, "cache_misses": 0}
+    assert expired.stats == {"cache_hits": 0, "cache_misses": 2}
@@ -0,0 +1,36 @@
+"""Batch fetches collect the same records stream_combinations yields."""
+
+import asyncio
+
+from tests.fake_github import PERIOD_STAR_FACTORS, FakeGitHub
+from trending_repos.github_client import GitHubClient
+
+
+def test_sweep_fetches_each_repo_once_with_per_period_stars():
+    fake = FakeGitHub(repos_per_page=10)
+
+    async def run():
+        async with GitHubClient(transport=fake.transport(), depth=10) as client:
+            return await client.sweep(["python"], ["daily", "weekly"])
+
+    results = asyncio.run(run())
+
+    assert list(results) == [("python", "daily"), ("python", "weekly")]
+    for (_, period), repos in results.items():
+        assert [repo.full_name for repo in repos] == fake.names("python")
+        assert [repo.stars_today for repo in repos] == [(100 - i) * PERIOD_STAR_FACTORS[period] for i in range(10)]
+    detail_requests = [request for request in fake.requests if request.url.path.startswith("/repos/")]
+    assert len(detail_requests) == 10
+
+
+def test_search_results_follow_trending_page_in_rank_order():
+    fake = FakeGitHub(repos_per_page=5, missing={"owner1/all-1"})
+
+    async def run():
+        async with GitHubClient(transport=fake.transport(), depth=5, search_depth=3) as client:
+            return await client.fetch_trending_repos()
+
+    repos = asyncio.run(run())
+
+    trending = [name for name in fake.names("") if name not in fake.missing]
+    assert [repo.full_name for repo in repos] == trending + [f"searcher{i}/all-{i}" for i in range(3)]
@@ -0,0 +1,69 @@
+"""The GraphQL backend must produce the same records as the REST backend."""
+
+import asyncio
+
+import httpx
+
+from tests.fake_github import FakeGitHub
+from trending_repos.github_client import GitHubClient
+
+
+def fetch(fake: FakeGitHub, backend: str):
+    async def run():
+        async with GitHubClient("token", backend=backend, transport=fake.transport(), depth=25) as client:
+            return await client.fetch_trending_repos()
+    return asyncio.run(run())
+
+
+def api_requests(fake: FakeGitHub, prefix: str):
+    return [str(request.url) for request in fake.requests if request.url.path.startswith(prefix)]
+
+
+def test_graphql_records_match_rest():
+    rest_fake, graphql_fake = FakeGitHub(), FakeGitHub()
+
+    rest = fetch(rest_fake, "rest")
+    graphql = fetch(graphql_fake, "graphql")
+
+    assert len(rest) == 25
+    assert graphql == rest
+    # One aliased query instead of a request per repo
+    assert len(api_requests(graphql_fake, "/graphql")) == 1
+    assert api_requests(graphql_fake, "/repos/") == []
+
+
+def test_not_found_is_dropped_without_rest_retry():
+    missing = {"owner3/all-3", "owner7/all-7"}
+    rest_fake, graphql_fake = FakeGitHub(missing=missing), FakeGitHub(missing=missing)
+
+    rest = fetch(rest_fake, "rest")
+    graphql = fetch(graphql_fake, "graphql")
+
+    assert graphql == rest
+    assert {repo.full_name for repo in graphql}.isdisjoint(missing)
+    assert api_requests(graphql_fake, "/repos/") == []
+
+
+def test_other_errors_fall_back_to_rest():
+    failing = {"owner2/all-2", "owner11/all-11"}
+    graphql_fake = FakeGitHub(graphql_errors=failing)
+
+    graphql = fetch(graphql_fake, "graphql")
+
+    assert graphql == fetch(FakeGitHub(), "rest")
+    assert sorted(api_requests(graphql_fake, "/repos/")) == sorted(
+        f"https://api.github.com/repos/{name}" for name in failing
+    )
+
+
+def test_failed_query_falls_back_to_rest():
+    class GraphQLDown(FakeGitHub):
+        def _graphql(self, body):
+            return httpx.Response(200, json={"errors": [{"message": "Something went wrong"}]})
+
+    graphql_fake = GraphQLDown()
+
+    graphql = fetch(graphql_fake, "graphql")
+
+    assert graphql == fetch(FakeGitHub(), "rest")
+    assert len(api_requests(graphql_fake, "/repos/")) == 25
@@ -0,0 +1,31 @@
+"""TrendingHistory keeps the ranks a list was scraped with."""
+
+from trending_repos.history import TrendingHistory
+from trending_repos.models import Repo
+from trending_repos.summarizer import RepoSummarizer
+
+
+def test_recorded_ranks_keep_gaps(tmp_path):
+    history = TrendingHistory(str(tmp_path / "history.db"))
+    accumulator = RepoSummarizer(history).accumulator(language="python")
+    # Rank 2 was on the trending page but missing from the API; ranks arrive out of order
+    for rank in (4, 1, 3):
+        accumulator.add(rank, Repo(f"owner/repo-{rank}", stars=rank * 10))
+
+    assert [rank for rank, _ in accumulator.ranked] == [1, 3, 4]
+    assert history.record_run("2025-01-01", "python", "daily", accumulator.ranked) == 3
+
+    _, ranks = history.previous_snapshot("2025-01-02", "python", "daily")
+    assert ranks == {"owner/repo-1": (1, 10), "owner/repo-3": (3, 30), "owner/repo-4": (4, 40)}
+    history.close()
+
+
+def test_trend_deltas_use_given_ranks(tmp_path):
+    history = TrendingHistory(str(tmp_path / "history.db"))
+    history.record_run("2025-01-01", "", "daily", [(1, Repo("a/a")), (5, Repo("b/b"))])
+
+    deltas = history.trend_deltas("2025-01-02", "", "daily", [(2, Repo("a/a")), (3, Repo("b/b"))])
+
+    assert deltas["a/a"]["rank_change"] == -1
+    assert deltas["b/b"]["rank_change"] == 2
+    history.close()
@@ -0,0 +1,47 @@
+"""Both trending page parsers must produce the same records."""
+
+import pytest
+
+from tests.fake_github import ARTICLE, PAGE, trending_page
+from trending_repos.parsers import SoupTrendingParser, StreamingTrendingParser
+
+
+def parse_both(html: str, limit: int = 25):
+    return SoupTrendingParser().parse(html, limit), StreamingTrendingParser().parse(html, limit)
+
+
+def test_parsers_agree_on_generated_page():
+    articles = [
+        {"full_name": f"owner{i}/repo-{i}", "description": f"Repo {i} & co", "language": "Rust",
+         "stars": 12_345 - i, "forks": 678 + i, "stars_today": 90 + i}
+        for i in range(25)
+    ]
+    articles[3]["description"] = None
+    articles[5]["language"] = None
+
+    soup, streaming = parse_both(trending_page(articles, padding=2_000))
+
+    assert len(soup) == 25
+    assert soup == streaming
+    assert soup[0].description == "Repo 0 & co"
+    assert soup[0].stars == 12_345
+    assert soup[3].description is None
+    assert soup[5].language is None
+
+
+@pytest.mark.parametrize("description, expected", [
+    ("Desc &amp; <g-emoji class=\"g-emoji\" alias=\"rocket\">🚀</g-emoji> fast", "Desc & 🚀 fast"),
+    ("A <code>tool</code>kit for\n      <b>everyone</b>", "A toolkit for everyone"),
+])
+def test_inline_markup_is_joined_like_streaming_parser(description, expected):
+    article = ARTICLE.format(
+        full_name="owner/repo", owner="owner", name="repo",
+        description=f'<p class="col-9 color-fg-muted my-1 pr-4">\n    {description}\n  </p>',
+        language="", stars=1, forks=2, stars_today=3,
+    )
+    html = PAGE.format(padding="", articles=article)
+
+    soup, streaming = parse_both(html)
+
+    assert soup == streaming
+    assert soup[0].description == expected
@@ -0,0 +1,155 @@
+"""RateLimitScheduler waits, paces and retries as GitHub's headers ask."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from trending_repos import rate_limit
+from trending_repos.rate_limit import RateLimitScheduler
+
+
+NOW = 1_700_000_000.0
+API_URL = "https://api.github.com/repos/owner/repo"
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record requested sleeps instead of waiting, advancing a fake clock that starts at NOW."""
+    recorded = []
+    clock = [NOW]
+
+    async def sleep(seconds):
+        recorded.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", sleep)
+    monkeypatch.setattr(rate_limit.time, "time", lambda: clock[0])
+    return recorded
+
+
+def send(scheduler, responses, url=API_URL, count=1):
+    """Send count requests through the scheduler, answering with responses in order.
+
+    Each item of responses is an httpx.Response or an exception to raise.
+    Returns the final responses and the number of requests that reached the transport.
+    """
+    queue = list(responses)
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        item = queue.pop(0) if len(queue) > 1 else queue[0]
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return [await scheduler.request(client, "GET", url) for _ in range(count)]
+
+    return asyncio.run(run()), len(calls)
+
+
+def budget(remaining, reset=NOW + 100):
+    return {"X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": str(int(reset))}
+
+
+def test_retry_after_is_honoured(sleeps):
+    scheduler = RateLimitScheduler()
+
+    [response], calls = send(scheduler, [
+        httpx.Response(429, headers={"Retry-After": "7"}),
+        httpx.Response(200),
+    ])
+
+    assert response.status_code == 200
+    assert calls == 2
+    assert sleeps == [7.0]
+    assert scheduler.retries == 1
+
+
+def test_exhausted_budget_waits_for_reset(sleeps):
+    scheduler = RateLimitScheduler()
+
+    [response], calls = send(scheduler, [
+        httpx.Response(403, headers=budget(0, reset=NOW + 20)),
+        httpx.Response(200, headers=budget(4999, reset=NOW + 3600)),
+    ])
+
+    assert response.status_code == 200
+    assert calls == 2
+    # One second of slack past the reset
+    assert sleeps == [21.0]
+
+
+def test_reset_beyond_max_wait_returns_response(sleeps):
+    scheduler = RateLimitScheduler(max_wait=60)
+
+    [response], calls = send(scheduler, [httpx.Response(403, headers=budget(0, reset=NOW + 3600))])
+
+    assert response.status_code == 403
+    assert calls == 1
+    assert sleeps == []
+
+
+def test_low_budget_spreads_requests_over_window(sleeps):
+    scheduler = RateLimitScheduler(pace_threshold=50)
+
+    send(scheduler, [httpx.Response(200, headers=budget(10, reset=NOW + 100))], count=4)
+
+    # The first request learns the budget and the second takes the free slot;
+    # later ones are spaced (time to reset) / remaining apart
+    assert sleeps == pytest.approx([100 / 10, 100 / 10])
+
+
+def test_budget_above_threshold_is_not_paced(sleeps):
+    scheduler = RateLimitScheduler(pace_threshold=50)
+
+    send(scheduler, [httpx.Response(200, headers=budget(51))], count=5)
+
+    assert sleeps == []
+
+
+def test_pages_are_not_paced(sleeps):
+    scheduler = RateLimitScheduler()
+
+    send(scheduler, [httpx.Response(200, headers=budget(0))], url="https://github.com/trending", count=3)
+
+    assert sleeps == []
+
+
+def test_server_errors_back_off_exponentially(sleeps, monkeypatch):
+    monkeypatch.setattr(rate_limit.random, "uniform", lambda low, high: high)
+    scheduler = RateLimitScheduler(max_retries=3, base_delay=1.0, max_delay=3.0)
+
+    [response], calls = send(scheduler, [httpx.Response(503)])
+
+    assert response.status_code == 503
+    assert calls == 4
+    assert sleeps == [1.0, 2.0, 3.0]
+    assert scheduler.retries == 3
+
+
+def test_transport_errors_are_retried_then_raised(sleeps):
+    scheduler = RateLimitScheduler(max_retries=2)
+
+    with pytest.raises(httpx.ConnectError):
+        send(scheduler, [httpx.ConnectError("connection refused")])
+
+    assert len(sleeps) == 2
+    assert scheduler.retries == 2
+
+
+def test_throttled_seconds_is_total_time_slept(sleeps):
+    scheduler = RateLimitScheduler(max_retries=2)
+
+    send(scheduler, [
+        httpx.Response(429, headers={"Retry-After": "3"}),
+        httpx.Response(502),
+        httpx.Response(200),
+    ])
+
+    assert len(sleeps) == 2
+    assert scheduler.throttled_seconds == pytest.approx(sum(sleeps))
+    assert scheduler.stats == {"throttled_seconds": round(sum(sleeps), 3), "retries": 2}
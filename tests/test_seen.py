@@ -0,0 +1,50 @@
+"""The seen index remembers what each recipient was sent for a window of days."""
+
+from trending_repos.seen import QUERY_CHUNK_SIZE, SeenIndex
+
+
+def test_sent_repos_are_seen_by_their_recipient_only(tmp_path):
+    index = SeenIndex(str(tmp_path / "seen.db"))
+
+    index.mark_sent(["Alice@example.com"], ["owner/one", "owner/two"], "2025-01-01")
+
+    assert index.seen(["alice@example.com", "bob@example.com"], ["owner/one", "owner/three"], "2025-01-02") == {
+        "alice@example.com": {"owner/one"},
+    }
+    index.close()
+
+
+def test_lookups_span_query_chunks(tmp_path):
+    index = SeenIndex(str(tmp_path / "seen.db"))
+    recipients = [f"user{i}@example.com" for i in range(QUERY_CHUNK_SIZE * 2 + 1)]
+
+    index.mark_sent(recipients, ["owner/one"], "2025-01-01")
+
+    assert index.seen(recipients, ["owner/one"], "2025-01-02") == {recipient: {"owner/one"} for recipient in recipients}
+    index.close()
+
+
+def test_repos_leave_the_window_after_window_days(tmp_path):
+    index = SeenIndex(str(tmp_path / "seen.db"), window_days=7)
+    index.mark_sent(["alice@example.com"], ["owner/one"], "2025-01-01")
+    index.mark_sent(["alice@example.com"], ["owner/two"], "2025-01-03")
+
+    assert index.seen(["alice@example.com"], ["owner/one", "owner/two"], "2025-01-07") == {
+        "alice@example.com": {"owner/one", "owner/two"},
+    }
+    assert index.seen(["alice@example.com"], ["owner/one", "owner/two"], "2025-01-08") == {
+        "alice@example.com": {"owner/two"},
+    }
+    assert index.expire("2025-01-08") == 1
+    assert index.expire("2025-01-08") == 0
+    index.close()
+
+
+def test_sending_again_restarts_the_window(tmp_path):
+    index = SeenIndex(str(tmp_path / "seen.db"), window_days=7)
+    index.mark_sent(["alice@example.com"], ["owner/one"], "2025-01-01")
+    index.mark_sent(["alice@example.com"], ["owner/one"], "2025-01-05")
+
+    assert index.expire("2025-01-10") == 0
+    assert index.seen(["alice@example.com"], ["owner/one"], "2025-01-10") == {"alice@example.com": {"owner/one"}}
+    index.close()
@@ -0,0 +1,73 @@
+"""Sharded sweeps match in-process sweeps and share one rate-limit budget across workers."""
+
+import asyncio
+
+from tests.fake_github import FakeGitHub
+from trending_repos import main as app
+from trending_repos import sharding
+from trending_repos.config import Config
+from trending_repos.github_client import GitHubClient
+from trending_repos.sharding import ShardedSweep
+from trending_repos.transports import RecordingTransport
+
+
+COMBINATIONS = [(language, period) for language in ("", "python", "rust") for period in ("daily", "weekly")]
+
+# The reset time FakeGitHub reports with its rate limit
+RESET_AT = 4102444800
+
+
+def by_list(items):
+    """Repositories of each list in rank order, whatever order the items arrived in."""
+    lists = {}
+    for combination, rank, repo in sorted(items, key=lambda item: (item[0], item[1])):
+        lists.setdefault(combination, []).append(repo)
+    return lists
+
+
+def test_worker_runs_without_response_cache(tmp_path, monkeypatch):
+    cache_path = tmp_path / "cache.db"
+    fake = FakeGitHub(repos_per_page=5)
+    monkeypatch.setattr(Config, "CACHE_PATH", str(cache_path))
+    monkeypatch.setattr(Config, "TRENDING_DEPTH", 5)
+    monkeypatch.setattr(Config, "SEARCH_DEPTH", 0)
+    monkeypatch.setattr(Config, "GITHUB_BACKEND", "rest")
+    monkeypatch.setattr(app, "create_transport", lambda *args: fake.transport())
+    monkeypatch.setattr(sharding, "_budget", sharding.SharedBudget(1))
+
+    items = asyncio.run(sharding._fetch_shard([("python", "daily")], None, None, 0.0))
+
+    assert [repo.full_name for _, _, repo in sorted(items, key=lambda item: item[1])] == fake.names("python")
+    assert not cache_path.exists()
+
+
+def test_two_workers_match_in_process_sweep_and_share_budget(tmp_path, monkeypatch):
+    fixtures = tmp_path / "fixtures"
+    fake = FakeGitHub(repos_per_page=5, rate_limit=5000)
+
+    async def record():
+        transport = RecordingTransport(str(fixtures), transport=fake.transport())
+        async with GitHubClient(transport=transport, depth=5) as client:
+            return [item async for item in client.stream_combinations(COMBINATIONS)]
+
+    in_process = by_list(asyncio.run(record()))
+
+    # Worker processes are spawned and read their settings from the environment
+    for name, value in {
+        "GH_TOKEN": "", "GITHUB_TOKEN": "", "GITHUB_BACKEND": "rest", "TRENDING_PARSER": "streaming",
+        "TRENDING_DEPTH": "5", "SEARCH_DEPTH": "0", "CACHE_PATH": "",
+    }.items():
+        monkeypatch.setenv(name, value)
+    sweep = ShardedSweep(2, replay_dir=str(fixtures))
+
+    async def run():
+        return [item async for item in sweep.stream(COMBINATIONS)]
+
+    sharded = by_list(asyncio.run(run()))
+
+    assert sharded == in_process
+    # Only the workers made requests, so the parent sees the lowest budget any
+    # of them replayed, less the requests they claimed from it
+    remaining, reset_at = sweep.budget.take("core")
+    assert reset_at == RESET_AT
+    assert remaining <= fake.remaining
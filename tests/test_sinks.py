@@ -0,0 +1,76 @@
+"""Static outputs: a valid Atom feed, and one failing sink doesn't stop the run."""
+
+import asyncio
+import json
+import xml.etree.ElementTree as ET
+
+from tests.fake_github import FakeGitHub
+from trending_repos.delivery import Subscriber
+from trending_repos.email_sender import DryRunEmailSender
+from trending_repos.github_client import GitHubClient
+from trending_repos.main import run_digests
+from trending_repos.models import Repo
+from trending_repos.sinks import ATOM_NS, FeedSink, JsonSink, Sink
+from trending_repos.summarizer import RepoSummarizer
+
+ATOM = f"{{{ATOM_NS}}}"
+
+
+def summaries():
+    summary = RepoSummarizer().create_summary([Repo("owner/repo", stars=5, language="Python")])
+    return {("python", "daily"): summary}
+
+
+def self_links(feed):
+    return [link.get("href") for link in feed.findall(f"{ATOM}link") if link.get("rel") == "self"]
+
+
+def test_feed_has_author_and_self_link(tmp_path):
+    sink = FeedSink(str(tmp_path), site_url="https://example.com/trending/")
+
+    sink.write(summaries())
+    sink.write(summaries())
+
+    feed = ET.parse(tmp_path / "feed.xml").getroot()
+    assert feed.find(f"{ATOM}author/{ATOM}name").text == "GitHub Trending Repos"
+    assert self_links(feed) == ["https://example.com/trending/feed.xml"]
+    assert len(feed.findall(f"{ATOM}author")) == 1
+    assert len(feed.findall(f"{ATOM}entry")) == 1
+
+
+def test_existing_feed_gets_author_and_self_link(tmp_path):
+    (tmp_path / "feed.xml").write_text(
+        f'<?xml version="1.0"?>\n<feed xmlns="{ATOM_NS}"><title>GitHub Trending Repos</title>'
+        f"<id>tag:trending-repos,2024:feed</id><link href=\"index.html\" /><updated /></feed>\n"
+    )
+
+    FeedSink(str(tmp_path)).write(summaries())
+
+    feed = ET.parse(tmp_path / "feed.xml").getroot()
+    assert feed.find(f"{ATOM}author/{ATOM}name") is not None
+    assert self_links(feed) == ["feed.xml"]
+    # Entries stay after the feed's own elements
+    assert [child.tag for child in feed][-1] == f"{ATOM}entry"
+
+
+class BrokenSink(Sink):
+    def write(self, summaries):
+        raise OSError("disk full")
+
+
+def test_failing_sink_does_not_stop_other_sinks_or_emails(tmp_path):
+    fake = FakeGitHub(repos_per_page=3)
+    sinks = [BrokenSink(str(tmp_path / "site")), JsonSink(str(tmp_path / "site"))]
+
+    async def run():
+        async with GitHubClient(transport=fake.transport(), depth=3) as client:
+            return await run_digests(
+                client, RepoSummarizer(), DryRunEmailSender(str(tmp_path / "out")),
+                [Subscriber("me@example.com", "python")], sinks=sinks
+            )
+
+    deliveries = asyncio.run(run())
+
+    assert [result.success for result in deliveries] == [True]
+    latest = json.loads((tmp_path / "site" / "json" / "latest.json").read_text())
+    assert latest["lists"][0]["total_repos"] == 3
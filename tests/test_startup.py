@@ -0,0 +1,61 @@
+"""Startup stays cheap: heavy and optional modules load only when used."""
+
+import json
+import os
+import subprocess
+import sys
+
+# Cumulative import time of trending_repos.main, config and logging included
+IMPORT_BUDGET_MS = 300
+
+# Modules only optional features need
+OPTIONAL_MODULES = ["multiprocessing", "concurrent.futures.process", "xml.etree", "sqlite3"]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(code, cwd, *options, **env):
+    """Run code in a fresh interpreter with only the given settings in its environment."""
+    environment = {
+        "PATH": os.environ.get("PATH", ""),
+        "PYTHONPATH": os.pathsep.join([os.path.join(ROOT, "src"), ROOT]),
+        **env,
+    }
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        cwd=cwd, env=environment, capture_output=True, text=True, check=True
+    )
+
+
+def test_import_and_argument_parsing_within_budget(tmp_path):
+    result = run_python(
+        "import trending_repos.main as m; m.parse_args([])", tmp_path, "-X", "importtime"
+    )
+
+    # Lines look like "import time: self [us] | cumulative | name"
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, total, name = line.removeprefix("import time:").split("|")
+            if total.strip().isdigit():
+                cumulative[name.strip()] = int(total)
+
+    assert cumulative["trending_repos.main"] / 1000 < IMPORT_BUDGET_MS
+    for heavy in ("httpx", "resend", "bs4", "sqlite3", "trending_repos.github_client"):
+        assert heavy not in cumulative
+
+
+def test_plain_dry_run_skips_optional_modules(tmp_path):
+    code = f"""
+import asyncio, json, sys
+from tests.fake_github import FakeGitHub
+import trending_repos.main as m
+
+m.create_transport = lambda *args: FakeGitHub().transport()
+asyncio.run(m.main(dry_run_dir="out"))
+print(json.dumps([name for name in {OPTIONAL_MODULES!r} if name in sys.modules]))
+"""
+    result = run_python(code, tmp_path, RECIPIENT_EMAIL="me@example.com")
+
+    assert json.loads(result.stdout.splitlines()[-1]) == []
+    assert (tmp_path / "out").is_dir()
@@ -0,0 +1,75 @@
+"""Digest headers describe the repositories the digest shows."""
+
+from trending_repos.history import TrendingHistory
+from trending_repos.models import Repo
+from trending_repos.summarizer import RepoSummarizer
+
+
+def trending(i, **fields):
+    return Repo(f"owner/trending-{i}", **{"stars": 100, "language": "Python", **fields})
+
+
+def searched(i, **fields):
+    return Repo(f"owner/searched-{i}", **{"stars": 10, "language": "Rust", "source": "search", **fields})
+
+
+def test_search_candidates_are_counted_apart_from_trending():
+    summary = RepoSummarizer().create_summary([trending(1), trending(2), searched(1)])
+
+    assert "📈 **2 trending repositories**" in summary["summary_text"]
+    assert "🔍 **1 more** found by searching" in summary["summary_text"]
+    assert summary["search_repos"] == 1
+    assert summary["repos"][2].trend == "🔍 Found by search"
+
+
+def test_history_records_only_trending_repos(tmp_path):
+    history = TrendingHistory(str(tmp_path / "history.db"))
+    accumulator = RepoSummarizer(history).accumulator()
+    for rank, repo in enumerate([trending(1), trending(2), searched(1)], 1):
+        accumulator.add(rank, repo)
+
+    assert history.record_run("2025-01-01", "", "daily", accumulator.ranked) == 2
+    _, ranks = history.previous_snapshot("2025-01-02", "", "daily")
+    assert set(ranks) == {"owner/trending-1", "owner/trending-2"}
+    history.close()
+
+
+def test_header_describes_repos_left_after_digest_size_limit():
+    repos = [trending(i, stars_today=i) for i in range(4)] + [trending(4, language="Go"), searched(1)]
+
+    summary = RepoSummarizer(limit=3).create_summary(repos)
+
+    assert summary["total_repos"] == 3
+    assert summary["found_repos"] == 6
+    assert summary["total_stars"] == 300
+    assert summary["top_languages"] == [("Python", 3)]
+    assert "📈 **3 trending repositories**" in summary["summary_text"]
+    assert "✂️ **Top 3 of 6** repositories shown" in summary["summary_text"]
+    assert "🔍" not in summary["summary_text"]
+
+
+def test_suppressed_repos_are_left_out_of_header():
+    summarizer = RepoSummarizer()
+    summary = summarizer.create_summary([trending(1), trending(2, language="Go"), trending(3)])
+
+    variant = summarizer.apply_seen(summary, {"owner/trending-2"}, mode="suppress")
+
+    assert [repo.full_name for repo in variant["repos"]] == ["owner/trending-1", "owner/trending-3"]
+    assert variant["total_repos"] == 2
+    assert variant["total_stars"] == 200
+    assert variant["top_languages"] == [("Python", 2)]
+    assert "📈 **2 trending repositories**" in variant["summary_text"]
+    assert "🙈 **1 already sent** in earlier digests left out" in variant["summary_text"]
+    # The shared summary other recipients get is untouched
+    assert summary["total_repos"] == 3
+
+
+def test_collapsed_repos_stay_counted():
+    summarizer = RepoSummarizer()
+    summary = summarizer.create_summary([trending(1), trending(2)])
+
+    variant = summarizer.apply_seen(summary, {"owner/trending-2"}, mode="collapse")
+
+    assert variant["total_repos"] == 2
+    assert [repo.full_name for repo in variant["still_trending"]] == ["owner/trending-2"]
+    assert "🔁 **1 still trending**" in variant["summary_text"]
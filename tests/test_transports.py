@@ -0,0 +1,64 @@
+"""Recorded fixtures replay the same responses, and gaps fail loudly."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from tests.fake_github import FakeGitHub
+from trending_repos import main as app
+from trending_repos.config import Config
+from trending_repos.metrics import metrics
+from trending_repos.transports import MissingFixtureError, RecordingTransport, ReplayTransport, fixture_key
+
+
+def get(transport, url):
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await client.get(url)
+    return asyncio.run(run())
+
+
+def test_replay_serves_recorded_response(tmp_path):
+    url = "https://api.github.com/repos/owner0/all-0"
+    recorded = get(RecordingTransport(str(tmp_path), transport=FakeGitHub().transport()), url)
+
+    replayed = get(ReplayTransport(str(tmp_path)), url)
+
+    assert replayed.status_code == recorded.status_code == 200
+    assert replayed.json() == recorded.json()
+
+
+def test_missing_fixture_raises_and_is_counted(tmp_path):
+    metrics.reset()
+
+    with pytest.raises(MissingFixtureError, match="owner0/all-0"):
+        get(ReplayTransport(str(tmp_path)), "https://api.github.com/repos/owner0/all-0")
+
+    assert metrics.counters["replay.missing"] == 1
+    metrics.reset()
+
+
+def test_replayed_run_with_missing_fixtures_fails(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "RECIPIENT_EMAIL", "me@example.com")
+    monkeypatch.setattr(Config, "SUBSCRIBERS_FILE", "")
+    metrics.reset()
+
+    with pytest.raises(SystemExit) as exit_info:
+        asyncio.run(app.main(dry_run_dir=str(tmp_path / "out"), replay_dir=str(tmp_path / "empty")))
+
+    assert exit_info.value.code == 1
+    assert metrics.counters["replay.missing"] >= 1
+    metrics.reset()
+
+
+def search_request(since, language="python"):
+    url = httpx.URL("https://api.github.com/search/repositories", params={
+        "q": f"created:>={since} language:{language}", "sort": "stars", "page": 1,
+    })
+    return httpx.Request("GET", url)
+
+
+def test_search_fixture_key_ignores_query_date():
+    assert fixture_key(search_request("2025-01-01")) == fixture_key(search_request("2025-03-15"))
+    assert fixture_key(search_request("2025-01-01")) != fixture_key(search_request("2025-01-01", "rust"))